@@ -4,8 +4,19 @@ Lightweight keyword-based approach - no ML dependencies required.
 Works on any Python 3.8+ environment, CPU-only.
 """
 
+from itertools import repeat
+from operator import contains
 from typing import List, Dict
 
+from lazy_imports import optional_module
+from score_cache import config_version, content_hash, get_score_cache
+from scoring_profile import get_profile, load_profile_config
+
+
+# Jobs scored per NumPy chunk; bounds the hit matrices and temporary
+# texts when re-scoring a large history
+BATCH_CHUNK_SIZE = 2048
+
 
 class AIJobMatcher:
     """
@@ -13,25 +24,32 @@ class AIJobMatcher:
     Fallback implementation that works without sentence-transformers.
     """
     
-    def __init__(self):
-        """Initialize with user skill profile"""
+    def __init__(self, settings: Dict = None):
+        """
+        Initialize with user skill profile
+        
+        Args:
+            settings: The "ai_matcher" section of a scoring profile
+                      (default: profile.json)
+        """
         print("AI matcher initializing...")
         
-        # User profile as weighted keywords
-        self.high_priority_skills = [
-            "data analyst", "data analysis", "business analyst",
-            "analytics", "sql", "python", "excel", "power bi", "tableau"
-        ]
+        if settings is None:
+            settings = load_profile_config(None)["ai_matcher"]
         
-        self.medium_priority_skills = [
-            "intern", "internship", "entry level", "junior", "fresher",
-            "data visualization", "reporting", "dashboard", "bi"
-        ]
+        # User profile as weighted keywords
+        self.high_priority_skills = list(settings["high_priority_skills"])
+        self.medium_priority_skills = list(settings["medium_priority_skills"])
+        self.positive_keywords = list(settings["positive_keywords"])
+        self.entry_title_keywords = list(settings["entry_title_keywords"])
         
-        self.positive_keywords = [
-            "remote", "work from home", "paid", "stipend", "training",
-            "statistics", "data science", "machine learning", "pandas"
-        ]
+        # Points per keyword hit and the cap for each group, plus the title bonus
+        weights = settings["weights"]
+        self.title_high_points, self.title_high_cap = weights["title_high"]
+        self.text_high_points, self.text_high_cap = weights["text_high"]
+        self.medium_points, self.medium_cap = weights["medium"]
+        self.positive_points, self.positive_cap = weights["positive"]
+        self.entry_title_bonus = weights["entry_title_bonus"]
         
         print("   AI matcher ready")
     
@@ -60,52 +78,132 @@ class AIJobMatcher:
         
         # ENHANCED SCORING SYSTEM
         
-        # High priority skills in title (0.20 each, max 0.80)
+        # High priority skills in title
         title_high_matches = sum(1 for skill in self.high_priority_skills if skill in title)
-        score += min(title_high_matches * 0.20, 0.80)
+        score += min(title_high_matches * self.title_high_points, self.title_high_cap)
         
-        # High priority in full text (0.10 each, max 0.40)
+        # High priority in full text
         text_high_matches = sum(1 for skill in self.high_priority_skills if skill in full_text)
-        score += min(text_high_matches * 0.10, 0.40)
+        score += min(text_high_matches * self.text_high_points, self.text_high_cap)
         
-        # Medium priority matches (0.08 each, max 0.30)
+        # Medium priority matches
         medium_matches = sum(1 for skill in self.medium_priority_skills if skill in full_text)
-        score += min(medium_matches * 0.08, 0.30)
+        score += min(medium_matches * self.medium_points, self.medium_cap)
         
-        # Positive keywords (0.05 each, max 0.15)
+        # Positive keywords
         positive_matches = sum(1 for kw in self.positive_keywords if kw in full_text)
-        score += min(positive_matches * 0.05, 0.15)
+        score += min(positive_matches * self.positive_points, self.positive_cap)
         
         # BONUS: If it's explicitly an internship/entry-level role
-        if any(kw in title for kw in ["intern", "internship", "entry level", "junior"]):
-            score += 0.10
+        if any(kw in title for kw in self.entry_title_keywords):
+            score += self.entry_title_bonus
         
         # Normalize to [0.0, 1.0]
         return round(min(score, 1.0), 4)
     
-    def batch_score(self, jobs: List[Dict]) -> List[Dict]:
+    @staticmethod
+    def _hit_matrix(texts: List[str], keywords: List[str]):
+        """jobs x keywords boolean matrix of `keyword in text`"""
+        np = optional_module("numpy")
+        n = len(texts)
+        matrix = np.empty((n, len(keywords)), dtype=bool)
+        for k, keyword in enumerate(keywords):
+            # map() keeps the per-job loop in C
+            matrix[:, k] = np.fromiter(map(contains, texts, repeat(keyword, n)), dtype=bool, count=n)
+        return matrix
+    
+    def _score_hits(self, titles: List[str], full_hits, full_column: Dict[str, int],
+                    title_hits, title_column: Dict[str, int]) -> List[float]:
+        """
+        Columnar score_job from hit matrices over a shared vocabulary.
+        
+        Applies the same caps, weights and addition order as score_job,
+        so every score is identical.
+        
+        Args:
+            titles: Lowercased titles of the chunk
+            full_hits / full_column: Hits in the full text, keyword -> column
+            title_hits / title_column: Hits in the title, keyword -> column
+        """
+        np = optional_module("numpy")
+        
+        def hits(matrix, column, keywords):
+            return matrix[:, [column[kw] for kw in keywords]]
+        
+        title_high = hits(title_hits, title_column, self.high_priority_skills).sum(axis=1)
+        text_high = hits(full_hits, full_column, self.high_priority_skills).sum(axis=1)
+        medium = hits(full_hits, full_column, self.medium_priority_skills).sum(axis=1)
+        positive = hits(full_hits, full_column, self.positive_keywords).sum(axis=1)
+        entry_bonus = hits(title_hits, title_column, self.entry_title_keywords).any(axis=1)
+        
+        score = np.minimum(title_high * self.title_high_points, self.title_high_cap)
+        score = score + np.minimum(text_high * self.text_high_points, self.text_high_cap)
+        score = score + np.minimum(medium * self.medium_points, self.medium_cap)
+        score = score + np.minimum(positive * self.positive_points, self.positive_cap)
+        score = np.where(entry_bonus, score + self.entry_title_bonus, score)
+        score = np.minimum(score, 1.0)
+        
+        # Python's round() keeps results bit-identical to score_job
+        return [
+            round(value, 4) if title.strip() else 0.0
+            for value, title in zip(score.tolist(), titles)
+        ]
+    
+    def config_version(self) -> str:
+        """Hash of the keyword lists and weights, for the score cache"""
+        return config_version(
+            self.high_priority_skills, self.medium_priority_skills,
+            self.positive_keywords, self.entry_title_keywords,
+            self.title_high_points, self.title_high_cap,
+            self.text_high_points, self.text_high_cap,
+            self.medium_points, self.medium_cap,
+            self.positive_points, self.positive_cap, self.entry_title_bonus
+        )
+    
+    def score_many(self, jobs) -> List[float]:
+        """
+        Score a whole batch in columnar form.
+        
+        Args:
+            jobs: List of job dicts, or a DataFrame with 'title' and
+                  optionally 'description' / 'location' columns
+                  (e.g. the full jobs_dataset.csv history)
+        
+        Returns:
+            List of scores in input order, equal to score_job per job.
+            Scores cached by earlier runs under the same config are reused.
+        """
+        return [row[0] for row in score_matrix(jobs, [self])]
+    
+    def batch_score(self, jobs):
         """
         Score multiple jobs efficiently.
         
         Args:
-            jobs: List of job dicts
+            jobs: List of job dicts, or a DataFrame
         
         Returns:
             Same list with 'ai_score' added to each job
+            (a DataFrame gets an 'ai_score' column)
         """
-        if not jobs:
+        if len(jobs) == 0:
             return jobs
         
         print(f"AI scoring {len(jobs)} jobs...")
         
+        scores = self.score_many(jobs)
+        
+        if hasattr(jobs, "columns"):
+            jobs["ai_score"] = scores
+        else:
+            for job, score in zip(jobs, scores):
+                job["ai_score"] = score
+        
         scored_count = 0
         high_score_count = 0
         total_score = 0.0
         
-        for job in jobs:
-            score = self.score_job(job)
-            job["ai_score"] = score
-            
+        for score in scores:
             if score > 0:
                 scored_count += 1
                 total_score += score
@@ -123,17 +221,152 @@ class AIJobMatcher:
 
 
 # ============================================
-# SINGLETON INSTANCE
+# MULTI-PROFILE SCORING
 # ============================================
-_matcher_instance = None
 
+def _score_chunk(matchers: List[AIJobMatcher], titles: List[str],
+                 descriptions: List[str], locations: List[str]) -> List[List[float]]:
+    """
+    Score one chunk of lowercased fields for several matchers.
+    
+    Every keyword of every matcher is searched once; each matcher then
+    reads its own columns of the shared hit matrices.
+    
+    Returns:
+        One list of scores per matcher
+    """
+    full_vocab = list(dict.fromkeys(
+        kw for m in matchers
+        for kw in m.high_priority_skills + m.medium_priority_skills + m.positive_keywords
+    ))
+    title_vocab = list(dict.fromkeys(
+        kw for m in matchers for kw in m.high_priority_skills + m.entry_title_keywords
+    ))
+    span = max(max(map(len, full_vocab), default=0) - 1, 1)
+    
+    # score_job searches "t t t t d l". A keyword is found there iff it is
+    # in "t d l" or straddles a title/title seam, so scan the title once
+    # plus a short seam instead of four full copies.
+    rest = [f"{t} {d} {l}" for t, d, l in zip(titles, descriptions, locations)]
+    seams = [
+        f"{t[-span:]} {t[:span]}" if len(t) >= span else f"{t} {t} {t} {t}"
+        for t in titles
+    ]
+    full_hits = AIJobMatcher._hit_matrix(rest, full_vocab) | AIJobMatcher._hit_matrix(seams, full_vocab)
+    title_hits = AIJobMatcher._hit_matrix(titles, title_vocab)
+    
+    full_column = {kw: k for k, kw in enumerate(full_vocab)}
+    title_column = {kw: k for k, kw in enumerate(title_vocab)}
+    return [
+        m._score_hits(titles, full_hits, full_column, title_hits, title_column)
+        for m in matchers
+    ]
+
+
+def _score_rows(matchers: List[AIJobMatcher], rows: List[tuple]) -> List[List[float]]:
+    """Score (title, description, location) rows per matcher, in NumPy chunks when available"""
+    # NumPy is imported on first use; without it each job goes through score_job
+    if optional_module("numpy") is None:
+        return [
+            [m.score_job({"title": t, "description": d, "location": l}) for t, d, l in rows]
+            for m in matchers
+        ]
+    
+    titles = [title.lower() for title, _, _ in rows]
+    descriptions = [description.lower() for _, description, _ in rows]
+    locations = [location.lower() for _, _, location in rows]
+    
+    columns = [[] for _ in matchers]
+    for start in range(0, len(rows), BATCH_CHUNK_SIZE):
+        end = start + BATCH_CHUNK_SIZE
+        chunk = _score_chunk(matchers, titles[start:end], descriptions[start:end], locations[start:end])
+        for column, scores in zip(columns, chunk):
+            column.extend(scores)
+    return columns
+
+
+def score_matrix(jobs, matchers: List[AIJobMatcher]) -> List[List[float]]:
+    """
+    Score a batch for several matchers (e.g. one per candidate profile)
+    from a single scan of each job's text.
+    
+    Args:
+        jobs: List of job dicts, or a DataFrame (see AIJobMatcher.score_many)
+        matchers: One AIJobMatcher per profile
+    
+    Returns:
+        jobs x matchers matrix: row i holds job i's score for each matcher,
+        equal to matcher.score_job(job). Cached scores are reused.
+    """
+    if hasattr(jobs, "columns"):
+        columns = {
+            field: (jobs[field].fillna("").astype(str).tolist()
+                    if field in jobs.columns else [""] * len(jobs))
+            for field in ("title", "description", "location")
+        }
+    else:
+        columns = {
+            field: [str(job.get(field) or "") for job in jobs]
+            for field in ("title", "description", "location")
+        }
+    
+    # Re-posts repeat across a history: score each distinct job once
+    slot_of = {}
+    slots = [
+        slot_of.setdefault(fields, len(slot_of))
+        for fields in zip(*columns.values())
+    ]
+    unique_jobs = list(slot_of)
+    unique_rows = [[None] * len(matchers) for _ in unique_jobs]
+    
+    # Reuse scores from earlier runs
+    cache = get_score_cache()
+    if cache is not None:
+        versions = [m.config_version() for m in matchers]
+        keys = [content_hash(*fields) for fields in unique_jobs]
+        for i, key in enumerate(keys):
+            for p, version in enumerate(versions):
+                unique_rows[i][p] = cache.get("ai", version, key)
+    
+    missing = [i for i, row in enumerate(unique_rows) if None in row]
+    if missing:
+        scored = _score_rows(matchers, [unique_jobs[i] for i in missing])
+        for p, column in enumerate(scored):
+            for i, score in zip(missing, column):
+                if unique_rows[i][p] is None:
+                    unique_rows[i][p] = score
+                    if cache is not None:
+                        cache.put("ai", versions[p], keys[i], score)
+    
+    return [list(unique_rows[slot]) for slot in slots]
+
+
+def add_ai_scores_for_profiles(jobs: List[Dict], profiles) -> List[Dict]:
+    """
+    Add each profile's AI score to every job.
+    
+    Args:
+        jobs: List of job dicts
+        profiles: ProfileSet (or list of CompiledProfiles)
+    
+    Returns:
+        Same list; job['profile_scores'][p]['ai_score'] is profile p's score
+    """
+    matrix = score_matrix(jobs, [profile.ai_matcher for profile in profiles])
+    for job, row in zip(jobs, matrix):
+        entries = job.setdefault('profile_scores', [{} for _ in profiles])
+        for entry, score in zip(entries, row):
+            entry['ai_score'] = score
+    return jobs
+
+
+# ============================================
+# ACTIVE PROFILE INSTANCE
+# ============================================
 
 def get_ai_matcher() -> AIJobMatcher:
     """
-    Get or create AI matcher singleton.
+    Get the AI matcher of the active scoring profile.
     Used by job_agent.py
     """
-    global _matcher_instance
-    if _matcher_instance is None:
-        _matcher_instance = AIJobMatcher()
-    return _matcher_instance
+    return get_profile().ai_matcher
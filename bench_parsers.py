@@ -0,0 +1,74 @@
+"""
+Parser Benchmark
+Time each source's lxml parser against the BeautifulSoup (html.parser)
+one on the saved pages in fixtures/pages, and check both extract the same jobs.
+
+Usage: python bench_parsers.py [repeats]
+"""
+
+import os
+import sys
+import time
+
+from page_parsers import LXML_AVAILABLE, parse_page
+
+FIXTURE_DIR = os.path.join("fixtures", "pages")
+
+# Source -> saved page
+FIXTURE_PAGES = {
+    "Indeed": "indeed.xml",
+    "Internshala": "internshala.html",
+    "LinkedIn": "linkedin.html",
+    "Naukri": "naukri.html",
+    "Instahyre": "instahyre.html",
+}
+
+
+def load_fixture(source):
+    """Page body as the fetcher hands it to the parser (bytes for RSS, else text)"""
+    with open(os.path.join(FIXTURE_DIR, FIXTURE_PAGES[source]), 'rb') as f:
+        body = f.read()
+    return body if source == "Indeed" else body.decode("utf-8")
+
+
+def best_time(source, markup, backend, repeats):
+    """Fastest of repeats parses, in milliseconds"""
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        parse_page(source, markup, backend=backend)
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def main():
+    repeats = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    
+    if not LXML_AVAILABLE:
+        print("❌ lxml is not installed, nothing to compare")
+        return
+    
+    print("="*70)
+    print(f"PARSER BENCHMARK (best of {repeats})")
+    print("="*70)
+    print(f"\n{'Source':<12} {'KB':>6} {'Jobs':>5} {'soup ms':>9} {'lxml ms':>9} {'Speedup':>8}  Same jobs")
+    
+    total_soup = total_lxml = 0.0
+    for source in FIXTURE_PAGES:
+        markup = load_fixture(source)
+        soup_jobs = parse_page(source, markup, backend="soup")
+        lxml_jobs = parse_page(source, markup, backend="lxml")
+        
+        soup_ms = best_time(source, markup, "soup", repeats)
+        lxml_ms = best_time(source, markup, "lxml", repeats)
+        total_soup += soup_ms
+        total_lxml += lxml_ms
+        
+        print(f"{source:<12} {len(markup) / 1024:>6.0f} {len(lxml_jobs):>5} {soup_ms:>9.2f} {lxml_ms:>9.2f} "
+              f"{soup_ms / lxml_ms:>7.1f}x  {'✅' if soup_jobs == lxml_jobs else '❌'}")
+    
+    print(f"\n{'All pages':<12} {'':>6} {'':>5} {total_soup:>9.2f} {total_lxml:>9.2f} {total_soup / total_lxml:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
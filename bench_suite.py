@@ -0,0 +1,267 @@
+"""
+Benchmark Suite
+Offline benchmarks on the fixture corpus (fixtures/pages), replayed
+through the real fetchers by fixture_server.py:
+- fetch + parse latency per source (one listing page)
+- jobs/sec through filter_jobs and dedupe_jobs
+- jobs/sec through AIJobMatcher.batch_score, add_hybrid_scores_to_jobs
+  and add_company_scores_to_jobs
+Each metric is compared with the stored baseline, scaled by a calibration
+loop timed alongside it; one that is more than BENCH_TOLERANCE worse is
+reported as a regression (exit status 1).
+
+Usage:
+    python bench_suite.py                  # run and compare with the baseline
+    python bench_suite.py --save-baseline  # record this machine's numbers
+"""
+
+import os
+
+# Measure the work itself: no page or score caches, full listings
+os.environ.setdefault("PAGE_CACHE", "0")
+os.environ.setdefault("SCORE_CACHE", "0")
+os.environ.setdefault("INCREMENTAL", "0")
+
+import contextlib
+import copy
+import io
+import json
+import platform
+import sys
+import time
+from datetime import datetime
+
+import job_agent
+from ai_matcher import get_ai_matcher
+from company_ranker import add_company_scores_to_jobs
+from fixture_server import FixtureServer
+from hybrid_scorer import add_hybrid_scores_to_jobs
+from near_dedup import NearDuplicateIndex
+
+
+# ============================================
+# CONFIGURATION
+# ============================================
+
+BASELINE_FILE = os.path.join("fixtures", "bench_baseline.json")
+
+# A metric this much worse than the baseline (0.25 = 25%) is a regression
+BENCH_TOLERANCE = float(os.getenv("BENCH_TOLERANCE", "0.25"))
+
+# Timed passes (best one counts): fetches per source, calls per stage
+FETCH_REPEATS = 15
+STAGE_ROUNDS = 30
+
+
+# ============================================
+# MEASUREMENT
+# ============================================
+
+def _quiet(fn, *args):
+    """Call fn with its progress prints swallowed"""
+    with contextlib.redirect_stdout(io.StringIO()):
+        return fn(*args)
+
+
+def _calibration_ms():
+    """Milliseconds for a fixed pure-Python workload: the machine's current speed"""
+    start = time.perf_counter()
+    counts = {}
+    for word in sorted(CALIBRATION_WORDS, key=str.lower):
+        counts[word[:6]] = counts.get(word[:6], 0) + len(word.split("-"))
+    return (time.perf_counter() - start) * 1000
+
+
+CALIBRATION_WORDS = [f"job-{i % 97}-{i}" for i in range(5000)]
+
+
+def _best_of(rounds, make_input, fn):
+    """
+    Fastest of rounds calls of fn, each on fresh input (the fastest call
+    is the least disturbed by noise). A calibration loop runs before each
+    call, so the result carries the machine's speed while it was measured.
+    
+    Args:
+        rounds: Timed calls
+        make_input: Builds fn's argument tuple (not timed)
+        fn: Code to time
+    
+    Returns:
+        (fastest call in seconds, fastest calibration loop in ms)
+    """
+    best = calibration = float("inf")
+    for _ in range(rounds):
+        args = make_input()
+        calibration = min(calibration, _calibration_ms())
+        start = time.perf_counter()
+        _quiet(fn, *args)
+        best = min(best, time.perf_counter() - start)
+    return best, calibration
+
+
+def collect_corpus():
+    """
+    Fetch+parse latency per source and the jobs of one query's pages.
+    
+    Returns:
+        ({metric: (value, calibration ms)}, list of job dicts)
+    """
+    results = {}
+    corpus = []
+    
+    for name, fetch, queries, max_pages in job_agent.JOB_SOURCES:
+        seconds, calibration = _best_of(FETCH_REPEATS, lambda: (queries[0], 0), fetch)
+        results[f"fetch_parse_ms.{name}"] = (seconds * 1000, calibration)
+        
+        for _, jobs in _quiet(list, job_agent._paginate(fetch, queries[0], max_pages)):
+            corpus += jobs
+    
+    return results, corpus
+
+
+def stage_metrics(corpus):
+    """
+    Throughput of the filter, dedupe and scoring stages on the corpus.
+    
+    Returns:
+        {metric: (jobs per second, calibration ms)}
+    """
+    def rate(fn, make_input, n_jobs):
+        seconds, calibration = _best_of(STAGE_ROUNDS, make_input, fn)
+        return n_jobs / seconds, calibration
+    
+    results = {}
+    
+    results["filter_jobs.jobs_per_sec"] = rate(
+        job_agent.filter_jobs,
+        lambda: (copy.deepcopy(corpus), job_agent._empty_history()),
+        len(corpus)
+    )
+    
+    filtered = _quiet(job_agent.filter_jobs, copy.deepcopy(corpus), job_agent._empty_history())
+    results["dedupe_jobs.jobs_per_sec"] = rate(
+        job_agent.dedupe_jobs,
+        lambda: (copy.deepcopy(filtered), NearDuplicateIndex()),
+        len(filtered)
+    )
+    
+    matcher = get_ai_matcher()
+    results["ai_batch_score.jobs_per_sec"] = rate(
+        matcher.batch_score, lambda: (copy.deepcopy(corpus),), len(corpus)
+    )
+    
+    scored = _quiet(matcher.batch_score, copy.deepcopy(corpus))
+    results["hybrid_scores.jobs_per_sec"] = rate(
+        add_hybrid_scores_to_jobs, lambda: (copy.deepcopy(scored),), len(corpus)
+    )
+    
+    scored = _quiet(add_hybrid_scores_to_jobs, scored)
+    results["company_scores.jobs_per_sec"] = rate(
+        add_company_scores_to_jobs, lambda: (copy.deepcopy(scored),), len(corpus)
+    )
+    
+    return results
+
+
+# ============================================
+# BASELINE
+# ============================================
+
+def _lower_is_better(metric):
+    return metric.endswith("_ms") or "_ms." in metric
+
+
+def load_baseline(path=BASELINE_FILE):
+    """Stored {metric: (value, calibration ms)}, or {} if none were recorded"""
+    if not os.path.exists(path):
+        return {}
+    with open(path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    calibration = data.get("calibration_ms", {})
+    return {name: (value, calibration.get(name)) for name, value in data.get("metrics", {}).items()}
+
+
+def save_baseline(results, path=BASELINE_FILE):
+    """Record results as the new baseline"""
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump({
+            "recorded": datetime.now().strftime("%Y-%m-%d"),
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "metrics": {name: round(value, 3) for name, (value, _) in sorted(results.items())},
+            "calibration_ms": {name: round(cal, 4) for name, (_, cal) in sorted(results.items())}
+        }, f, indent=2)
+        f.write("\n")
+    print(f"\n💾 Baseline saved to {path}")
+
+
+def compare(results, baseline, tolerance=BENCH_TOLERANCE):
+    """
+    Print each metric against the baseline. The baseline value is first
+    scaled by how much slower the calibration loop ran alongside the
+    metric, so a busier or slower machine does not read as a regression.
+    
+    Returns:
+        Names of metrics worse than the baseline by more than tolerance
+    """
+    regressions = []
+    print(f"\n{'Metric':<34} {'Baseline':>10} {'Now':>10} {'Speed':>6} {'Change':>8}")
+    
+    for name, (value, calibration) in results.items():
+        base, base_calibration = baseline.get(name, (None, None))
+        if not base:
+            print(f"{name:<34} {'-':>10} {value:>10.2f}")
+            continue
+        
+        slowdown = calibration / base_calibration if base_calibration else 1.0
+        
+        # Positive change = better, whichever direction the metric runs
+        if _lower_is_better(name):
+            expected = base * slowdown
+            change = (expected - value) / expected
+        else:
+            expected = base / slowdown
+            change = (value - expected) / expected
+        
+        regressed = change < -tolerance
+        if regressed:
+            regressions.append(name)
+        print(f"{name:<34} {base:>10.2f} {value:>10.2f} {1 / slowdown:>5.2f}x {change:>+7.0%} {'❌' if regressed else '✅'}")
+    
+    return regressions
+
+
+# ============================================
+# MAIN
+# ============================================
+
+def main():
+    print("="*70)
+    print("BENCHMARK SUITE (fixture replay)")
+    print("="*70)
+    
+    with FixtureServer():
+        results, corpus = collect_corpus()
+    print(f"\n📦 Corpus: {len(corpus)} jobs from {len(job_agent.JOB_SOURCES)} sources")
+    
+    results.update(stage_metrics(corpus))
+    
+    if "--save-baseline" in sys.argv:
+        compare(results, {})
+        save_baseline(results)
+        return 0
+    
+    baseline = load_baseline()
+    if not baseline:
+        print("\n⚠️ No baseline yet, run with --save-baseline to record one")
+    regressions = compare(results, baseline)
+    
+    if regressions:
+        print(f"\n❌ {len(regressions)} regression(s) beyond {BENCH_TOLERANCE:.0%}: {', '.join(regressions)}")
+        return 1
+    print(f"\n✅ No regressions beyond {BENCH_TOLERANCE:.0%}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,143 @@
+"""
+Import Time Check
+Measures `import job_agent` with `python -X importtime` and fails if
+startup gets slow again:
+- the cumulative import time (best of IMPORT_RUNS) is over IMPORT_BUDGET_MS
+- a deferred module (DEFERRED_MODULES) is imported at startup instead of
+  where it is first used (see lazy_imports.py)
+
+Bytecode is compiled first, so the numbers are those of a warm run.
+
+Usage:
+    python check_import_time.py
+    IMPORT_BUDGET_MS=100 python check_import_time.py
+"""
+
+import compileall
+import os
+import subprocess
+import sys
+from typing import Dict, List, Tuple
+
+
+# ============================================
+# CONFIGURATION
+# ============================================
+
+# Generous on purpose: the check is for regressions, not for noise
+IMPORT_BUDGET_MS = float(os.getenv("IMPORT_BUDGET_MS", "150"))
+
+IMPORT_RUNS = 3
+
+# Loaded on first use, never by `import job_agent`
+DEFERRED_MODULES = (
+    "numpy",
+    "bs4",
+    "requests",
+    "ai_matcher",
+    "hybrid_scorer",
+    "company_ranker",
+    "scoring_profile",
+)
+
+TOP_MODULES = 10
+
+
+# ============================================
+# MEASUREMENT
+# ============================================
+
+def parse_importtime(output: str, module: str = "job_agent") -> Dict[str, Tuple[int, int]]:
+    """
+    Parse `-X importtime` output, keeping module and what it imported
+    (interpreter startup such as site is left out).
+    
+    Args:
+        output: stderr of the interpreter
+        module: Top-level import that was measured
+    
+    Returns:
+        {module: (self µs, cumulative µs)}
+    """
+    modules = {}
+    for line in output.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        parts = line[len("import time:"):].split("|")
+        if len(parts) != 3 or not parts[0].strip().isdigit():
+            continue  # header line
+        name = parts[2].rstrip()
+        top_level = not name.startswith("  ")
+        name = name.strip()
+        modules[name] = (int(parts[0]), int(parts[1]))
+        if top_level:
+            if name == module:
+                return modules
+            modules = {}  # an earlier top-level import and its children
+    return modules
+
+
+def measure(module: str = "job_agent") -> Dict[str, Tuple[int, int]]:
+    """One `python -X importtime -c "import <module>"` in a fresh interpreter"""
+    env = dict(os.environ, PYTHONDONTWRITEBYTECODE="1")
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True, text=True, env=env,
+        cwd=os.path.dirname(os.path.abspath(__file__))
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"import {module} failed:\n{result.stderr[-2000:]}")
+    return parse_importtime(result.stderr, module)
+
+
+def check(modules: Dict[str, Tuple[int, int]], budget_ms: float = IMPORT_BUDGET_MS,
+          module: str = "job_agent") -> List[str]:
+    """
+    Problems with one measurement.
+    
+    Returns:
+        Descriptions of what is over budget or imported too early (empty = ok)
+    """
+    problems = []
+    total_ms = modules.get(module, (0, 0))[1] / 1000
+    if total_ms > budget_ms:
+        problems.append(f"import {module} took {total_ms:.0f} ms (budget {budget_ms:.0f} ms)")
+    
+    early = [name for name in DEFERRED_MODULES if name in modules]
+    if early:
+        problems.append(f"imported at startup: {', '.join(early)}")
+    return problems
+
+
+# ============================================
+# MAIN
+# ============================================
+
+def main():
+    print("="*70)
+    print("IMPORT TIME CHECK")
+    print("="*70)
+    
+    here = os.path.dirname(os.path.abspath(__file__))
+    compileall.compile_dir(here, maxlevels=0, quiet=1)
+    
+    runs = [measure() for _ in range(IMPORT_RUNS)]
+    best = min(runs, key=lambda modules: modules.get("job_agent", (0, 0))[1])
+    total_ms = best.get("job_agent", (0, 0))[1] / 1000
+    
+    print(f"\n⏱️ import job_agent: {total_ms:.1f} ms (best of {IMPORT_RUNS}, budget {IMPORT_BUDGET_MS:.0f} ms)")
+    print(f"\n{'Module':<40} {'Self ms':>8} {'Cumul. ms':>10}")
+    for name, (own, cumulative) in sorted(best.items(), key=lambda item: item[1][1], reverse=True)[:TOP_MODULES]:
+        print(f"{name:<40} {own / 1000:>8.1f} {cumulative / 1000:>10.1f}")
+    
+    problems = check(best)
+    if problems:
+        for problem in problems:
+            print(f"\n❌ {problem}")
+        return 1
+    print(f"\n✅ Startup within budget, heavy modules deferred")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -5,7 +5,12 @@ Prioritizes Top 40 India + Global MNCs, suppresses unknown startups.
 """
 
 import re
-from typing import Dict, Tuple
+from collections import Counter
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from score_cache import get_score_cache
+from scoring_profile import CompiledProfile, get_profile
 
 
 # ============================================
@@ -137,14 +142,77 @@ TIER_2_COMPANIES = {
 }
 
 
+# ============================================
+# ALIASES: OTHER NAMES FOR LISTED COMPANIES
+# ============================================
+
+COMPANY_ALIASES = {
+    "ernst & young": "ey", "ernst and young": "ey",
+    "pricewaterhousecoopers": "pwc", "price waterhouse": "pwc",
+    "tata consultancy services": "tcs",
+    "international business machines": "ibm",
+    "j p morgan": "jp morgan", "jpmorgan chase": "jpmorgan",
+    "aws": "amazon", "amazon web services": "amazon",
+    "larsen and toubro": "larsen & toubro",
+    "boston consulting group": "bcg",
+    "mahindra and mahindra": "mahindra & mahindra",
+    "dr reddys": "dr reddy", "dr reddy s": "dr reddy",
+    "unilever": "hindustan unilever",
+}
+
+# Fuzzy fallback for names the whole-word index misses: edits allowed
+# per FUZZY_CHARS_PER_EDIT characters (none below that), at most FUZZY_MAX_EDITS
+FUZZY_CHARS_PER_EDIT = 7
+FUZZY_MAX_EDITS = 2
+FUZZY_MAX_SPAN = 4   # longest run of name tokens tried on its own
+FUZZY_SETTINGS = (FUZZY_CHARS_PER_EDIT, FUZZY_MAX_EDITS, FUZZY_MAX_SPAN)
+
+# A name may open a longer listed name only from this many tokens on: one
+# shared first word says too little ("tiger global" is not "tiger analytics")
+PREFIX_MIN_TOKENS = 2
+
+# Everything that decides a match; part of the company score cache version
+MATCH_SETTINGS = (PREFIX_MIN_TOKENS, *FUZZY_SETTINGS)
+
+# Tier scores, ranking weights and the alert cut-off live in the scoring
+# profile (profile.json); the lists above are its default tier lists.
+
+
 # ============================================
 # COMPANY NAME NORMALIZATION
 # ============================================
 
+# Legal and generic suffixes, stripped in one pass (longer forms first)
+COMPANY_SUFFIXES = [
+    r'private limited', r'pvt\.?\s*ltd\.?', r'pvt',
+    r'limited', r'ltd\.?', r'llp', r'llc',
+    r'inc\.?', r'corp\.?', r'corporation',
+    r'technologies', r'tech', r'solutions',
+    r'services', r'software', r'systems',
+    r'enterprises', r'group', r'india',
+    r'global', r'international', r'worldwide'
+]
+
+SUFFIX_PATTERN = re.compile(r'\b(?:' + '|'.join(COMPANY_SUFFIXES) + r')\b')
+SPECIAL_CHARS_PATTERN = re.compile(r'[^a-z0-9\s&]')
+WHITESPACE_PATTERN = re.compile(r'\s+')
+
+# Distinct company names kept normalized in memory
+NORMALIZE_CACHE_SIZE = 4096
+
+
+@lru_cache(maxsize=NORMALIZE_CACHE_SIZE)
+def _normalize_company_name(company_name: str) -> str:
+    name = SUFFIX_PATTERN.sub('', company_name.lower().strip())
+    name = SPECIAL_CHARS_PATTERN.sub(' ', name)
+    return WHITESPACE_PATTERN.sub(' ', name).strip()
+
+
 def normalize_company_name(company_name: str) -> str:
     """
     Normalize company name for matching.
     Removes legal suffixes, extra whitespace, special chars.
+    Results are memoized, since the same names recur across jobs and runs.
     
     Args:
         company_name: Raw company name from job posting
@@ -155,90 +223,376 @@ def normalize_company_name(company_name: str) -> str:
     if not company_name or not isinstance(company_name, str):
         return ""
     
-    # Convert to lowercase
-    name = company_name.lower().strip()
+    return _normalize_company_name(company_name)
+
+
+def normalize_company_names(company_names):
+    """
+    Normalize many company names at once, each distinct name only once.
     
-    # Remove common legal suffixes
-    suffixes = [
-        r'\bprivate limited\b', r'\bpvt\.?\s*ltd\.?\b', r'\bpvt\b',
-        r'\blimited\b', r'\bltd\.?\b', r'\bllp\b', r'\bllc\b',
-        r'\binc\.?\b', r'\bcorp\.?\b', r'\bcorporation\b',
-        r'\btechnologies\b', r'\btech\b', r'\bsolutions\b',
-        r'\bservices\b', r'\bsoftware\b', r'\bsystems\b',
-        r'\benterprises\b', r'\bgroup\b', r'\bindia\b',
-        r'\bglobal\b', r'\binternational\b', r'\bworldwide\b'
-    ]
+    Args:
+        company_names: List of names, or a pandas Series
     
-    for suffix in suffixes:
-        name = re.sub(suffix, '', name)
+    Returns:
+        List of normalized names (a Series for Series input)
+    """
+    if hasattr(company_names, "map") and hasattr(company_names, "unique"):
+        lookup = {name: normalize_company_name(name) for name in company_names.unique()}
+        return company_names.map(lookup)
     
-    # Remove special characters except alphanumeric and spaces
-    name = re.sub(r'[^a-z0-9\s&]', ' ', name)
+    company_names = list(company_names)
+    lookup = {name: normalize_company_name(name) for name in set(company_names)}
+    return [lookup[name] for name in company_names]
+
+
+# ============================================
+# COMPANY TIER MATCHING
+# ============================================
+
+class CompanyIndex:
+    """
+    Word-level index of tier companies, built once at import.
+    
+    Tier names and aliases are normalized like job company names and
+    stored in an exact-match dict plus a token trie. A lookup walks the
+    trie from every token of the name, so a listed company matches only
+    as whole words ("ey" no longer matches inside "money").
+    
+    Match priority is deterministic: exact name, then the longest listed
+    name inside the company name (ties: better tier, then leftmost), then
+    a listed name that starts with the whole company name, when that name
+    has at least PREFIX_MIN_TOKENS tokens ("wow skin" -> "wow skin
+    science", but not "tiger" -> "tiger analytics").
+    """
     
-    # Normalize multiple spaces to single space
-    name = re.sub(r'\s+', ' ', name).strip()
+    _END = None   # trie key holding (canonical, tier) at the end of a name
     
-    return name
+    def __init__(self, tiers: Dict[int, Iterable[str]], aliases: Dict[str, str]):
+        """
+        Args:
+            tiers: Tier number -> company names (lower tier number wins)
+            aliases: Other name -> a company name listed in tiers
+        """
+        self.exact = {}
+        self.trie = {}
+        
+        for tier in sorted(tiers):
+            for name in sorted(tiers[tier]):
+                self._insert(normalize_company_name(name), name, tier)
+        
+        for alias, canonical in sorted(aliases.items()):
+            target = self.exact.get(normalize_company_name(canonical))
+            if target:
+                self._insert(normalize_company_name(alias), *target)
+    
+    def _insert(self, key: str, canonical: str, tier: int) -> None:
+        if not key:
+            return
+        current = self.exact.get(key)
+        if current and current[1] <= tier:
+            return
+        
+        self.exact[key] = (canonical, tier)
+        node = self.trie
+        for token in key.split():
+            node = node.setdefault(token, {})
+        node[self._END] = (canonical, tier)
+    
+    def to_data(self) -> dict:
+        """Plain JSON-serializable form of the index (the trie is rebuilt from it)"""
+        return {"exact": {key: list(entry) for key, entry in self.exact.items()}}
+    
+    @classmethod
+    def from_data(cls, data: dict) -> "CompanyIndex":
+        """Rebuild an index from to_data() output"""
+        index = cls({}, {})
+        for key, (canonical, tier) in data["exact"].items():
+            index._insert(key, canonical, tier)
+        return index
+    
+    def _best_below(self, node: dict) -> Optional[Tuple[str, int]]:
+        """Best-tier, shortest listed name in a trie subtree"""
+        entries = []
+        stack = [node]
+        while stack:
+            current = stack.pop()
+            for token, child in current.items():
+                if token is self._END:
+                    entries.append(child)
+                else:
+                    stack.append(child)
+        return min(entries, key=lambda e: (e[1], len(e[0]), e[0])) if entries else None
+    
+    def lookup(self, normalized: str) -> Optional[Tuple[str, int]]:
+        """
+        Listed company for a normalized company name.
+        
+        Args:
+            normalized: Output of normalize_company_name()
+        
+        Returns:
+            (canonical company name, tier), or None if not listed
+        """
+        if not normalized:
+            return None
+        
+        hit = self.exact.get(normalized)
+        if hit:
+            return hit
+        
+        tokens = normalized.split()
+        best, best_rank = None, None
+        
+        for start in range(len(tokens)):
+            node = self.trie
+            for end in range(start, len(tokens)):
+                node = node.get(tokens[end])
+                if node is None:
+                    break
+                entry = node.get(self._END)
+                if entry:
+                    rank = (end - start, -entry[1], -start)
+                    if best_rank is None or rank > best_rank:
+                        best, best_rank = entry, rank
+        
+        if best:
+            return best
+        
+        # The whole name opens a longer listed name
+        if len(tokens) < PREFIX_MIN_TOKENS:
+            return None
+        node = self.trie
+        for token in tokens:
+            node = node.get(token)
+            if node is None:
+                return None
+        return self._best_below(node)
 
 
 # ============================================
-# COMPANY TIER MATCHING
+# FUZZY COMPANY MATCHING
+# ============================================
+
+def _trigrams(text: str) -> List[str]:
+    """Distinct padded character trigrams"""
+    padded = f"^{text}$"
+    return sorted({padded[i:i + 3] for i in range(len(padded) - 2)})
+
+
+def _bounded_edit_distance(a: str, b: str, limit: int) -> Optional[int]:
+    """Levenshtein distance, or None once it must exceed limit"""
+    if abs(len(a) - len(b)) > limit:
+        return None
+    
+    previous = list(range(len(b) + 1))
+    for i, char_a in enumerate(a, 1):
+        current = [i]
+        for j, char_b in enumerate(b, 1):
+            current.append(min(
+                previous[j] + 1,
+                current[j - 1] + 1,
+                previous[j - 1] + (char_a != char_b)
+            ))
+        if min(current) > limit:
+            return None
+        previous = current
+    
+    return previous[-1] if previous[-1] <= limit else None
+
+
+class FuzzyCompanyIndex:
+    """
+    Trigram inverted index over listed company names, spaces removed.
+    
+    A lookup collects names sharing trigrams with the query, keeps those
+    sharing enough to be within the edit budget (each edit destroys at
+    most three trigrams), and verifies them with a bounded Levenshtein
+    distance. Only that small candidate set is ever compared, so lookups
+    stay fast as the lists grow.
+    """
+    
+    def __init__(self, entries: Dict[str, Tuple[str, int]]):
+        """
+        Args:
+            entries: Normalized listed name -> (canonical name, tier)
+        """
+        self.keys = sorted({key.replace(" ", "") for key in entries})
+        self.targets = {}
+        for key, (canonical, tier) in sorted(entries.items(), key=lambda kv: kv[1][1]):
+            self.targets.setdefault(key.replace(" ", ""), (canonical, tier))
+        
+        self.postings = {}
+        for i, key in enumerate(self.keys):
+            for gram in _trigrams(key):
+                self.postings.setdefault(gram, []).append(i)
+    
+    def to_data(self) -> dict:
+        """Plain JSON-serializable form of the index (see from_data)"""
+        return {
+            "keys": self.keys,
+            "targets": {key: list(target) for key, target in self.targets.items()},
+            "postings": self.postings
+        }
+    
+    @classmethod
+    def from_data(cls, data: dict) -> "FuzzyCompanyIndex":
+        """Rebuild an index from to_data() output, without re-indexing trigrams"""
+        index = cls({})
+        index.keys = list(data["keys"])
+        index.targets = {key: tuple(target) for key, target in data["targets"].items()}
+        index.postings = {gram: list(items) for gram, items in data["postings"].items()}
+        return index
+    
+    def _match_compact(self, compact: str) -> Optional[Tuple[int, str]]:
+        """(edits, key) of the closest listed name within the edit budget"""
+        limit = min(len(compact) // FUZZY_CHARS_PER_EDIT, FUZZY_MAX_EDITS)
+        grams = _trigrams(compact)
+        
+        overlaps = Counter()
+        for gram in grams:
+            overlaps.update(self.postings.get(gram, ()))
+        
+        needed = max(1, len(grams) - 3 * limit)
+        best = None
+        for i, shared in overlaps.items():
+            if shared < needed:
+                continue
+            key = self.keys[i]
+            edits = _bounded_edit_distance(compact, key, limit)
+            if edits is None:
+                continue
+            rank = (edits, self.targets[key][1], len(key), key)
+            if best is None or rank < best:
+                best = rank
+        
+        return (best[0], best[3]) if best else None
+    
+    def lookup(self, normalized: str) -> Optional[Tuple[str, int, float]]:
+        """
+        Closest listed company to a name or to a run of its tokens.
+        
+        Args:
+            normalized: Output of normalize_company_name()
+        
+        Returns:
+            (canonical name, tier, confidence), confidence being
+            1 - edits / length; None when nothing is close enough
+        """
+        tokens = normalized.split()
+        best = None
+        
+        for start in range(len(tokens)):
+            for end in range(start + 1, min(len(tokens), start + FUZZY_MAX_SPAN) + 1):
+                compact = "".join(tokens[start:end])
+                match = self._match_compact(compact)
+                if not match:
+                    continue
+                edits, key = match
+                confidence = 1 - edits / max(len(compact), len(key))
+                rank = (confidence, len(key), -self.targets[key][1])
+                if best is None or rank > best[0]:
+                    best = (rank, key, confidence)
+        
+        if not best:
+            return None
+        _, key, confidence = best
+        canonical, tier = self.targets[key]
+        return canonical, tier, round(confidence, 4)
+
+
 # ============================================
+# COMPANY RESOLUTION
+# ============================================
+
+def resolve_company(company_name: str, profile: CompiledProfile = None) -> Optional[Tuple[str, int, float]]:
+    """
+    Match a raw company name to a listed company.
+    
+    Whole-word index matches have confidence 1.0; otherwise the fuzzy
+    index is tried (e.g. "Goldmansachs", "Make My Trip", "Acenture").
+    
+    Args:
+        company_name: Raw company name from job posting
+        profile: Scoring profile (default: the active profile)
+    
+    Returns:
+        (canonical company name, tier, confidence), or None for unknown companies
+    """
+    profile = profile or get_profile()
+    normalized = normalize_company_name(company_name)
+    if not normalized:
+        return None
+    
+    match = profile.company_index.lookup(normalized)
+    if match:
+        return match[0], match[1], 1.0
+    
+    return profile.fuzzy_index.lookup(normalized)
+
 
-def get_company_tier(company_name: str) -> Tuple[int, float]:
+def get_company_tier(company_name: str, profile: CompiledProfile = None) -> Tuple[int, float]:
     """
     Determine company tier based on reputation.
     
     Args:
         company_name: Raw company name from job posting
+        profile: Scoring profile (default: the active profile)
     
     Returns:
         Tuple of (tier_number, company_score)
         - tier_number: 1 (top), 2 (mid), 3 (unknown)
         - company_score: 1.0 (tier 1), 0.85 (tier 2), 0.4 (tier 3)
+          in the default profile
     """
+    profile = profile or get_profile()
     if not company_name:
-        return 3, 0.4
-    
-    normalized = normalize_company_name(company_name)
+        return 3, profile.tier_scores[3]
     
+    return _tier_for_normalized(normalize_company_name(company_name), profile)
+
+
+def _tier_for_normalized(normalized: str, profile: CompiledProfile) -> Tuple[int, float]:
+    """get_company_tier for an already normalized name"""
     if not normalized:
-        return 3, 0.4
+        return 3, profile.tier_scores[3]
     
-    # Check Tier 1 (exact or partial match)
-    for tier1_company in TIER_1_COMPANIES:
-        if tier1_company in normalized or normalized in tier1_company:
-            return 1, 1.0
+    # Memoized across runs per normalized name
+    cache = get_score_cache()
+    tier = cache.get("company", profile.company_version, normalized) if cache is not None else None
     
-    # Check Tier 2 (exact or partial match)
-    for tier2_company in TIER_2_COMPANIES:
-        if tier2_company in normalized or normalized in tier2_company:
-            return 2, 0.85
+    if tier is None:
+        match = profile.company_index.lookup(normalized) or profile.fuzzy_index.lookup(normalized)
+        tier = match[1] if match else 3
+        if cache is not None:
+            cache.put("company", profile.company_version, normalized, tier)
     
-    # Default: Tier 3 (unknown startup)
-    return 3, 0.4
+    return tier, profile.tier_scores[tier]
 
 
 # ============================================
 # BATCH SCORING
 # ============================================
 
-def add_company_scores_to_jobs(jobs: list) -> list:
+def add_company_scores_to_jobs(jobs: list, profile: CompiledProfile = None) -> list:
     """
     Add company_score to each job in the list.
     
     Args:
         jobs: List of job dicts
+        profile: Scoring profile (default: the active profile)
     
     Returns:
         Same list with 'company_tier', 'company_score' added
     """
-    for job in jobs:
-        # Extract company from job metadata
-        company_name = job.get('company', '') or job.get('source', '')
-        
+    profile = profile or get_profile()
+    
+    # Extract company from job metadata, normalizing each distinct name once
+    company_names = [job.get('company', '') or job.get('source', '') for job in jobs]
+    normalized_names = normalize_company_names(company_names)
+    
+    for job, normalized in zip(jobs, normalized_names):
         # Get tier and score
-        tier, score = get_company_tier(company_name)
+        tier, score = _tier_for_normalized(normalized, profile)
         
         # Add to job
         job['company_tier'] = tier
@@ -247,29 +601,64 @@ def add_company_scores_to_jobs(jobs: list) -> list:
     return jobs
 
 
+def add_company_scores_for_profiles(jobs: list, profiles) -> list:
+    """
+    Add per-profile company tier, company score and final rank.
+    
+    Names are normalized once; profiles sharing company lists share lookups.
+    
+    Args:
+        jobs: List of job dicts; job['profile_scores'][p] holds profile p's
+              scores (its 'hybrid_score' feeds the final rank)
+        profiles: ProfileSet (or list of CompiledProfiles)
+    
+    Returns:
+        Same list with 'company_tier', 'company_score' and 'final_rank_score'
+        added to each job's profile_scores entries
+    """
+    company_names = [job.get('company', '') or job.get('source', '') for job in jobs]
+    normalized_names = normalize_company_names(company_names)
+    tiers = {}   # (company_version, normalized name) -> tier
+    
+    for job, normalized in zip(jobs, normalized_names):
+        entries = job.setdefault('profile_scores', [{} for _ in profiles])
+        for entry, profile in zip(entries, profiles):
+            lookup_key = (profile.company_version, normalized)
+            if lookup_key not in tiers:
+                tiers[lookup_key] = _tier_for_normalized(normalized, profile)[0]
+            tier = tiers[lookup_key]
+            
+            entry['company_tier'] = tier
+            entry['company_score'] = profile.tier_scores[tier]
+            entry['final_rank_score'] = calculate_final_rank(entry, profile)
+    
+    return jobs
+
+
 # ============================================
 # FINAL RANK CALCULATION
 # ============================================
 
-def calculate_final_rank(job: dict) -> float:
+def calculate_final_rank(job: dict, profile: CompiledProfile = None) -> float:
     """
     Calculate final ranking score.
     
-    Formula: final_rank = 0.5 * hybrid_score + 0.5 * company_score
+    Formula: final_rank = hybrid_weight * hybrid_score + company_weight * company_score
     
-    Equal weight to skill match and company reputation.
+    The default profile weights skill match and company reputation equally (0.5 / 0.5).
     
     Args:
         job: Job dict with hybrid_score and company_score
+        profile: Scoring profile (default: the active profile)
     
     Returns:
         float: Final rank score (0.0 to 1.0)
     """
+    profile = profile or get_profile()
     hybrid_score = job.get('hybrid_score', 0.0) or 0.0
     company_score = job.get('company_score', 0.4) or 0.4
     
-    # Equal weighting
-    final_rank = (0.5 * hybrid_score) + (0.5 * company_score)
+    final_rank = (profile.hybrid_rank_weight * hybrid_score) + (profile.company_rank_weight * company_score)
     
     return round(final_rank, 4)
 
@@ -278,40 +667,45 @@ def calculate_final_rank(job: dict) -> float:
 # TELEGRAM ALERT FILTER
 # ============================================
 
-def should_send_telegram_alert(job: dict) -> bool:
+def should_send_telegram_alert(job: dict, profile: CompiledProfile = None) -> bool:
     """
     Determine if job should trigger Telegram alert.
     
-    Rule: Only Tier 1 and Tier 2 companies (company_score >= 0.85)
+    Rule: Only Tier 1 and Tier 2 companies (company_score >= 0.85
+    in the default profile)
     
     Args:
         job: Job dict with company_score
+        profile: Scoring profile (default: the active profile)
     
     Returns:
         bool: True if alert should be sent
     """
+    profile = profile or get_profile()
     company_score = job.get('company_score', 0.0)
     
     # Only Tier 1 (1.0) and Tier 2 (0.85)
-    return company_score >= 0.85
+    return company_score >= profile.alert_min_company_score
 
 
 # ============================================
 # DIAGNOSTIC / TESTING
 # ============================================
 
-def get_company_info(company_name: str) -> Dict:
+def get_company_info(company_name: str, profile: CompiledProfile = None) -> Dict:
     """
     Get detailed company information for debugging.
     
     Args:
         company_name: Company name to analyze
+        profile: Scoring profile (default: the active profile)
     
     Returns:
         dict with tier, score, normalized_name
     """
+    profile = profile or get_profile()
     normalized = normalize_company_name(company_name)
-    tier, score = get_company_tier(company_name)
+    tier, score = get_company_tier(company_name, profile)
     
     tier_labels = {1: "Tier 1 (Top MNC)", 2: "Tier 2 (Mid-tier)", 3: "Tier 3 (Unknown)"}
     
@@ -321,5 +715,5 @@ def get_company_info(company_name: str) -> Dict:
         'tier': tier,
         'tier_label': tier_labels.get(tier, "Unknown"),
         'company_score': score,
-        'telegram_alert': score >= 0.85
+        'telegram_alert': score >= profile.alert_min_company_score
     }
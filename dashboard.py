@@ -6,11 +6,11 @@ HANDLES MALFORMED DATA GRACEFULLY
 
 import streamlit as st
 import pandas as pd
-import plotly.express as px
 from datetime import datetime
-import re
 from pathlib import Path
 
+from keyword_matcher import SkillExtractor
+
 st.set_page_config(page_title="AI Job Agent Dashboard", page_icon="🤖", layout="wide")
 
 @st.cache_data(ttl=300)
@@ -54,17 +54,18 @@ def load_data():
         st.code("date,title,source,link,location,stipend_mentioned,easy_apply,ai_score,keyword_score,hybrid_score,keyword_pass,final_decision", language="csv")
         return pd.DataFrame()
 
+# Compiled once: one regex pass per title finds every skill
+SKILL_EXTRACTOR = SkillExtractor({
+    'Python': [], 'SQL': [], 'Excel': [],
+    'Power BI': ['powerbi'], 'Tableau': [],
+    'Machine Learning': ['machinelearning', 'ml']
+})
+
 def extract_skills(text):
     """Extract skills from title"""
     if pd.isna(text):
         return []
-    text_lower = str(text).lower()
-    skills = {
-        'Python': r'\bpython\b', 'SQL': r'\bsql\b', 'Excel': r'\bexcel\b',
-        'Power BI': r'\bpower\s*bi\b|\bpowerbi\b', 'Tableau': r'\btableau\b',
-        'Machine Learning': r'\bmachine\s*learning\b|\bml\b'
-    }
-    return [s for s, p in skills.items() if re.search(p, text_lower)]
+    return SKILL_EXTRACTOR.extract(str(text))
 
 def is_remote(row):
     """Check if remote"""
@@ -129,7 +130,8 @@ def main():
         remote_pct = (remote_cnt / len(filtered) * 100) if len(filtered) > 0 else 0
         st.metric("Remote %", f"{remote_pct:.1f}%", f"{remote_cnt} jobs")
     
-    # CHARTS
+    # CHARTS (plotly is imported here, so the KPIs render first)
+    import plotly.express as px
     st.header("📈 Analytics")
     c1, c2 = st.columns(2)
     
@@ -0,0 +1,184 @@
+"""
+Fixture Server Module
+Local stand-in for the job portals. Replays the saved pages in
+fixtures/pages over HTTP so the real fetchers run offline, end to end
+(URL building, transport, conditional GET, parsing and pagination).
+"""
+
+import hashlib
+import os
+import re
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+import http_client
+
+
+# ============================================
+# CONFIGURATION
+# ============================================
+
+FIXTURE_DIR = os.path.join("fixtures", "pages")
+
+# Portal host -> (fixture name, file extension)
+FIXTURE_HOSTS = {
+    "in.indeed.com": ("indeed", "xml"),
+    "internshala.com": ("internshala", "html"),
+    "www.linkedin.com": ("linkedin", "html"),
+    "www.naukri.com": ("naukri", "html"),
+    "www.instahyre.com": ("instahyre", "html"),
+}
+
+# Results per page for portals paginated with start= (as in job_agent)
+START_PAGE_SIZES = {"indeed": 10, "linkedin": 25}
+
+# Served past the last saved page: a listing with no results
+EMPTY_PAGES = {
+    "xml": b'<?xml version="1.0" encoding="UTF-8"?>\n<rss version="2.0"><channel></channel></rss>\n',
+    "html": b"<!DOCTYPE html>\n<html><head><title>No results</title></head><body></body></html>\n",
+}
+
+
+# ============================================
+# URL -> FIXTURE PAGE
+# ============================================
+
+def fixture_page(url: str) -> Optional[Tuple[str, int, str]]:
+    """
+    Which saved page a portal URL asks for.
+    
+    Args:
+        url: Listing URL as built by job_agent's fetchers
+    
+    Returns:
+        (fixture name, 1-based page number, extension), or None for other hosts
+    """
+    parts = urlsplit(url)
+    fixture = FIXTURE_HOSTS.get(parts.netloc.lower())
+    if fixture is None:
+        return None
+    
+    name, extension = fixture
+    page = 1
+    if name in START_PAGE_SIZES:
+        start = parse_qs(parts.query).get("start", ["0"])[0]
+        page = int(start) // START_PAGE_SIZES[name] + 1 if start.isdigit() else 1
+    elif name == "internshala":
+        match = re.search(r"/page-(\d+)/?$", parts.path)
+        page = int(match.group(1)) if match else 1
+    elif name == "naukri":
+        match = re.search(r"-(\d+)$", parts.path)
+        page = int(match.group(1)) if match else 1
+    
+    return name, page, extension
+
+
+def fixture_path(name: str, page: int, extension: str) -> str:
+    """Saved file for a page: <name>.<ext> for page 1, <name>-<page>.<ext> after"""
+    suffix = f"-{page}" if page > 1 else ""
+    return os.path.join(FIXTURE_DIR, f"{name}{suffix}.{extension}")
+
+
+# ============================================
+# REPLAY SERVER
+# ============================================
+
+class _FixtureHandler(BaseHTTPRequestHandler):
+    """Serves /<name>/<page>.<ext> from FIXTURE_DIR, with ETags"""
+    
+    def do_GET(self):
+        match = re.fullmatch(r"/(\w+)/(\d+)\.(\w+)", urlsplit(self.path).path)
+        if not match:
+            self.send_error(404, "Not a fixture page")
+            return
+        
+        name, page, extension = match.group(1), int(match.group(2)), match.group(3)
+        path = fixture_path(name, page, extension)
+        if os.path.exists(path):
+            with open(path, 'rb') as f:
+                body = f.read()
+        else:
+            body = EMPTY_PAGES.get(extension, EMPTY_PAGES["html"])
+        
+        self.server.requests_served += 1
+        etag = '"' + hashlib.sha1(body).hexdigest() + '"'
+        if self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.end_headers()
+            return
+        
+        content_type = "application/rss+xml" if extension == "xml" else "text/html"
+        self.send_response(200)
+        self.send_header("Content-Type", f"{content_type}; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("ETag", etag)
+        self.end_headers()
+        self.wfile.write(body)
+    
+    def log_message(self, format, *args):
+        pass
+
+
+class FixtureServer:
+    """
+    Replays fixtures/pages on a local port in place of the portals.
+    
+    While running, every request from http_client is rewritten to this
+    server: portal listing URLs to their saved pages (later pages past the
+    saved ones come back empty), anything else to a 404, so nothing leaves
+    the machine. Use as a context manager:
+        
+        with FixtureServer():
+            jobs = fetch_linkedin("data%20analyst%20intern")
+    """
+    
+    def __init__(self, port: int = 0):
+        """
+        Args:
+            port: Local port (0 = any free port)
+        """
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", port), _FixtureHandler)
+        self.httpd.daemon_threads = True
+        self.httpd.requests_served = 0
+        self.port = self.httpd.server_address[1]
+        self._thread = None
+        self._min_interval = None
+    
+    @property
+    def requests_served(self) -> int:
+        return self.httpd.requests_served
+    
+    def rewrite(self, url: str) -> str:
+        """Local URL serving the saved page a portal URL asks for"""
+        page = fixture_page(url)
+        if page is None:
+            return f"http://127.0.0.1:{self.port}/not-a-fixture"
+        name, number, extension = page
+        return f"http://127.0.0.1:{self.port}/{name}/{number}.{extension}"
+    
+    def start(self) -> "FixtureServer":
+        """Serve in a background thread and route http_client here"""
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self._thread.start()
+        http_client.set_url_rewriter(self.rewrite)
+        # Every portal now shares one local host; replays need no politeness delay
+        self._min_interval = http_client.throttle.min_interval
+        http_client.throttle.min_interval = 0
+        return self
+    
+    def stop(self) -> None:
+        """Stop serving and send requests to the real portals again"""
+        http_client.set_url_rewriter(None)
+        if self._min_interval is not None:
+            http_client.throttle.min_interval = self._min_interval
+        self.httpd.shutdown()
+        self.httpd.server_close()
+    
+    def __enter__(self) -> "FixtureServer":
+        return self.start()
+    
+    def __exit__(self, *exc) -> None:
+        self.stop()
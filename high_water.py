@@ -0,0 +1,205 @@
+"""
+High-Water Mark Module
+Per-source time of the last successful run, for incremental scraping.
+Sources ask their portal only for postings newer than their mark
+(LinkedIn f_TPR, Indeed fromage, Naukri jobAge) and skip older ones
+by posting date.
+"""
+
+import json
+import math
+import os
+import threading
+import time
+from datetime import datetime
+from email.utils import parsedate_to_datetime
+from typing import Dict, Iterable, Optional
+
+
+# ============================================
+# CONFIGURATION
+# ============================================
+
+# Set INCREMENTAL=0 to always request full listings
+INCREMENTAL_ENABLED = os.getenv("INCREMENTAL", "1") != "0"
+HIGH_WATER_FILE = os.path.join(".cache", "high_water.json")
+
+# Requested windows reach this far behind the mark: portals index new
+# postings with some delay and report coarse posting times
+HIGH_WATER_OVERLAP_SECONDS = 3 * 3600
+
+# Beyond this a source is treated as never run (full listing)
+HIGH_WATER_MAX_AGE_DAYS = 30
+
+
+# ============================================
+# HIGH-WATER MARKS
+# ============================================
+
+class HighWaterMarks:
+    """
+    Unix time of each source's last successful run.
+    
+    A mark advances to the start of the current run when the run ends,
+    for every source whose fetches all succeeded this run. A failed
+    source keeps its old mark, so the next run asks for the missed window.
+    """
+    
+    def __init__(self, path: str = HIGH_WATER_FILE, default: Optional[float] = None):
+        """
+        Args:
+            path: JSON file of {source: unix time}
+            default: Mark for sources not in the file yet (e.g. the
+                     history's last_updated), None = full listing
+        """
+        self.path = path
+        self.default = default
+        self.marks: Dict[str, float] = {}
+        self.failed = set()
+        self.run_started = time.time()
+        self._lock = threading.Lock()
+        self._load()
+    
+    def _load(self) -> None:
+        """Read saved marks"""
+        if not os.path.exists(self.path):
+            return
+        
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                self.marks = {source: float(t) for source, t in json.load(f).items()}
+        except Exception as e:
+            print(f"⚠️ Error loading high-water marks: {e}")
+    
+    def since(self, source: str) -> Optional[float]:
+        """
+        Earliest posting time worth fetching for a source.
+        
+        Returns:
+            Unix time (mark minus overlap), or None for a full listing
+        """
+        if not INCREMENTAL_ENABLED:
+            return None
+        
+        mark = self.marks.get(source, self.default)
+        if mark is None or self.run_started - mark > HIGH_WATER_MAX_AGE_DAYS * 86400:
+            return None
+        return mark - HIGH_WATER_OVERLAP_SECONDS
+    
+    def window_seconds(self, source: str) -> Optional[int]:
+        """
+        Seconds between since() and now, rounded up to whole hours so
+        runs on a steady schedule request the same URLs (and keep
+        hitting the page cache). None = full listing.
+        """
+        since = self.since(source)
+        if since is None:
+            return None
+        return max(1, math.ceil((self.run_started - since) / 3600)) * 3600
+    
+    def window_days(self, source: str) -> Optional[int]:
+        """window_seconds rounded up to whole days, for day-granular portal filters"""
+        seconds = self.window_seconds(source)
+        if seconds is None:
+            return None
+        return max(1, math.ceil(seconds / 86400))
+    
+    def record_failure(self, source: str) -> None:
+        """Keep a source's mark where it is: one of its fetches failed this run"""
+        with self._lock:
+            self.failed.add(source)
+    
+    def save(self, sources: Iterable[str]) -> None:
+        """
+        Advance the marks of sources that fetched without errors, then write atomically.
+        
+        Args:
+            sources: Every source that ran this run
+        """
+        for source in sources:
+            if source not in self.failed:
+                self.marks[source] = self.run_started
+        
+        try:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            tmp_path = self.path + ".tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({s: round(t) for s, t in sorted(self.marks.items())}, f, indent=2)
+            os.replace(tmp_path, self.path)
+            
+            if self.failed:
+                print(f"💾 High-water marks saved (held back: {', '.join(sorted(self.failed))})")
+            else:
+                print(f"💾 High-water marks saved")
+        except Exception as e:
+            print(f"⚠️ Error saving high-water marks: {e}")
+
+
+def parse_posting_time(value: str) -> Optional[float]:
+    """
+    Unix time of a posting date as portals print it.
+    
+    Args:
+        value: RFC 822 (RSS pubDate) or ISO 8601 date / datetime
+    
+    Returns:
+        Unix time, or None if unparseable
+    """
+    if not value:
+        return None
+    
+    value = value.strip()
+    try:
+        return parsedate_to_datetime(value).timestamp()
+    except (TypeError, ValueError, IndexError):
+        pass
+    
+    try:
+        return datetime.fromisoformat(value.replace("Z", "+00:00")).timestamp()
+    except ValueError:
+        return None
+
+
+def posted_before(value: str, since: Optional[float]) -> bool:
+    """
+    True if a posting date is known to be older than since.
+    
+    A date without a time counts as the whole day; unknown dates are never old.
+    """
+    if since is None:
+        return False
+    
+    posted = parse_posting_time(value)
+    if posted is None:
+        return False
+    if len(value.strip()) == 10:   # YYYY-MM-DD
+        posted += 86400
+    return posted < since
+
+
+_high_water_marks = None
+_high_water_lock = threading.Lock()
+
+
+def get_high_water_marks(default: Optional[float] = None) -> HighWaterMarks:
+    """
+    Get or load the high-water marks singleton (thread-safe, so fetch
+    workers all record into the same instance).
+    
+    Args:
+        default: Mark for sources without one (used on first load only)
+    """
+    global _high_water_marks
+    if _high_water_marks is None:
+        with _high_water_lock:
+            if _high_water_marks is None:
+                _high_water_marks = HighWaterMarks(default=default)
+    return _high_water_marks
+
+
+def save_high_water_marks(sources: Iterable[str]) -> None:
+    """Advance and persist the marks if they were used this run"""
+    if _high_water_marks is not None:
+        _high_water_marks.save(sources)
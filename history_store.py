@@ -0,0 +1,280 @@
+"""
+History Store Module
+Indexed, bounded memory of jobs already sent.
+O(1) membership checks with insertion-ordered eviction and optional expiry,
+persisted as an append-only, crash-safe JSON-lines journal.
+"""
+
+import json
+import os
+import time
+from collections import OrderedDict
+from typing import Callable, Iterable, Iterator, List, Optional, Tuple
+
+
+# ============================================
+# CONFIGURATION
+# ============================================
+
+# Default number of links remembered before the oldest are evicted
+DEFAULT_MAX_LINKS = 10000
+
+# Rewrite the journal once it holds this many times more lines than live links
+COMPACT_RATIO = 2.0
+COMPACT_MIN_LINES = 1000
+
+
+# ============================================
+# SEEN-SET STORE
+# ============================================
+
+class SeenStore:
+    """
+    Set of seen job keys backed by an OrderedDict.
+    
+    Keys are canonical job keys (see job_keys.py) or raw links, values
+    are the unix time they were first seen.
+    Insertion order doubles as eviction order (oldest first), so both
+    membership checks and evictions are O(1).
+    """
+    
+    def __init__(self, max_links: int = DEFAULT_MAX_LINKS, ttl_days: Optional[float] = None):
+        """
+        Args:
+            max_links: Maximum links kept; oldest are evicted first
+            ttl_days: Forget links older than this many days (None = never)
+        """
+        self.max_links = max_links
+        self.ttl_seconds = ttl_days * 86400 if ttl_days else None
+        self._seen = OrderedDict()
+        self._new = []
+    
+    def __contains__(self, link: str) -> bool:
+        seen_at = self._seen.get(link)
+        if seen_at is None:
+            return False
+        if self.ttl_seconds and time.time() - seen_at > self.ttl_seconds:
+            return False
+        return True
+    
+    def __len__(self) -> int:
+        return len(self._seen)
+    
+    def seen_before(self, link: str, cutoff: float) -> bool:
+        """True if the link is present (not expired) and was last recorded before cutoff"""
+        seen_at = self._seen.get(link)
+        return seen_at is not None and seen_at < cutoff and link in self
+    
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._seen)
+    
+    def add(self, link: str, seen_at: Optional[float] = None, record: bool = True) -> None:
+        """
+        Record a link, refreshing its position if already present.
+        
+        Args:
+            link: Job link
+            seen_at: Unix time first seen (defaults to now)
+            record: Track the link as new since the last save
+        """
+        if not link:
+            return
+        
+        if link in self._seen:
+            self._seen.move_to_end(link)
+        seen_at = seen_at if seen_at is not None else time.time()
+        self._seen[link] = seen_at
+        
+        if record:
+            self._new.append((link, seen_at))
+        
+        while len(self._seen) > self.max_links:
+            self._seen.popitem(last=False)
+    
+    def expire(self, now: Optional[float] = None) -> int:
+        """
+        Drop links older than the TTL.
+        
+        Returns:
+            Number of links removed
+        """
+        if not self.ttl_seconds:
+            return 0
+        
+        cutoff = (now or time.time()) - self.ttl_seconds
+        removed = 0
+        
+        # Oldest first: stop at the first link still inside the window
+        while self._seen:
+            link, seen_at = next(iter(self._seen.items()))
+            if seen_at >= cutoff:
+                break
+            self._seen.popitem(last=False)
+            removed += 1
+        
+        return removed
+    
+    def items(self):
+        """(link, seen_at) pairs, oldest first"""
+        return self._seen.items()
+    
+    @classmethod
+    def from_lists(cls, links: Iterable[str], seen_at: Optional[List[float]] = None,
+                   default_time: Optional[float] = None, **kwargs) -> "SeenStore":
+        """
+        Build a store from the JSON history lists.
+        
+        Args:
+            links: Links, oldest first
+            seen_at: Matching unix times (older files do not have them)
+            default_time: Time used for links without a timestamp
+        
+        Returns:
+            Populated SeenStore
+        """
+        store = cls(**kwargs)
+        default_time = default_time if default_time is not None else time.time()
+        times = list(seen_at or [])
+        
+        for i, link in enumerate(links):
+            store.add(link, times[i] if i < len(times) else default_time, record=False)
+        
+        return store
+    
+    def to_lists(self):
+        """Inverse of from_lists: (links, seen_at) oldest first"""
+        return list(self._seen.keys()), [round(t) for t in self._seen.values()]
+    
+    def pop_new(self) -> List[Tuple[str, float]]:
+        """Links added since the last call, for journaling only the delta"""
+        new, self._new = self._new, []
+        return new
+
+
+# ============================================
+# APPEND-ONLY JOURNAL
+# ============================================
+
+def _fsync_directory(path: str) -> None:
+    """Make a rename durable (no-op where directories cannot be opened)"""
+    try:
+        fd = os.open(os.path.dirname(os.path.abspath(path)), os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+class HistoryJournal:
+    """
+    JSON-lines journal of sent job keys.
+    
+    Each run appends only its new keys plus one run marker:
+        {"key": "linkedin:data-analyst-at-acme", "t": 1771234567}
+        {"last_updated": "2026-02-13T09:00:00"}
+    
+    Records with a raw "link" (written before canonical keys) are
+    mapped through key_func on load.
+    
+    Appends are fsynced. A torn final line from a crash is skipped on
+    load. Once the file holds far more lines than live links, it is
+    compacted by an atomic rewrite.
+    """
+    
+    def __init__(self, path: str, compact_ratio: float = COMPACT_RATIO,
+                 compact_min_lines: int = COMPACT_MIN_LINES):
+        self.path = path
+        self.compact_ratio = compact_ratio
+        self.compact_min_lines = compact_min_lines
+        self.line_count = 0
+    
+    def exists(self) -> bool:
+        return os.path.exists(self.path)
+    
+    def load(self, store: SeenStore, key_func: Optional[Callable[[str], str]] = None) -> Optional[str]:
+        """
+        Stream the journal into a store, line by line.
+        
+        Args:
+            store: SeenStore to populate (evictions apply as it fills)
+            key_func: Maps raw links from older journals to store keys
+        
+        Returns:
+            The most recent last_updated marker, if any
+        """
+        last_updated = None
+        self.line_count = 0
+        
+        with open(self.path, 'r', encoding='utf-8') as f:
+            for line in f:
+                self.line_count += 1
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    continue  # torn write from an interrupted run
+                
+                if "key" in record:
+                    store.add(record["key"], record.get("t"), record=False)
+                elif "link" in record:
+                    link = key_func(record["link"]) if key_func else record["link"]
+                    store.add(link, record.get("t"), record=False)
+                elif "last_updated" in record:
+                    last_updated = record["last_updated"]
+        
+        store.expire()
+        return last_updated
+    
+    def append(self, entries: List[Tuple[str, float]], last_updated: str) -> None:
+        """
+        Durably append new keys and a run marker.
+        
+        Args:
+            entries: (key, seen_at) pairs added this run
+            last_updated: ISO timestamp of this run
+        """
+        lines = [json.dumps({"key": key, "t": round(t)}, ensure_ascii=False) for key, t in entries]
+        lines.append(json.dumps({"last_updated": last_updated}))
+        
+        with open(self.path, 'a+b') as f:
+            # Terminate a torn last line so it cannot swallow our first record
+            f.seek(0, os.SEEK_END)
+            if f.tell() > 0:
+                f.seek(-1, os.SEEK_END)
+                if f.read(1) != b"\n":
+                    f.write(b"\n")
+            f.write(("\n".join(lines) + "\n").encode('utf-8'))
+            f.flush()
+            os.fsync(f.fileno())
+        
+        self.line_count += len(lines)
+    
+    def needs_compaction(self, store: SeenStore) -> bool:
+        """True once dead lines (evicted links, old markers) dominate the file"""
+        threshold = max(self.compact_min_lines, len(store) * self.compact_ratio)
+        return self.line_count > threshold
+    
+    def compact(self, store: SeenStore, last_updated: str) -> None:
+        """
+        Atomically rewrite the journal with only the live links.
+        
+        Args:
+            store: Current SeenStore
+            last_updated: ISO timestamp of this run
+        """
+        tmp_path = self.path + ".tmp"
+        
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            for key, seen_at in store.items():
+                f.write(json.dumps({"key": key, "t": round(seen_at)}, ensure_ascii=False) + "\n")
+            f.write(json.dumps({"last_updated": last_updated}) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        
+        os.replace(tmp_path, self.path)
+        _fsync_directory(self.path)
+        
+        self.line_count = len(store) + 1
@@ -0,0 +1,456 @@
+"""
+HTTP Transport Module
+Shared, pooled HTTP layer for every job source and the Telegram sender.
+Keep-alive connections, compression negotiation, per-host politeness
+and jittered exponential retry that honors Retry-After.
+requests is imported with the first request, not at startup.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import random
+import threading
+import time
+from collections import OrderedDict
+from email.utils import parsedate_to_datetime
+from typing import TYPE_CHECKING, Callable, Dict, Optional
+from urllib.parse import urlsplit
+
+from metrics import metrics
+
+if TYPE_CHECKING:
+    import requests
+
+
+# ============================================
+# CONFIGURATION
+# ============================================
+
+DEFAULT_TIMEOUT = 15
+
+# Retry policy
+MAX_RETRIES = 3
+BACKOFF_BASE = 1.0       # seconds, doubled per attempt
+BACKOFF_CAP = 20.0       # never wait longer than this between attempts
+RETRY_AFTER_MAX = 60.0   # give up instead of honoring longer Retry-After
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+# A 5xx may come after the server acted on the request, so non-idempotent
+# methods (POST) are only retried when it was turned away
+UNSAFE_RETRY_STATUSES = {429}
+
+# Connection pooling (urllib3 keeps one pool per host)
+POOL_CONNECTIONS = 10
+POOL_MAXSIZE = 8
+
+# Politeness: minimum spacing between requests to the same host
+HOST_MIN_INTERVAL = 1.0
+
+# Conditional-GET cache for listing pages
+PAGE_CACHE_ENABLED = os.getenv("PAGE_CACHE", "1") != "0"
+PAGE_CACHE_FILE = os.getenv("PAGE_CACHE_FILE", os.path.join(".cache", "page_cache.json"))
+PAGE_CACHE_TTL = 24 * 3600       # force a full fetch+parse after this many seconds
+PAGE_CACHE_MAX_ENTRIES = 500     # least recently used URLs are evicted beyond this
+
+USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
+
+# Only advertise brotli when a decoder is installed, otherwise
+# servers may send bodies requests cannot decompress.
+try:
+    import brotli  # noqa: F401
+    ACCEPT_ENCODING = "gzip, deflate, br"
+except ImportError:
+    try:
+        import brotlicffi  # noqa: F401
+        ACCEPT_ENCODING = "gzip, deflate, br"
+    except ImportError:
+        ACCEPT_ENCODING = "gzip, deflate"
+
+
+# ============================================
+# PER-HOST POLITENESS
+# ============================================
+
+class HostThrottle:
+    """
+    Per-host politeness limiter.
+    Spaces requests to the same host by at least `min_interval` seconds,
+    while requests to different hosts proceed independently.
+    """
+    
+    def __init__(self, min_interval: float = HOST_MIN_INTERVAL):
+        self.min_interval = min_interval
+        self._next_slot = {}
+        self._lock = threading.Lock()
+    
+    def wait(self, url: str) -> None:
+        """Block until the next request slot for this URL's host"""
+        host = urlsplit(url).netloc.lower()
+        
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot.get(host, now))
+            self._next_slot[host] = slot + self.min_interval
+        
+        delay = slot - now
+        if delay > 0:
+            time.sleep(delay)
+
+
+throttle = HostThrottle()
+
+
+# ============================================
+# SHARED SESSION
+# ============================================
+
+_session = None
+_session_lock = threading.Lock()
+
+
+def get_session() -> requests.Session:
+    """
+    Get or create the shared keep-alive session.
+    
+    Returns:
+        requests.Session with pooled adapters and default headers
+    """
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                import requests
+                from requests.adapters import HTTPAdapter
+                
+                session = requests.Session()
+                adapter = HTTPAdapter(
+                    pool_connections=POOL_CONNECTIONS,
+                    pool_maxsize=POOL_MAXSIZE
+                )
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                session.headers.update({
+                    "User-Agent": USER_AGENT,
+                    "Accept-Encoding": ACCEPT_ENCODING,
+                    "Connection": "keep-alive"
+                })
+                _session = session
+    return _session
+
+
+# ============================================
+# URL REWRITING
+# ============================================
+
+# Maps every outgoing URL to the one actually requested (None = as is).
+# fixture_server.py installs one to replay saved pages offline.
+_url_rewriter: Optional[Callable[[str], str]] = None
+
+
+def set_url_rewriter(rewriter: Optional[Callable[[str], str]]) -> None:
+    """
+    Route every request through rewriter(url).
+    
+    Args:
+        rewriter: URL -> URL to request, or None to send requests as addressed
+    """
+    global _url_rewriter
+    _url_rewriter = rewriter
+
+
+# ============================================
+# RETRY HELPERS
+# ============================================
+
+def _backoff_delay(attempt: int) -> float:
+    """Exponential backoff with equal jitter"""
+    ceiling = min(BACKOFF_CAP, BACKOFF_BASE * (2 ** attempt))
+    return ceiling / 2 + random.uniform(0, ceiling / 2)
+
+
+def _retry_after_delay(response: requests.Response) -> Optional[float]:
+    """Parse a Retry-After header (seconds or HTTP date)"""
+    value = response.headers.get("Retry-After")
+    if not value:
+        return None
+    
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    
+    try:
+        retry_at = parsedate_to_datetime(value)
+        return max(0.0, retry_at.timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+# ============================================
+# REQUESTS
+# ============================================
+
+def _failed_before_send(error: Exception) -> bool:
+    """True if the connection could not be opened, so nothing was sent"""
+    import requests
+    from urllib3.exceptions import NewConnectionError
+    
+    if isinstance(error, requests.ConnectTimeout):
+        return True
+    reason = getattr(error.args[0], "reason", None) if error.args else None
+    return isinstance(reason, NewConnectionError)
+
+
+def http_request(method: str, url: str, retries: int = MAX_RETRIES,
+                 polite: bool = True, **kwargs) -> requests.Response:
+    """
+    Send a request through the shared session with retry/backoff.
+    
+    Idempotent methods (GET, HEAD, OPTIONS) retry connection errors,
+    timeouts and 429/5xx responses. Other methods retry only failures
+    to connect and 429, so a POST the server may have acted on is never
+    sent twice.
+    
+    Args:
+        method: HTTP method
+        url: Target URL
+        retries: Extra attempts after the first one
+        polite: Apply the per-host politeness delay
+        **kwargs: Passed to requests.Session.request
+    
+    Returns:
+        The final requests.Response (may still be an error status)
+    
+    Raises:
+        requests.RequestException: If every attempt failed to connect
+    """
+    import requests
+    
+    kwargs.setdefault("timeout", DEFAULT_TIMEOUT)
+    if _url_rewriter is not None:
+        url = _url_rewriter(url)
+    idempotent = method.upper() in ("GET", "HEAD", "OPTIONS")
+    retry_statuses = RETRY_STATUSES if idempotent else UNSAFE_RETRY_STATUSES
+    session = get_session()
+    host = urlsplit(url).netloc
+    
+    attempt = 0
+    while True:
+        if polite:
+            with metrics.span("http.wait"):
+                throttle.wait(url)
+        
+        metrics.incr("http.requests")
+        try:
+            response = session.request(method, url, **kwargs)
+        except (requests.ConnectionError, requests.Timeout) as e:
+            retryable = idempotent or _failed_before_send(e)
+            if attempt >= retries or not retryable:
+                raise
+            delay = _backoff_delay(attempt)
+            print(f"   ↻ {host}: {type(e).__name__}, retry {attempt + 1}/{retries} in {delay:.1f}s")
+        else:
+            metrics.incr(f"http.status.{response.status_code}")
+            if response.status_code not in retry_statuses or attempt >= retries:
+                return response
+            
+            delay = _retry_after_delay(response)
+            if delay is None:
+                delay = _backoff_delay(attempt)
+            elif delay > RETRY_AFTER_MAX:
+                return response
+            
+            print(f"   ↻ {host}: HTTP {response.status_code}, retry {attempt + 1}/{retries} in {delay:.1f}s")
+            response.close()
+        
+        metrics.incr("http.retries")
+        time.sleep(delay)
+        attempt += 1
+
+
+def http_get(url: str, **kwargs) -> requests.Response:
+    """GET through the shared transport"""
+    return http_request("GET", url, **kwargs)
+
+
+def http_post(url: str, **kwargs) -> requests.Response:
+    """POST through the shared transport"""
+    return http_request("POST", url, **kwargs)
+
+
+# ============================================
+# CONDITIONAL-GET PAGE CACHE
+# ============================================
+
+class PageCache:
+    """
+    On-disk cache of listing-page validators keyed by URL.
+    
+    Stores ETag / Last-Modified and a SHA-256 of the body, so unchanged
+    pages can be skipped without parsing. Only validators are stored,
+    never bodies. New entries are staged and only persisted by save(),
+    which the agent calls after a successful run, so a crashed run never
+    hides pages whose jobs were not processed.
+    """
+    
+    def __init__(self, path: str = PAGE_CACHE_FILE, ttl: float = PAGE_CACHE_TTL,
+                 max_entries: int = PAGE_CACHE_MAX_ENTRIES):
+        self.path = path
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.entries = OrderedDict()
+        self._pending = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self._load()
+    
+    def _load(self) -> None:
+        """Read the cache index from disk, dropping expired entries"""
+        if not os.path.exists(self.path):
+            return
+        
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except Exception as e:
+            print(f"⚠️ Error loading page cache: {e}")
+            return
+        
+        now = time.time()
+        entries = sorted(data.get("entries", {}).items(), key=lambda kv: kv[1].get("used_at", 0))
+        for url, entry in entries:
+            if now - entry.get("stored_at", 0) < self.ttl:
+                self.entries[url] = entry
+    
+    def validators(self, url: str) -> Dict[str, str]:
+        """Conditional request headers for a cached URL"""
+        with self._lock:
+            entry = self.entries.get(url)
+        
+        if not entry:
+            return {}
+        
+        headers = {}
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+    
+    def is_unchanged(self, url: str, body: Optional[bytes] = None) -> bool:
+        """True for a 304 (body=None) or a body identical to the cached one"""
+        with self._lock:
+            entry = self.entries.get(url)
+            if entry is None:
+                self.misses += 1
+                return False
+            
+            if body is not None and hashlib.sha256(body).hexdigest() != entry.get("sha256"):
+                self.misses += 1
+                return False
+            
+            entry["used_at"] = time.time()
+            self.entries.move_to_end(url)
+            self.hits += 1
+            return True
+    
+    def stage(self, url: str, response: requests.Response) -> None:
+        """Remember a freshly parsed page until the next save()"""
+        entry = {
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
+            "sha256": hashlib.sha256(response.content).hexdigest(),
+            "stored_at": time.time(),
+            "used_at": time.time()
+        }
+        with self._lock:
+            self._pending[url] = entry
+    
+    def save(self) -> None:
+        """Commit staged entries, evict beyond max_entries and write atomically"""
+        with self._lock:
+            for url, entry in self._pending.items():
+                self.entries[url] = entry
+                self.entries.move_to_end(url)
+            self._pending.clear()
+            
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+            
+            data = {"entries": dict(self.entries)}
+        
+        try:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            tmp_path = self.path + ".tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f)
+            os.replace(tmp_path, self.path)
+            print(f"💾 Page cache saved: {len(data['entries'])} URLs ({self.hits} unchanged this run)")
+        except Exception as e:
+            print(f"⚠️ Error saving page cache: {e}")
+
+
+_page_cache = None
+
+
+def get_page_cache() -> PageCache:
+    """Get or create the page cache singleton"""
+    global _page_cache
+    if _page_cache is None:
+        with _session_lock:
+            if _page_cache is None:
+                _page_cache = PageCache()
+    return _page_cache
+
+
+def fetch_if_changed(url: str, **kwargs) -> Optional[requests.Response]:
+    """
+    GET a listing page unless it is unchanged since the last run.
+    
+    Sends If-None-Match / If-Modified-Since when the URL is cached.
+    
+    Args:
+        url: Listing page URL
+        **kwargs: Passed to http_get
+    
+    Returns:
+        The response for a new or changed page, or None when the server
+        answered 304 or the body hash matches the cached one
+    
+    Raises:
+        requests.HTTPError: For error statuses
+    """
+    if not PAGE_CACHE_ENABLED:
+        response = http_get(url, **kwargs)
+        response.raise_for_status()
+        return response
+    
+    cache = get_page_cache()
+    headers = dict(kwargs.pop("headers", None) or {})
+    headers.update(cache.validators(url))
+    
+    response = http_get(url, headers=headers, **kwargs)
+    
+    if response.status_code == 304:
+        cache.is_unchanged(url)
+        metrics.incr("page_cache.not_modified")
+        return None
+    
+    response.raise_for_status()
+    
+    if cache.is_unchanged(url, response.content):
+        metrics.incr("page_cache.same_body")
+        return None
+    
+    cache.stage(url, response)
+    return response
+
+
+def save_page_cache() -> None:
+    """Persist the page cache if it was used this run"""
+    if _page_cache is not None:
+        _page_cache.save()
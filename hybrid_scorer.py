@@ -4,94 +4,83 @@ Composes on top of existing AI score without modifying it.
 Combines semantic AI score with keyword matching.
 """
 
-import re
-from typing import List, Tuple
+from typing import List, Optional, Tuple
+
+from score_cache import content_hash, get_score_cache
+from scoring_profile import CompiledProfile, ProfileSet, get_profile
 
 
 # ============================================
 # CONFIGURATION
 # ============================================
 
-# Skills to detect in job descriptions
-REQUIRED_SKILLS = [
-    "python", "sql", "excel", "power bi", "powerbi", "tableau", 
-    "pandas", "numpy", "r programming", "statistics", "machine learning",
-    "data visualization", "etl", "data warehouse", "dashboard",
-    "jupyter", "matplotlib", "seaborn", "mysql", "postgresql"
-]
-
-# Weight configuration for hybrid score
-AI_WEIGHT = 0.7
-KEYWORD_WEIGHT = 0.3
-
-# Default keyword score when no skills detected
-DEFAULT_KEYWORD_SCORE = 0.5
+# Skills, synonyms, the user's skills and the AI/keyword weights come
+# from the scoring profile (profile.json, see scoring_profile.py).
 
 
 # ============================================
 # SKILL EXTRACTION
 # ============================================
 
-def extract_skills_from_text(text: str) -> List[str]:
+def extract_skills_from_text(text: str, profile: CompiledProfile = None) -> List[str]:
     """
     Extract mentioned required skills from job text.
     
     Args:
-        text: Job description or resume text (lowercase)
+        text: Job description or resume text
+        profile: Scoring profile (default: the active profile)
     
     Returns:
-        List of detected skills
+        List of detected skills (synonyms reported under their canonical name)
     """
-    text_lower = text.lower()
-    detected = []
-    
-    for skill in REQUIRED_SKILLS:
-        # Handle multi-word skills (e.g., "power bi")
-        pattern = r'\b' + re.escape(skill) + r'\b'
-        if re.search(pattern, text_lower):
-            detected.append(skill)
-    
-    return detected
+    profile = profile or get_profile()
+    return profile.skill_extractor.extract(text)
 
 
 # ============================================
 # KEYWORD SCORE CALCULATION
 # ============================================
 
-def calculate_keyword_score(job_text: str, user_skills: List[str] = None) -> Tuple[float, dict]:
+def calculate_keyword_score(job_text: str, user_skills: List[str] = None,
+                            profile: CompiledProfile = None) -> Tuple[float, dict]:
     """
     Calculate keyword matching score between job requirements and user skills.
     
     Args:
         job_text: Full job description text
-        user_skills: List of user's skills (if None, uses default profile)
+        user_skills: List of user's skills (if None, uses the profile's)
+        profile: Scoring profile (default: the active profile)
     
     Returns:
         Tuple of (keyword_score, metadata_dict)
         - keyword_score: float between 0 and 1
         - metadata: dict with 'required', 'matched', 'missing' skills
     """
-    # Default user profile (can be customized)
-    if user_skills is None:
-        user_skills = [
-            "python", "sql", "excel", "power bi", "tableau",
-            "pandas", "data visualization", "statistics"
-        ]
+    profile = profile or get_profile()
     
     # Extract required skills from job
-    required_skills = extract_skills_from_text(job_text)
+    required_skills = extract_skills_from_text(job_text, profile)
+    
+    return _score_required_skills(required_skills, user_skills, profile)
+
+
+def _score_required_skills(required_skills: List[str], user_skills: Optional[List[str]],
+                           profile: CompiledProfile) -> Tuple[float, dict]:
+    """calculate_keyword_score for skills already extracted from a job"""
+    if user_skills is None:
+        user_skills = profile.user_skills
     
     # If no skills detected in job, return neutral score
     if not required_skills:
-        return DEFAULT_KEYWORD_SCORE, {
+        return profile.default_keyword_score, {
             'required': [],
             'matched': [],
             'missing': [],
-            'match_rate': DEFAULT_KEYWORD_SCORE
+            'match_rate': profile.default_keyword_score
         }
     
     # Find matched skills
-    user_skills_lower = [s.lower() for s in user_skills]
+    user_skills_lower = {profile.skill_extractor.canonical(s) for s in user_skills}
     matched_skills = [s for s in required_skills if s in user_skills_lower]
     missing_skills = [s for s in required_skills if s not in user_skills_lower]
     
@@ -111,29 +100,60 @@ def calculate_keyword_score(job_text: str, user_skills: List[str] = None) -> Tup
     return round(keyword_score, 4), metadata
 
 
+def cached_keyword_score(job_text: str, profile: CompiledProfile = None) -> Tuple[float, dict]:
+    """
+    calculate_keyword_score for a profile's own skills, memoized across runs.
+    
+    Args:
+        job_text: Full job description text
+        profile: Scoring profile (default: the active profile)
+    
+    Returns:
+        Same as calculate_keyword_score
+    """
+    profile = profile or get_profile()
+    cache = get_score_cache()
+    if cache is None:
+        return calculate_keyword_score(job_text, profile=profile)
+    
+    key = content_hash(job_text)
+    cached = cache.get("keyword", profile.keyword_version, key)
+    if cached is not None:
+        return cached[0], cached[1]
+    
+    keyword_score, metadata = calculate_keyword_score(job_text, profile=profile)
+    cache.put("keyword", profile.keyword_version, key, [keyword_score, metadata])
+    return keyword_score, metadata
+
+
 # ============================================
 # HYBRID SCORE CALCULATION
 # ============================================
 
-def calculate_hybrid_score(ai_score: float, keyword_score: float) -> float:
+def calculate_hybrid_score(ai_score: float, keyword_score: float,
+                           profile: CompiledProfile = None) -> float:
     """
     Combine AI semantic score with keyword matching score.
     
-    Formula: Hybrid = (0.7 * AI_Score) + (0.3 * Keyword_Score)
+    Formula: Hybrid = (ai_weight * AI_Score) + (keyword_weight * Keyword_Score)
+    (0.7 / 0.3 in the default profile)
     
     Args:
         ai_score: Existing AI semantic similarity score (0-1)
         keyword_score: Keyword matching score (0-1)
+        profile: Scoring profile (default: the active profile)
     
     Returns:
         float: Hybrid score between 0 and 1
     """
+    profile = profile or get_profile()
+    
     # Ensure inputs are valid
     ai_score = max(0.0, min(1.0, ai_score))
     keyword_score = max(0.0, min(1.0, keyword_score))
     
     # Weighted combination
-    hybrid_score = (AI_WEIGHT * ai_score) + (KEYWORD_WEIGHT * keyword_score)
+    hybrid_score = (profile.ai_weight * ai_score) + (profile.keyword_weight * keyword_score)
     
     # Clamp final score
     hybrid_score = max(0.0, min(1.0, hybrid_score))
@@ -145,13 +165,14 @@ def calculate_hybrid_score(ai_score: float, keyword_score: float) -> float:
 # CONVENIENCE FUNCTION
 # ============================================
 
-def add_hybrid_score_to_job(job: dict) -> dict:
+def add_hybrid_score_to_job(job: dict, profile: CompiledProfile = None) -> dict:
     """
     Add hybrid score to a job dict that already has 'ai_score'.
     This is the main integration point.
     
     Args:
         job: Job dict with at least 'ai_score', 'title', 'description'
+        profile: Scoring profile (default: the active profile)
     
     Returns:
         Same job dict with added fields:
@@ -159,6 +180,8 @@ def add_hybrid_score_to_job(job: dict) -> dict:
         - 'hybrid_score': float
         - 'skill_match': dict with match metadata
     """
+    profile = profile or get_profile()
+    
     # Get existing AI score
     ai_score = job.get('ai_score', 0.0)
     
@@ -170,10 +193,10 @@ def add_hybrid_score_to_job(job: dict) -> dict:
     job_text = f"{job.get('title', '')} {job.get('description', '')}"
     
     # Calculate keyword score
-    keyword_score, skill_metadata = calculate_keyword_score(job_text)
+    keyword_score, skill_metadata = cached_keyword_score(job_text, profile)
     
     # Calculate hybrid score
-    hybrid_score = calculate_hybrid_score(ai_score, keyword_score)
+    hybrid_score = calculate_hybrid_score(ai_score, keyword_score, profile)
     
     # Add to job dict (NON-DESTRUCTIVE)
     job['keyword_score'] = keyword_score
@@ -187,18 +210,89 @@ def add_hybrid_score_to_job(job: dict) -> dict:
 # BATCH PROCESSING
 # ============================================
 
-def add_hybrid_scores_to_jobs(jobs: List[dict]) -> List[dict]:
+def add_hybrid_scores_to_jobs(jobs: List[dict], profile: CompiledProfile = None) -> List[dict]:
     """
     Add hybrid scores to a list of jobs.
     Safe to call even if jobs don't have AI scores yet.
     
     Args:
         jobs: List of job dicts
+        profile: Scoring profile (default: the active profile)
     
     Returns:
         Same list with hybrid scores added
     """
+    profile = profile or get_profile()
+    for job in jobs:
+        add_hybrid_score_to_job(job, profile)
+    
+    return jobs
+
+
+# ============================================
+# MULTI-PROFILE SCORING
+# ============================================
+
+def keyword_score_matrix(jobs: List[dict], profiles: ProfileSet) -> List[List[Tuple[float, dict]]]:
+    """
+    Keyword scores of every job for every profile, scanning each job's text once.
+    
+    Args:
+        jobs: List of job dicts
+        profiles: Profiles to score for
+    
+    Returns:
+        jobs x profiles matrix of (keyword_score, metadata), equal to
+        cached_keyword_score(job_text, profile)
+    """
+    cache = get_score_cache()
+    matrix = []
+    
     for job in jobs:
-        add_hybrid_score_to_job(job)
+        job_text = f"{job.get('title', '')} {job.get('description', '')}"
+        key = content_hash(job_text)
+        
+        row = [None] * len(profiles)
+        if cache is not None:
+            for p, profile in enumerate(profiles):
+                cached = cache.get("keyword", profile.keyword_version, key)
+                if cached is not None:
+                    row[p] = (cached[0], cached[1])
+        
+        if None in row:
+            # One scan finds the skill forms of every profile
+            forms = profiles.skill_scanner.find_forms(job_text)
+            for p, profile in enumerate(profiles):
+                if row[p] is None:
+                    required_skills = profile.skill_extractor.skills_for_forms(forms)
+                    row[p] = _score_required_skills(required_skills, None, profile)
+                    if cache is not None:
+                        cache.put("keyword", profile.keyword_version, key, list(row[p]))
+        
+        matrix.append(row)
+    
+    return matrix
+
+
+def add_hybrid_scores_for_profiles(jobs: List[dict], profiles: ProfileSet) -> List[dict]:
+    """
+    Add per-profile keyword and hybrid scores.
+    
+    Args:
+        jobs: List of job dicts; job['profile_scores'][p] holds profile p's
+              scores (its 'ai_score' is used when present)
+        profiles: Profiles to score for
+    
+    Returns:
+        Same list with 'keyword_score', 'hybrid_score' and 'skill_match'
+        added to each job's profile_scores entries
+    """
+    for job, row in zip(jobs, keyword_score_matrix(jobs, profiles)):
+        entries = job.setdefault('profile_scores', [{} for _ in profiles])
+        for entry, profile, (keyword_score, skill_metadata) in zip(entries, profiles, row):
+            ai_score = entry.get('ai_score') or 0.0
+            entry['keyword_score'] = keyword_score
+            entry['hybrid_score'] = calculate_hybrid_score(ai_score, keyword_score, profile)
+            entry['skill_match'] = skill_metadata
     
     return jobs
@@ -2,52 +2,79 @@ import os
 import re
 import json
 import csv
-import requests
-from bs4 import BeautifulSoup
 from datetime import datetime
+from collections import Counter
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 import time
 
+from http_client import fetch_if_changed, http_post, save_page_cache
+from high_water import get_high_water_marks, save_high_water_marks
+from history_store import HistoryJournal, SeenStore
+from job_keys import canonical_job_key
+from near_dedup import NearDuplicateIndex, dedupe_group, job_features
+from page_parsers import parse_page
+from score_cache import save_score_cache
+from keyword_matcher import KeywordMatcher
+from metrics import metrics, write_run_metrics
+
 # ============ CONFIG ============
 TOKEN = os.getenv("BOT_TOKEN")
 CHAT_ID = os.getenv("CHAT_ID")
 TELEGRAM_API = f"https://api.telegram.org/bot{TOKEN}/sendMessage"
 
-# ============================================
-# OPTIONAL AI MATCHER (SAFE / NON-BREAKING)
-# ============================================
-try:
-    from ai_matcher import get_ai_matcher
-    AI_ENABLED = True
-    print("✅ AI matcher module loaded")
-except Exception as e:
-    AI_ENABLED = False
-    print(f"⚠️ AI matcher disabled: {e}")
+# Collection: fan out every (source, query) fetch over a bounded pool.
+# Set CONCURRENT_COLLECTION=0 to fall back to one-at-a-time collection.
+CONCURRENT_COLLECTION = os.getenv("CONCURRENT_COLLECTION", "1") != "0"
+MAX_WORKERS = int(os.getenv("COLLECT_WORKERS", "8"))
 
-# ============================================
-# OPTIONAL HYBRID SCORER (SAFE / NON-BREAKING)
-# ============================================
-try:
-    from hybrid_scorer import add_hybrid_scores_to_jobs
-    HYBRID_ENABLED = True
-    print("✅ Hybrid scorer module loaded")
-except Exception as e:
-    HYBRID_ENABLED = False
-    print(f"⚠️ Hybrid scorer disabled: {e}")
+# Pagination: at most MAX_PAGES pages per (source, query); a query stops
+# at the first page that lists nothing new
+MAX_PAGES = int(os.getenv("MAX_PAGES", "5"))
 
 # ============================================
-# OPTIONAL COMPANY RANKER (SAFE / NON-BREAKING)
+# OPTIONAL SCORERS (SAFE / NON-BREAKING)
 # ============================================
-try:
-    from company_ranker import (
-        add_company_scores_to_jobs,
-        calculate_final_rank,
-        should_send_telegram_alert
-    )
-    COMPANY_RANKER_ENABLED = True
-    print("✅ Company ranker module loaded")
-except Exception as e:
-    COMPANY_RANKER_ENABLED = False
-    print(f"⚠️ Company ranker disabled: {e}")
+# Imported by load_scorers() when a run first needs them, not at startup.
+# None = not loaded yet; False = the module failed to import.
+AI_ENABLED = None
+HYBRID_ENABLED = None
+COMPANY_RANKER_ENABLED = None
+
+def load_scorers():
+    """Import the AI matcher, hybrid scorer and company ranker (once)"""
+    global AI_ENABLED, HYBRID_ENABLED, COMPANY_RANKER_ENABLED
+    global add_ai_scores_for_profiles, add_hybrid_scores_for_profiles
+    global add_company_scores_for_profiles, should_send_telegram_alert
+    
+    if AI_ENABLED is None:
+        try:
+            from ai_matcher import add_ai_scores_for_profiles
+            AI_ENABLED = True
+            print("✅ AI matcher module loaded")
+        except Exception as e:
+            AI_ENABLED = False
+            print(f"⚠️ AI matcher disabled: {e}")
+    
+    if HYBRID_ENABLED is None:
+        try:
+            from hybrid_scorer import add_hybrid_scores_for_profiles
+            HYBRID_ENABLED = True
+            print("✅ Hybrid scorer module loaded")
+        except Exception as e:
+            HYBRID_ENABLED = False
+            print(f"⚠️ Hybrid scorer disabled: {e}")
+    
+    if COMPANY_RANKER_ENABLED is None:
+        try:
+            from company_ranker import (
+                add_company_scores_for_profiles,
+                should_send_telegram_alert
+            )
+            COMPANY_RANKER_ENABLED = True
+            print("✅ Company ranker module loaded")
+        except Exception as e:
+            COMPANY_RANKER_ENABLED = False
+            print(f"⚠️ Company ranker disabled: {e}")
 
 # EXPANDED Location preferences
 PREFERRED_LOCATIONS = [
@@ -70,59 +97,163 @@ STIPEND_KEYWORDS = [
     "compensation", "pay", "remuneration", "package", "ctc"
 ]
 
+DA_ROLE_KEYWORDS = [
+    "data analyst", "business analyst", "analytics intern", 
+    "data analytics", "bi analyst", "business intelligence",
+    "data intern", "analytics", "analyst intern", "ba intern",
+    "junior analyst", "associate analyst", "analyst trainee"
+]
+
+SENIOR_TITLE_KEYWORDS = [
+    "senior", "sr.", "lead", "principal", "director", 
+    "head", "vp", "vice president", "chief"
+]
+
+SENIOR_TEXT_KEYWORDS = ["senior", "experienced", "5+ year", "3+ year"]
+
+# Compiled once: every filter check below reuses it
+JOB_KEYWORDS = KeywordMatcher({
+    "role": DA_ROLE_KEYWORDS,
+    "senior_title": SENIOR_TITLE_KEYWORDS,
+    "entry": INTERNSHIP_KEYWORDS,
+    "senior": SENIOR_TEXT_KEYWORDS,
+    "location": PREFERRED_LOCATIONS,
+    "stipend": STIPEND_KEYWORDS,
+    "unpaid": ["unpaid"],
+})
+
 # File paths
-HISTORY_FILE = "jobs_history.json"
+HISTORY_FILE = "jobs_history.jsonl"
+LEGACY_HISTORY_FILE = "jobs_history.json"  # pre-journal format, migrated on load
 CSV_FILE = "jobs_dataset.csv"
 
+# History retention
+HISTORY_MAX_LINKS = 10000   # oldest links are evicted beyond this
+HISTORY_TTL_DAYS = None     # e.g. 90 to forget links after 90 days
+
+# Keys of every job seen on a listing page (sent or not), for early
+# pagination stops. A crawler cache, so it lives under .cache
+LISTED_FILE = os.path.join(".cache", "listed_jobs.jsonl")
+LISTED_MAX_KEYS = 50000
+LISTED_TTL_DAYS = 30
+
 # ============ LEVEL 1: MEMORY SYSTEM ============
 
+def _empty_history():
+    return {
+        "sent_links": SeenStore(HISTORY_MAX_LINKS, HISTORY_TTL_DAYS),
+        "last_updated": None,
+        "journal": HistoryJournal(HISTORY_FILE),
+        "listed": SeenStore(LISTED_MAX_KEYS, LISTED_TTL_DAYS),
+        "listed_journal": HistoryJournal(LISTED_FILE)
+    }
+
+def _load_legacy_history(history):
+    """
+    Import the old single-document jobs_history.json, write it to the
+    journal right away (a run that keeps no job must still leave one
+    behind) and delete the old file.
+    """
+    with open(LEGACY_HISTORY_FILE, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    
+    if not isinstance(data, dict) or "sent_links" not in data:
+        return history
+    
+    # Files written before timestamps were tracked only have links
+    last_updated = data.get("last_updated")
+    default_time = datetime.fromisoformat(last_updated).timestamp() if last_updated else None
+    
+    history["sent_links"] = SeenStore.from_lists(
+        [canonical_job_key(link) for link in data.get("sent_links", [])],
+        data.get("sent_at"),
+        default_time=default_time,
+        max_links=HISTORY_MAX_LINKS,
+        ttl_days=HISTORY_TTL_DAYS
+    )
+    history["sent_links"].expire()
+    history["last_updated"] = last_updated
+    
+    print(f"📦 Migrating {LEGACY_HISTORY_FILE} to {HISTORY_FILE}")
+    try:
+        history["journal"].compact(history["sent_links"], last_updated)
+        os.remove(LEGACY_HISTORY_FILE)
+    except Exception as e:
+        # Keep the old file; the next save rewrites the whole journal
+        print(f"⚠️ Error migrating history: {e}")
+        history["journal"].line_count = float("inf")
+    return history
+
 def load_history():
-    """Load sent jobs history from JSON file"""
-    if not os.path.exists(HISTORY_FILE):
-        return {"sent_links": [], "last_updated": None}
+    """Stream sent jobs history from the JSONL journal into a SeenStore"""
+    history = _empty_history()
     
     try:
-        with open(HISTORY_FILE, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-            if not isinstance(data, dict) or "sent_links" not in data:
-                return {"sent_links": [], "last_updated": None}
-            return data
+        if history["journal"].exists():
+            history["last_updated"] = history["journal"].load(history["sent_links"], canonical_job_key)
+        elif os.path.exists(LEGACY_HISTORY_FILE):
+            history = _load_legacy_history(history)
     except Exception as e:
         print(f"⚠️ Error loading history: {e}")
-        return {"sent_links": [], "last_updated": None}
+        return _empty_history()
+    
+    try:
+        if history["listed_journal"].exists():
+            history["listed_journal"].load(history["listed"])
+    except Exception as e:
+        print(f"⚠️ Error loading listed jobs: {e}")
+        history["listed"] = SeenStore(LISTED_MAX_KEYS, LISTED_TTL_DAYS)
+    
+    return history
 
 def save_history(history):
-    """Save sent jobs history to JSON file"""
+    """Append this run's newly sent jobs to the history journal"""
     try:
         history["last_updated"] = datetime.now().isoformat()
-        with open(HISTORY_FILE, 'w', encoding='utf-8') as f:
-            json.dump(history, f, indent=2, ensure_ascii=False)
-        print(f"💾 History saved: {len(history['sent_links'])} jobs tracked")
+        store = history["sent_links"]
+        journal = history["journal"]
+        new_entries = store.pop_new()
+        
+        if journal.needs_compaction(store):
+            journal.compact(store, history["last_updated"])
+            print(f"💾 History compacted: {len(store)} jobs tracked")
+        else:
+            journal.append(new_entries, history["last_updated"])
+            print(f"💾 History saved: +{len(new_entries)} new, {len(store)} jobs tracked")
     except Exception as e:
         print(f"⚠️ Error saving history: {e}")
 
+def save_listed(history):
+    """Append this run's newly listed job keys to the listing journal"""
+    try:
+        store = history["listed"]
+        journal = history["listed_journal"]
+        new_entries = store.pop_new()
+        now = datetime.now().isoformat()
+        os.makedirs(os.path.dirname(LISTED_FILE), exist_ok=True)
+        
+        if journal.needs_compaction(store):
+            journal.compact(store, now)
+        elif new_entries:
+            journal.append(new_entries, now)
+    except Exception as e:
+        print(f"⚠️ Error saving listed jobs: {e}")
+
 def is_new_job(link, history):
-    """Check if job was already sent before"""
-    return link not in history.get("sent_links", [])
+    """Check if job was already sent before (O(1) lookup on its canonical key)"""
+    return canonical_job_key(link) not in history["sent_links"]
 
 def mark_as_sent(link, history):
-    """Mark job as sent and maintain history size"""
-    if "sent_links" not in history:
-        history["sent_links"] = []
-    
-    history["sent_links"].append(link)
-    
-    # Keep only last 1500 jobs (increased from 1000)
-    if len(history["sent_links"]) > 1500:
-        history["sent_links"] = history["sent_links"][-1500:]
+    """Mark job as sent by link or canonical key; oldest keys are evicted beyond the limit"""
+    history["sent_links"].add(canonical_job_key(link))
 
 # ============ LEVEL 4: CSV DATASET ============
 
-def init_csv():
+def init_csv(csv_file=CSV_FILE):
     """Initialize CSV file with headers if it doesn't exist"""
-    if not os.path.exists(CSV_FILE):
+    if not os.path.exists(csv_file):
         try:
-            with open(CSV_FILE, 'w', newline='', encoding='utf-8') as f:
+            with open(csv_file, 'w', newline='', encoding='utf-8') as f:
                 writer = csv.writer(f)
                 writer.writerow([
                     'date', 'title', 'source', 'link', 
@@ -131,17 +262,18 @@ def init_csv():
                     'company_score', 'final_rank_score',
                     'keyword_pass', 'final_decision'
                 ])
-            print(f"📊 Created CSV dataset: {CSV_FILE}")
+            print(f"📊 Created CSV dataset: {csv_file}")
         except Exception as e:
             print(f"⚠️ Error creating CSV: {e}")
 
-def save_to_csv(jobs):
+@metrics.timed("csv_write")
+def save_to_csv(jobs, csv_file=CSV_FILE):
     """Append jobs to CSV dataset"""
     if not jobs:
         return
     
     try:
-        with open(CSV_FILE, 'a', newline='', encoding='utf-8') as f:
+        with open(csv_file, 'a', newline='', encoding='utf-8') as f:
             writer = csv.writer(f)
             for job in jobs:
                 writer.writerow([
@@ -160,23 +292,27 @@ def save_to_csv(jobs):
                     True,
                     'Sent'
                 ])
-        print(f"💾 Saved {len(jobs)} jobs to CSV dataset")
+        metrics.incr("csv.rows", len(jobs))
+        print(f"💾 Saved {len(jobs)} jobs to CSV dataset {csv_file}")
     except Exception as e:
+        metrics.incr("csv.errors")
         print(f"⚠️ Error saving to CSV: {e}")
 
 # ============ TELEGRAM ============
 
-def send_telegram(msg):
-    """Send message to Telegram with error handling"""
-    if not TOKEN or not CHAT_ID:
+@metrics.timed("telegram_send")
+def send_telegram(msg, chat_id=None):
+    """Send message to Telegram with error handling (default chat: CHAT_ID)"""
+    chat_id = chat_id or CHAT_ID
+    if not TOKEN or not chat_id:
         print("❌ Telegram credentials missing")
         return False
     
     try:
-        response = requests.post(
+        response = http_post(
             TELEGRAM_API,
             data={
-                "chat_id": CHAT_ID, 
+                "chat_id": chat_id, 
                 "text": msg[:4000],
                 "parse_mode": "HTML",
                 "disable_web_page_preview": True
@@ -185,338 +321,242 @@ def send_telegram(msg):
         )
         
         if response.status_code == 200:
+            metrics.incr("telegram.sent")
             print("✅ Telegram message sent successfully")
             return True
         else:
+            metrics.incr("telegram.failed")
             print(f"❌ Telegram failed: {response.status_code}")
             return False
-            
+    
     except Exception as e:
+        metrics.incr("telegram.failed")
         print(f"❌ Telegram error: {e}")
         return False
 
 # ============ JOB SOURCES ============
 
-def indeed_jobs():
-    """Indeed RSS - Multiple search variations"""
+INDEED_QUERIES = [
+    "data+analyst+intern",
+    "business+analyst+intern",
+    "data+analytics+intern",
+    "junior+data+analyst"
+]
+
+INTERNSHALA_URLS = [
+    "https://internshala.com/internships/data-analyst-internship/",
+    "https://internshala.com/internships/business-analyst-internship/",
+    "https://internshala.com/internships/data-analytics-internship/"
+]
+
+LINKEDIN_QUERIES = [
+    "data%20analyst%20intern",
+    "business%20analyst%20intern",
+    "data%20analytics%20intern",
+    "junior%20data%20analyst"
+]
+
+NAUKRI_QUERIES = [
+    "data-analyst-intern-jobs",
+    "business-analyst-intern-jobs",
+    "junior-data-analyst-jobs"
+]
+
+INSTAHYRE_QUERIES = [
+    "data%20analyst"
+]
+
+# Result offsets per page for portals paginated with start=
+INDEED_PAGE_SIZE = 10
+LINKEDIN_PAGE_SIZE = 25
+
+def _page_label(page):
+    """Suffix for fetch progress lines"""
+    return f" page {page + 1}" if page else ""
+
+@metrics.timed("fetch.Indeed")
+def fetch_indeed(query, page=0):
+    """Indeed RSS - Single search query, one results page"""
     jobs = []
     
-    queries = [
-        "data+analyst+intern",
-        "business+analyst+intern",
-        "data+analytics+intern",
-        "junior+data+analyst"
-    ]
+    try:
+        # Incremental: only postings since the last successful run
+        marks = get_high_water_marks()
+        since = marks.since("Indeed")
+        
+        url = f"https://in.indeed.com/rss?q={query}&l=India"
+        if since is not None:
+            url += f"&fromage={marks.window_days('Indeed')}"
+        if page:
+            url += f"&start={page * INDEED_PAGE_SIZE}"
+        print(f"🔍 Fetching Indeed ({query.replace('+', ' ')}){_page_label(page)}...")
+        
+        response = fetch_if_changed(url, timeout=15)
+        if response is None:
+            print(f"   ♻️ Indeed page unchanged since last run, skipping parse")
+            return jobs
+        
+        jobs = parse_page("Indeed", response.content, since)
     
-    for query in queries:
-        try:
-            url = f"https://in.indeed.com/rss?q={query}&l=India"
-            print(f"🔍 Fetching Indeed ({query.replace('+', ' ')})...")
-            
-            response = requests.get(url, timeout=15)
-            response.raise_for_status()
-            
-            soup = BeautifulSoup(response.content, "xml")
-            
-            for item in soup.find_all("item")[:10]:
-                try:
-                    title = item.title.text.strip() if item.title else ""
-                    link = item.link.text.strip() if item.link else ""
-                    description = item.description.text if item.description else ""
-                    
-                    if title and link:
-                        jobs.append({
-                            "title": title,
-                            "link": link,
-                            "source": "Indeed",
-                            "description": description,
-                            "location": "",
-                            "stipend": ""
-                        })
-                except:
-                    continue
-            
-            time.sleep(1)
-            
-        except Exception as e:
-            print(f"   ⚠️ Indeed query failed: {e}")
-            continue
+    except Exception as e:
+        print(f"   ⚠️ Indeed query failed: {e}")
+        get_high_water_marks().record_failure("Indeed")
     
-    print(f"   ✅ Indeed total: {len(jobs)} jobs found")
     return jobs
 
-def internshala_jobs():
-    """Internshala - Multiple search pages"""
+@metrics.timed("fetch.Internshala")
+def fetch_internshala(url, page=0):
+    """Internshala - Single category page (later pages at /page-N/)"""
     jobs = []
     
-    urls = [
-        "https://internshala.com/internships/data-analyst-internship/",
-        "https://internshala.com/internships/business-analyst-internship/",
-        "https://internshala.com/internships/data-analytics-internship/"
-    ]
+    try:
+        if page:
+            url = f"{url.rstrip('/')}/page-{page + 1}/"
+        print(f"🔍 Fetching Internshala{_page_label(page)}...")
+        
+        response = fetch_if_changed(url, timeout=15)
+        if response is None:
+            print(f"   ♻️ Internshala page unchanged since last run, skipping parse")
+            return jobs
+        
+        jobs = parse_page("Internshala", response.text)
     
-    for url in urls:
-        try:
-            print(f"🔍 Fetching Internshala...")
-            
-            headers = {
-                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
-            }
-            
-            response = requests.get(url, headers=headers, timeout=15)
-            response.raise_for_status()
-            
-            soup = BeautifulSoup(response.text, "html.parser")
-            
-            containers = (
-                soup.select(".internship_meta") or
-                soup.select(".individual_internship") or
-                soup.find_all("div", class_=lambda x: x and "internship" in x.lower())
-            )
-            
-            for container in containers[:10]:
-                try:
-                    title_elem = (
-                        container.select_one(".job-internship-name") or
-                        container.select_one(".profile h3") or
-                        container.select_one("h3") or
-                        container.find("a")
-                    )
-                    
-                    if not title_elem:
-                        continue
-                    
-                    title = title_elem.get_text(strip=True)
-                    link_elem = container.select_one("a[href*='/internship/detail/']") or container.find("a", href=True)
-                    
-                    if not link_elem or not link_elem.get("href"):
-                        continue
-                    
-                    href = link_elem["href"]
-                    link = "https://internshala.com" + href if href.startswith("/") else href
-                    
-                    location_elem = container.select_one(".location_link")
-                    location = location_elem.get_text(strip=True) if location_elem else ""
-                    
-                    stipend_elem = container.select_one(".stipend")
-                    stipend = stipend_elem.get_text(strip=True) if stipend_elem else ""
-                    
-                    jobs.append({
-                        "title": title,
-                        "link": link,
-                        "source": "Internshala",
-                        "description": f"{location} {stipend}",
-                        "location": location,
-                        "stipend": stipend
-                    })
-                    
-                except:
-                    continue
-            
-            time.sleep(1)
-            
-        except Exception as e:
-            print(f"   ⚠️ Internshala failed: {e}")
-            continue
+    except Exception as e:
+        print(f"   ⚠️ Internshala failed: {e}")
+        get_high_water_marks().record_failure("Internshala")
     
-    print(f"   ✅ Internshala total: {len(jobs)} jobs found")
     return jobs
 
-def linkedin_jobs():
-    """LinkedIn Jobs - Multiple searches with enhanced data extraction"""
+@metrics.timed("fetch.LinkedIn")
+def fetch_linkedin(query, page=0):
+    """LinkedIn Jobs - Single search with enhanced data extraction, one results page"""
     jobs = []
     
-    queries = [
-        "data%20analyst%20intern",
-        "business%20analyst%20intern",
-        "data%20analytics%20intern",
-        "junior%20data%20analyst"
-    ]
+    try:
+        # Incremental: f_TPR=r<seconds> limits results to recent postings
+        marks = get_high_water_marks()
+        since = marks.since("LinkedIn")
+        
+        url = f"https://www.linkedin.com/jobs/search/?keywords={query}&location=India"
+        if since is not None:
+            url += f"&f_TPR=r{marks.window_seconds('LinkedIn')}"
+        if page:
+            url += f"&start={page * LINKEDIN_PAGE_SIZE}"
+        print(f"🔍 Fetching LinkedIn{_page_label(page)}...")
+        
+        response = fetch_if_changed(url, timeout=15)
+        if response is None:
+            print(f"   ♻️ LinkedIn page unchanged since last run, skipping parse")
+            return jobs
+        
+        jobs = parse_page("LinkedIn", response.text, since)
     
-    for query in queries:
-        try:
-            url = f"https://www.linkedin.com/jobs/search/?keywords={query}&location=India"
-            print(f"🔍 Fetching LinkedIn...")
-            
-            headers = {
-                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
-            }
-            
-            response = requests.get(url, headers=headers, timeout=15)
-            response.raise_for_status()
-            
-            soup = BeautifulSoup(response.text, "html.parser")
-            job_cards = soup.select("div.base-card")
-            
-            for card in job_cards[:10]:
-                try:
-                    title_elem = card.select_one("h3")
-                    link_elem = card.select_one("a.base-card__full-link")
-                    
-                    if not title_elem or not link_elem:
-                        continue
-                    
-                    title = title_elem.get_text(strip=True)
-                    link = link_elem.get("href", "").split("?")[0]
-                    
-                    if not link:
-                        continue
-                    
-                    # Enhanced: Extract company name
-                    company_elem = card.select_one("h4.base-search-card__subtitle")
-                    company = company_elem.get_text(strip=True) if company_elem else ""
-                    
-                    # Enhanced: Extract job snippet/preview text
-                    snippet_elem = card.select_one(".base-search-card__snippet")
-                    snippet = snippet_elem.get_text(strip=True) if snippet_elem else ""
-                    
-                    # Check for easy apply
-                    easy_apply = bool(
-                        card.select_one(".job-card-container__apply-method") or
-                        "easyApply" in card.get_text()
-                    )
-                    
-                    # Extract location
-                    location_elem = card.select_one(".job-card-container__metadata-item")
-                    location = location_elem.get_text(strip=True) if location_elem else ""
-                    
-                    # Enhanced description: combine company + location + snippet
-                    description_parts = [p for p in [company, location, snippet] if p]
-                    description = " • ".join(description_parts)
-                    
-                    jobs.append({
-                        "title": title,
-                        "link": link,
-                        "source": "LinkedIn",
-                        "easy_apply": easy_apply,
-                        "location": location,
-                        "description": description,
-                        "stipend": "",
-                        "company": company
-                    })
-                    
-                except:
-                    continue
-            
-            time.sleep(1)
-            
-        except Exception as e:
-            print(f"   ⚠️ LinkedIn query failed: {e}")
-            continue
+    except Exception as e:
+        print(f"   ⚠️ LinkedIn query failed: {e}")
+        get_high_water_marks().record_failure("LinkedIn")
     
-    print(f"   ✅ LinkedIn total: {len(jobs)} jobs found")
     return jobs
 
-def naukri_jobs():
-    """Naukri - Multiple searches"""
+@metrics.timed("fetch.Naukri")
+def fetch_naukri(query, page=0):
+    """Naukri - Single search (later pages at <query>-N)"""
     jobs = []
     
-    queries = [
-        "data-analyst-intern-jobs",
-        "business-analyst-intern-jobs",
-        "junior-data-analyst-jobs"
-    ]
+    try:
+        url = f"https://www.naukri.com/{query}"
+        if page:
+            url += f"-{page + 1}"
+        
+        # Incremental: jobAge=<days> limits results to recent postings
+        marks = get_high_water_marks()
+        if marks.since("Naukri") is not None:
+            url += f"?jobAge={marks.window_days('Naukri')}"
+        print(f"🔍 Fetching Naukri{_page_label(page)}...")
+        
+        response = fetch_if_changed(url, timeout=15)
+        if response is None:
+            print(f"   ♻️ Naukri page unchanged since last run, skipping parse")
+            return jobs
+        
+        jobs = parse_page("Naukri", response.text)
     
-    for query in queries:
-        try:
-            url = f"https://www.naukri.com/{query}"
-            print(f"🔍 Fetching Naukri...")
-            
-            headers = {
-                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
-            }
-            
-            response = requests.get(url, headers=headers, timeout=15)
-            response.raise_for_status()
-            
-            soup = BeautifulSoup(response.text, "html.parser")
-            job_articles = soup.select("article.jobTuple") or soup.find_all("article")
-            
-            for article in job_articles[:10]:
-                try:
-                    title_elem = article.select_one("a.title") or article.select_one("a")
-                    
-                    if not title_elem:
-                        continue
-                    
-                    title = title_elem.get_text(strip=True)
-                    link = title_elem.get("href", "")
-                    
-                    if not link or not link.startswith("http"):
-                        continue
-                    
-                    location_elem = article.select_one(".location")
-                    location = location_elem.get_text(strip=True) if location_elem else ""
-                    
-                    jobs.append({
-                        "title": title,
-                        "link": link,
-                        "source": "Naukri",
-                        "location": location,
-                        "description": location,
-                        "stipend": ""
-                    })
-                    
-                except:
-                    continue
-            
-            time.sleep(1)
-            
-        except Exception as e:
-            print(f"   ⚠️ Naukri query failed: {e}")
-            continue
+    except Exception as e:
+        print(f"   ⚠️ Naukri query failed: {e}")
+        get_high_water_marks().record_failure("Naukri")
     
-    print(f"   ✅ Naukri total: {len(jobs)} jobs found")
     return jobs
 
-def instahyre_jobs():
-    """Instahyre - NEW SOURCE"""
+@metrics.timed("fetch.Instahyre")
+def fetch_instahyre(query, page=0):
+    """Instahyre - Single search (results load by script, so one page only)"""
+    jobs = []
+    
     try:
-        url = "https://www.instahyre.com/search-jobs/?q=data%20analyst&experience=0-1"
+        url = f"https://www.instahyre.com/search-jobs/?q={query}&experience=0-1"
         print(f"🔍 Fetching Instahyre...")
         
-        headers = {
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
-        }
-        
-        response = requests.get(url, headers=headers, timeout=15)
-        response.raise_for_status()
-        
-        soup = BeautifulSoup(response.text, "html.parser")
-        jobs = []
-        
-        job_cards = soup.find_all("div", class_=lambda x: x and "opportunity-card" in str(x).lower())
-        
-        for card in job_cards[:15]:
-            try:
-                title_elem = card.find("a", href=lambda x: x and "/job/" in str(x))
-                if not title_elem:
-                    continue
-                
-                title = title_elem.get_text(strip=True)
-                link = "https://www.instahyre.com" + title_elem.get("href", "")
-                
-                location_elem = card.find(string=re.compile("location", re.I))
-                location = location_elem.strip() if location_elem else ""
-                
-                jobs.append({
-                    "title": title,
-                    "link": link,
-                    "source": "Instahyre",
-                    "location": location,
-                    "description": location,
-                    "stipend": ""
-                })
-                
-            except:
-                continue
-        
-        print(f"   ✅ Instahyre: {len(jobs)} jobs found")
-        return jobs
+        response = fetch_if_changed(url, timeout=15)
+        if response is None:
+            print(f"   ♻️ Instahyre page unchanged since last run, skipping parse")
+            return jobs
         
+        jobs = parse_page("Instahyre", response.text)
+    
     except Exception as e:
         print(f"   ❌ Instahyre failed: {e}")
-        return []
+        get_high_water_marks().record_failure("Instahyre")
+    
+    return jobs
+
+# Registry of (source name, per-page fetcher, queries, max pages).
+# Every (source, query) pair is an independent unit of work; its pages
+# are fetched in order until one lists nothing new.
+JOB_SOURCES = [
+    ("Indeed", fetch_indeed, INDEED_QUERIES, MAX_PAGES),
+    ("Internshala", fetch_internshala, INTERNSHALA_URLS, MAX_PAGES),
+    ("LinkedIn", fetch_linkedin, LINKEDIN_QUERIES, MAX_PAGES),
+    ("Naukri", fetch_naukri, NAUKRI_QUERIES, MAX_PAGES),
+    ("Instahyre", fetch_instahyre, INSTAHYRE_QUERIES, 1),
+]
+
+def _page_exhausted(jobs, history, query_keys, run_started):
+    """
+    True once a page lists nothing new, so later pages are not fetched.
+    
+    A page is exhausted when it is empty (end of results, or unchanged
+    since the last run) or every job on it was listed or sent before this
+    run, or already appeared on an earlier page of the same query
+    (portals repeat their last page past the end).
+    Records the page's keys in history["listed"] as a side effect.
+    """
+    fresh = False
+    for job in jobs:
+        key = canonical_job_key(job.get('link', ''), job)
+        if not key or key in query_keys:
+            continue
+        query_keys.add(key)
+        
+        if history is None:
+            fresh = True
+            continue
+        
+        listed = history["listed"]
+        if not (listed.seen_before(key, run_started) or history["sent_links"].seen_before(key, run_started)):
+            fresh = True
+        if key not in listed:
+            listed.add(key)
+    
+    return not fresh
+
+def _paginate(fetch, query, max_pages, history=None, run_started=None):
+    """Yield (page, jobs) for one query until a page lists nothing new"""
+    run_started = run_started or time.time()
+    query_keys = set()
+    for page in range(max_pages):
+        jobs = fetch(query, page)
+        yield page, jobs
+        if _page_exhausted(jobs, history, query_keys, run_started):
+            break
 
 # ============ RELAXED FILTERING ============
 
@@ -524,121 +564,208 @@ def is_da_role(title):
     """RELAXED Filter for Data Analyst roles"""
     title_lower = title.lower()
     
-    positive_keywords = [
-        "data analyst", "business analyst", "analytics intern", 
-        "data analytics", "bi analyst", "business intelligence",
-        "data intern", "analytics", "analyst intern", "ba intern",
-        "junior analyst", "associate analyst", "analyst trainee"
-    ]
+    has_positive = JOB_KEYWORDS.matches("role", title_lower)
+    has_negative = JOB_KEYWORDS.matches("senior_title", title_lower)
     
-    negative_keywords = [
-        "senior", "sr.", "lead", "principal", "director", 
-        "head", "vp", "vice president", "chief"
-    ]
+    return has_positive and not has_negative
+
+def job_signals(job):
+    """
+    Entry-level, location and stipend checks in one pass.
     
-    has_positive = any(kw in title_lower for kw in positive_keywords)
-    has_negative = any(kw in title_lower for kw in negative_keywords)
+    Each job text is lowercased once and shared by every check.
     
-    return has_positive and not has_negative
+    Returns:
+        Dict with 'is_entry_level', 'location_match' and 'has_stipend'
+    """
+    title = job.get('title', '').lower()
+    description = job.get('description', '').lower()
+    location = (job.get('location') or '').lower()
+    stipend = (job.get('stipend') or '').lower()
+    
+    title_desc = f"{title} {description}"
+    desc_stipend = f"{description} {stipend}"
+    
+    matches = JOB_KEYWORDS.matches
+    return {
+        'is_entry_level': matches("entry", title_desc) or not matches("senior", title_desc),
+        'location_match': matches("location", f"{title_desc} {location}"),
+        'has_stipend': matches("stipend", desc_stipend) and not matches("unpaid", desc_stipend),
+    }
 
 def is_entry_level(job):
     """RELAXED check - More inclusive"""
-    text = f"{job.get('title', '')} {job.get('description', '')}".lower()
-    
-    is_entry = any(kw in text for kw in INTERNSHIP_KEYWORDS)
-    is_not_senior = not any(kw in text for kw in ["senior", "experienced", "5+ year", "3+ year"])
-    
-    return is_entry or is_not_senior
+    return job_signals(job)['is_entry_level']
 
 def has_location_match(job):
     """Check if location matches preferences"""
-    text = f"{job.get('title', '')} {job.get('description', '')} {job.get('location', '')}".lower()
-    return any(loc in text for loc in PREFERRED_LOCATIONS)
+    return job_signals(job)['location_match']
 
 def check_stipend(job):
     """Check if stipend is mentioned"""
-    text = f"{job.get('description', '')} {job.get('stipend', '')}".lower()
-    has_stipend = any(kw in text for kw in STIPEND_KEYWORDS)
-    
-    if "unpaid" in text:
-        return False
-    
-    return has_stipend
+    return job_signals(job)['has_stipend']
 
-def enhance_job(job):
+def enhance_job(job, signals=None):
     """Add metadata to job"""
-    job['is_entry_level'] = is_entry_level(job)
-    job['location_match'] = has_location_match(job)
-    job['has_stipend'] = check_stipend(job)
+    if signals is None:
+        signals = job_signals(job)
+    
+    job.update(signals)
     job['easy_apply'] = job.get('easy_apply', False)
     
     return job
 
-def filter_jobs(jobs, history):
-    """RELAXED Master filter"""
+def filter_jobs(jobs, history, batch_keys=None):
+    """
+    RELAXED Master filter
+    
+    batch_keys: keys already accepted this run (shared across streamed batches)
+    """
     filtered = []
+    if batch_keys is None:
+        batch_keys = set()
     
     for job in jobs:
-        if not is_new_job(job.get('link', ''), history):
+        # Re-posts and the same job found by several queries share one key
+        key = canonical_job_key(job.get('link', ''), job)
+        if key in batch_keys or not is_new_job(key, history):
             continue
         
         if not is_da_role(job.get('title', '')):
             continue
         
-        if not is_entry_level(job):
+        signals = job_signals(job)
+        if not signals['is_entry_level']:
             continue
         
-        job = enhance_job(job)
+        job = enhance_job(job, signals)
+        job['job_key'] = key
+        batch_keys.add(key)
         filtered.append(job)
     
     return filtered
 
-def dedupe_jobs(jobs):
-    """Remove duplicate jobs"""
-    seen = set()
+def dedupe_jobs(jobs, near_dup_index=None, seen=None):
+    """
+    Remove duplicate jobs: exact title repeats, then near-duplicates
+    (re-worded adverts from the same company, or the same source and
+    location when there is no company) within the batch and against
+    recent runs.
+    
+    seen: normalized titles already kept this run (shared across streamed batches)
+    """
+    if near_dup_index is None:
+        near_dup_index = NearDuplicateIndex()
+    
+    if seen is None:
+        seen = set()
     unique = []
+    near_duplicates = 0
     
     for job in jobs:
         normalized = re.sub(r'[^a-z0-9]', '', job.get("title", "").lower())
         
-        if normalized and normalized not in seen:
-            seen.add(normalized)
-            unique.append(job)
+        if not normalized or normalized in seen:
+            continue
+        
+        if near_dup_index.add_if_new(job_features(job), dedupe_group(job), job.get('job_key', '')) is not None:
+            near_duplicates += 1
+            continue
+        
+        seen.add(normalized)
+        unique.append(job)
+    
+    if near_duplicates:
+        print(f"   🧬 Near-duplicates dropped: {near_duplicates}")
     
     return unique
 
 # ============ MAIN ============
 
-def collect_all_jobs():
-    """Collect jobs from ALL sources"""
-    print(f"\n{'='*70}")
-    print(f"🚀 Job Collection Started: {datetime.now().strftime('%d %b %Y, %I:%M %p')}")
-    print(f"{'='*70}\n")
-    
-    all_jobs = []
+def _query_position(tasks, index):
+    """Position of a task within its own source's query list"""
+    name = tasks[index][0]
+    return sum(1 for task in tasks[:index] if task[0] == name)
+
+def _fetch_tasks():
+    """
+    Every (source, fetch, query, max pages) task, plus the order to start them in.
     
-    all_jobs += indeed_jobs()
-    time.sleep(2)
+    Sources are interleaved so every host's first request starts right away
+    instead of workers queueing behind one host's politeness delay.
+    """
+    tasks = [
+        (name, fetch, query, max_pages)
+        for name, fetch, queries, max_pages in JOB_SOURCES
+        for query in queries
+    ]
+    order = sorted(
+        range(len(tasks)),
+        key=lambda i: _query_position(tasks, i)
+    )
+    return tasks, order
+
+def _stream_pages(concurrent, history=None):
+    """
+    Yield (task index, page, jobs) as each page's fetch completes.
     
-    all_jobs += internshala_jobs()
-    time.sleep(2)
+    A query's next page is requested only after its current page turns
+    out to list something new. At most two fetches per worker are in
+    flight or waiting to be consumed, so memory does not grow with the
+    number of sources, queries or pages.
+    """
+    tasks, order = _fetch_tasks()
+    run_started = time.time()
     
-    all_jobs += linkedin_jobs()
-    time.sleep(2)
+    if not concurrent:
+        for i, (_, fetch, query, max_pages) in enumerate(tasks):
+            for page, jobs in _paginate(fetch, query, max_pages, history, run_started):
+                yield i, page, jobs
+        return
     
-    all_jobs += naukri_jobs()
-    time.sleep(2)
+    workers = max(1, min(MAX_WORKERS, len(tasks)))
+    queued = iter(order)
+    pending = {}      # future -> (task index, page)
+    query_keys = {}   # task index -> keys listed on its pages so far
     
-    all_jobs += instahyre_jobs()
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        def submit(i, page):
+            pending[pool.submit(tasks[i][1], tasks[i][2], page)] = (i, page)
+        
+        def submit_next_query():
+            for i in queued:
+                submit(i, 0)
+                return
+        
+        for _ in range(2 * workers):
+            submit_next_query()
+        
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                i, page = pending.pop(future)
+                jobs = future.result()
+                
+                # Every completion starts one fetch: this query's next page, or a new query
+                exhausted = _page_exhausted(jobs, history, query_keys.setdefault(i, set()), run_started)
+                if not exhausted and page + 1 < tasks[i][3]:
+                    submit(i, page + 1)
+                else:
+                    query_keys.pop(i, None)
+                    submit_next_query()
+                
+                yield i, page, jobs
+
+def format_telegram_message(jobs, total=None):
+    """
+    Format jobs for Telegram
     
-    print(f"\n{'='*70}")
-    print(f"📊 Total jobs collected: {len(all_jobs)}")
-    print(f"{'='*70}")
+    total: number of jobs the message stands for, when only the
+           first ones were kept (default: len(jobs))
+    """
+    if total is None:
+        total = len(jobs)
     
-    return all_jobs
-
-def format_telegram_message(jobs):
-    """Format jobs for Telegram"""
     if not jobs:
         return (
             "⚠️ <b>No New Jobs Today</b>\n\n"
@@ -647,7 +774,7 @@ def format_telegram_message(jobs):
             f"🕐 {datetime.now().strftime('%d %b %Y, %I:%M %p')}"
         )
     
-    msg = f"🔥 <b>{len(jobs)} New Data Analyst Opportunities</b>\n"
+    msg = f"🔥 <b>{total} New Data Analyst Opportunities</b>\n"
     msg += f"📅 {datetime.now().strftime('%d %b %Y, %I:%M %p')}\n"
     msg += f"{'─'*40}\n\n"
     
@@ -731,8 +858,8 @@ def format_telegram_message(jobs):
         
         msg += f"\n   🔗 {job['link']}\n\n"
     
-    if len(jobs) > 20:
-        msg += f"<i>...and {len(jobs) - 20} more opportunities!</i>\n\n"
+    if total > 20:
+        msg += f"<i>...and {total - 20} more opportunities!</i>\n\n"
     
     msg += f"\n{'─'*40}\n"
     msg += "💡 <b>Legend:</b>\n"
@@ -744,179 +871,307 @@ def format_telegram_message(jobs):
     
     return msg
 
-def main():
-    """Main execution"""
+# ============ SCORING PROFILES ============
+
+def load_scoring_profiles():
+    """Profiles to score for (JOB_PROFILES), or None if they cannot be loaded"""
+    load_scorers()
     try:
-        init_csv()
-        history = load_history()
-        
-        print(f"📚 Memory loaded: {len(history.get('sent_links', []))} jobs in history")
-        
-        all_jobs = collect_all_jobs()
+        from scoring_profile import load_profiles
+        profiles = load_profiles()
+        print(f"👥 Scoring for {len(profiles)} profile(s): {', '.join(p.name for p in profiles)}")
+        return profiles
+    except Exception as e:
+        print(f"⚠️ Scoring profiles unavailable (scoring disabled): {e}")
+        return None
+
+def profile_jobs(jobs, index):
+    """Jobs as one profile sees them: its scores merged into each job"""
+    views = []
+    for job in jobs:
+        view = {key: value for key, value in job.items() if key != 'profile_scores'}
+        view.update(job['profile_scores'][index])
+        views.append(view)
+    return views
+
+def set_profile_scores(jobs, **fields):
+    """Set the same fields in every profile's scores (fallback values)"""
+    for job in jobs:
+        for entry in job['profile_scores']:
+            entry.update(fields)
+
+def _fallback_company_scores(jobs):
+    """Neutral company scores when company ranking is unavailable"""
+    for job in jobs:
+        for entry in job['profile_scores']:
+            entry['company_score'] = 0.4
+            entry['company_tier'] = 3
+            entry['final_rank_score'] = (entry.get('hybrid_score') or 0) * 0.5 + 0.2
+
+def score_batch(jobs, profiles, n_targets):
+    """
+    AI, hybrid and company scores of one batch for every profile.
+    
+    A scorer that fails only costs its own scores; the batch still
+    goes through with the same fallbacks as before.
+    """
+    for job in jobs:
+        job['profile_scores'] = [{} for _ in range(n_targets)]
+    
+    # AI SCORING
+    if AI_ENABLED and profiles:
+        try:
+            with metrics.span("score.ai"):
+                add_ai_scores_for_profiles(jobs, profiles)
+        except Exception as e:
+            print(f"⚠️ AI scoring failed (continuing without scores): {e}")
+            import traceback
+            traceback.print_exc()
+            set_profile_scores(jobs, ai_score=None)
+    else:
+        set_profile_scores(jobs, ai_score=None)
+    
+    # HYBRID SCORING (COMPOSES ON AI SCORE)
+    if HYBRID_ENABLED and profiles:
+        try:
+            with metrics.span("score.hybrid"):
+                add_hybrid_scores_for_profiles(jobs, profiles)
+        except Exception as e:
+            print(f"⚠️ Hybrid scoring failed (continuing without hybrid scores): {e}")
+            import traceback
+            traceback.print_exc()
+    
+    # COMPANY RANKING & FINAL SCORE CALCULATION
+    if COMPANY_RANKER_ENABLED and profiles:
+        try:
+            with metrics.span("score.company"):
+                add_company_scores_for_profiles(jobs, profiles)
+        except Exception as e:
+            print(f"⚠️ Company ranking failed (continuing without scores): {e}")
+            import traceback
+            traceback.print_exc()
+            _fallback_company_scores(jobs)
+    else:
+        _fallback_company_scores(jobs)
+    
+    return jobs
+
+# ============ STREAMING PIPELINE ============
+# fetch+parse -> filter -> dedupe -> score -> sinks, one fetched page at a
+# time. Stages are generators over job batches, so a run never holds every
+# job at once and a page is scored and logged as soon as its fetch lands.
+
+class PipelineStats:
+    """Running counts and per-profile score sums, so no stage re-reads its jobs"""
+    
+    SCORE_FIELDS = ('ai_score', 'keyword_score', 'hybrid_score', 'company_score', 'final_rank_score')
+    STAGES = ('filter', 'dedupe', 'score.ai', 'score.hybrid', 'score.company', 'csv_write')
+    
+    def __init__(self, n_targets=1):
+        self.counts = Counter()
+        self.sources = Counter()
+        self.scores = [Counter() for _ in range(n_targets)]
+        self.started = time.monotonic()
+    
+    def add_scores(self, jobs):
+        """Fold one scored batch into the per-profile sums"""
+        for job in jobs:
+            for sums, entry in zip(self.scores, job['profile_scores']):
+                for field in self.SCORE_FIELDS:
+                    value = entry.get(field)
+                    if value is not None:
+                        sums[field] += value
+                        sums[f"{field}_count"] += 1
+                if (entry.get('ai_score') or 0) > 0:
+                    sums['ai_positive'] += 1
+                sums[f"tier_{entry.get('company_tier', 3)}"] += 1
+    
+    def average(self, index, field):
+        """Average of one score over the jobs that have it (0.0 if none)"""
+        sums = self.scores[index]
+        count = sums[f"{field}_count"]
+        return sums[field] / count if count else 0.0
+    
+    def summary(self, names):
+        """Counts and per-profile averages as a metrics record field"""
+        return {
+            "counts": dict(self.counts),
+            "sources": dict(self.sources),
+            "profiles": {
+                name: {
+                    **{f"avg_{field}": round(self.average(index, field), 4) for field in self.SCORE_FIELDS},
+                    **{f"tier_{tier}": self.scores[index][f"tier_{tier}"] for tier in (1, 2, 3)}
+                }
+                for index, name in enumerate(names)
+            }
+        }
+    
+    def report(self, labels):
+        """Print the run summary the stage-by-stage diagnostics used to print"""
+        print(f"\n{'='*70}")
+        for name, count in self.sources.items():
+            print(f"   ✅ {name} total: {count} jobs found")
+        print(f"📊 Total jobs collected: {self.counts['collected']} in {time.monotonic() - self.started:.1f}s")
+        print(f"   ✅ After filtering: {self.counts['filtered']} jobs")
+        print(f"   ✅ After deduplication: {self.counts['deduped']} jobs")
         
-        print(f"\n🔍 Filtering jobs...")
-        filtered_jobs = filter_jobs(all_jobs, history)
-        print(f"   ✅ After filtering: {len(filtered_jobs)} jobs")
+        total = self.counts['deduped']
+        for index, label in enumerate(labels):
+            sums = self.scores[index]
+            print(f"\n🤖 Scored{label} {sums['ai_positive']}/{total} jobs, average AI score {self.average(index, 'ai_score'):.3f}")
+            print(f"🧠 Average keyword score{label}: {self.average(index, 'keyword_score'):.3f}")
+            print(f"🧠 Average hybrid score{label}: {self.average(index, 'hybrid_score'):.3f}")
+            print(f"🏢 Tier 1 / 2 / 3{label}: {sums['tier_1']} / {sums['tier_2']} / {sums['tier_3']} jobs")
+            print(f"🏢 Average company score{label}: {self.average(index, 'company_score'):.3f}")
+            print(f"🏢 Average final rank{label}: {self.average(index, 'final_rank_score'):.3f}")
+        stages = ", ".join(f"{stage} {metrics.seconds(stage):.2f}s" for stage in self.STAGES)
+        print(f"\n⏱️ Stage time: {stages}")
+        print(f"{'='*70}")
+
+def stream_jobs(concurrent=None, history=None):
+    """
+    Yield each fetched page's jobs as soon as its fetch completes.
+    
+    With history, each query stops paginating at the first page that
+    lists nothing new (see _page_exhausted).
+    """
+    if concurrent is None:
+        concurrent = CONCURRENT_COLLECTION
+    
+    print(f"\n{'='*70}")
+    print(f"🚀 Job Collection Started: {datetime.now().strftime('%d %b %Y, %I:%M %p')}")
+    print(f"{'='*70}\n")
+    
+    for _, _, jobs in _stream_pages(concurrent, history):
+        yield jobs
+
+def filter_stage(batches, history, stats):
+    """Drop seen, off-role and senior jobs from each batch"""
+    batch_keys = set()
+    for jobs in batches:
+        stats.counts['collected'] += len(jobs)
+        stats.sources.update(job.get('source', 'Unknown') for job in jobs)
+        with metrics.span("filter"):
+            jobs = filter_jobs(jobs, history, batch_keys)
+        stats.counts['filtered'] += len(jobs)
+        if jobs:
+            yield jobs
+
+def dedupe_stage(batches, near_dup_index, stats):
+    """Drop title repeats and near-duplicates across the whole run"""
+    seen = set()
+    for jobs in batches:
+        with metrics.span("dedupe"):
+            jobs = dedupe_jobs(jobs, near_dup_index, seen)
+        stats.counts['deduped'] += len(jobs)
+        if jobs:
+            yield jobs
+
+def score_stage(batches, profiles, n_targets, stats):
+    """Score each batch for every profile (columnar within the batch)"""
+    for jobs in batches:
+        jobs = score_batch(jobs, profiles, n_targets)
+        stats.add_scores(jobs)
+        yield jobs
+
+def run_pipeline(job_stream, history, near_dup_index, profiles=None, stats=None):
+    """
+    Compose the streaming stages over any stream of job batches.
+    
+    Args:
+        job_stream: Iterable of job lists (e.g. stream_jobs(), or replayed pages)
+        history: Seen-jobs memory from load_history()
+        near_dup_index: NearDuplicateIndex for recent runs
+        profiles: ProfileSet to score for (None = no scoring)
+        stats: PipelineStats to fill in (optional)
+    
+    Returns:
+        Generator of scored job batches; job['profile_scores'][p] holds
+        profile p's scores
+    """
+    n_targets = len(profiles) if profiles else 1
+    if stats is None:
+        stats = PipelineStats(n_targets)
+    
+    load_scorers()
+    if not (AI_ENABLED and profiles):
+        print(f"⚠️ AI scoring skipped: AI_ENABLED={AI_ENABLED}")
+    if not (HYBRID_ENABLED and profiles):
+        print(f"⚠️ Hybrid scoring skipped: HYBRID_ENABLED={HYBRID_ENABLED}")
+    if not (COMPANY_RANKER_ENABLED and profiles):
+        print(f"⚠️ Company ranking skipped: COMPANY_RANKER_ENABLED={COMPANY_RANKER_ENABLED}")
+    
+    batches = filter_stage(job_stream, history, stats)
+    batches = dedupe_stage(batches, near_dup_index, stats)
+    return score_stage(batches, profiles, n_targets, stats)
+
+# ============ SINKS ============
+
+# Jobs listed in one Telegram digest (the rest are only counted)
+ALERT_DIGEST_SIZE = 20
+
+class ProfileSink:
+    """
+    One profile's end of the pipeline: appends its CSV rows as batches
+    arrive and keeps only what the Telegram digest shows.
+    """
+    
+    def __init__(self, profile=None, label=""):
+        self.profile = profile
+        self.label = label
+        self.csv_file = profile.csv_file if profile else CSV_FILE
+        self.chat_id = os.getenv(profile.chat_id_env) if profile else CHAT_ID
+        load_scorers()
+        self.filter_alerts = COMPANY_RANKER_ENABLED and profile is not None
+        self.logged = 0
+        self.alert_count = 0
+        self.alert_jobs = []
+        self.alert_sources = Counter()
         
-        final_jobs = dedupe_jobs(filtered_jobs)
-        print(f"   ✅ After deduplication: {len(final_jobs)} jobs")
+        init_csv(self.csv_file)
+    
+    def consume(self, jobs):
+        """Log a batch (as this profile sees it) and queue its alert-worthy jobs"""
+        save_to_csv(jobs, self.csv_file)
+        self.logged += len(jobs)
         
-        # ============================================
-        # AI SCORING WITH DETAILED DIAGNOSTICS
-        # ============================================
-        if AI_ENABLED and final_jobs:
-            try:
-                print(f"\n{'='*70}")
-                print(f"🤖 AI_ENABLED = True, attempting to load matcher...")
-                matcher = get_ai_matcher()
-                print(f"🤖 Matcher loaded successfully, scoring jobs...")
-                final_jobs = matcher.batch_score(final_jobs)
-                
-                # Diagnostic: Check if scores were actually added
-                scored_jobs = [j for j in final_jobs if j.get('ai_score') is not None and j.get('ai_score') > 0]
-                print(f"🤖 Scored {len(scored_jobs)}/{len(final_jobs)} jobs successfully")
-                
-                if scored_jobs:
-                    avg_score = sum(j['ai_score'] for j in scored_jobs) / len(scored_jobs)
-                    print(f"🤖 Average AI score: {avg_score:.3f}")
-                else:
-                    print(f"⚠️ WARNING: All AI scores are 0 or None!")
-                
-                print(f"{'='*70}")
-            except Exception as e:
-                print(f"⚠️ AI scoring failed (continuing without scores): {e}")
-                import traceback
-                traceback.print_exc()
-                for job in final_jobs:
-                    job['ai_score'] = None
-        else:
-            print(f"⚠️ AI scoring skipped: AI_ENABLED={AI_ENABLED}, final_jobs count={len(final_jobs) if final_jobs else 0}")
-            for job in final_jobs:
-                job['ai_score'] = None
-        
-        # ============================================
-        # HYBRID SCORING (COMPOSES ON AI SCORE)
-        # ============================================
-        if HYBRID_ENABLED and final_jobs:
-            try:
-                print(f"\n{'='*70}")
-                print(f"🧠 HYBRID_ENABLED = True, calculating hybrid scores...")
-                final_jobs = add_hybrid_scores_to_jobs(final_jobs)
-                
-                # Diagnostic: Check hybrid scores
-                hybrid_jobs = [j for j in final_jobs if j.get('hybrid_score') is not None]
-                if hybrid_jobs:
-                    avg_hybrid = sum(j['hybrid_score'] for j in hybrid_jobs) / len(hybrid_jobs)
-                    avg_keyword = sum(j.get('keyword_score', 0) for j in hybrid_jobs) / len(hybrid_jobs)
-                    print(f"🧠 Hybrid scores added: {len(hybrid_jobs)}/{len(final_jobs)} jobs")
-                    print(f"🧠 Average keyword score: {avg_keyword:.3f}")
-                    print(f"🧠 Average hybrid score: {avg_hybrid:.3f}")
-                else:
-                    print(f"⚠️ WARNING: No hybrid scores calculated!")
-                
-                print(f"{'='*70}")
-            except Exception as e:
-                print(f"⚠️ Hybrid scoring failed (continuing without hybrid scores): {e}")
-                import traceback
-                traceback.print_exc()
-        else:
-            print(f"⚠️ Hybrid scoring skipped: HYBRID_ENABLED={HYBRID_ENABLED}")
-        
-        # ============================================
-        # COMPANY RANKING & FINAL SCORE CALCULATION
-        # ============================================
-        if COMPANY_RANKER_ENABLED and final_jobs:
-            try:
-                print(f"\n{'='*70}")
-                print(f"🏢 COMPANY_RANKER_ENABLED = True, scoring companies...")
-                final_jobs = add_company_scores_to_jobs(final_jobs)
-                
-                # Calculate final rank for each job
-                for job in final_jobs:
-                    job['final_rank_score'] = calculate_final_rank(job)
-                
-                # Diagnostics
-                tier1_jobs = [j for j in final_jobs if j.get('company_tier') == 1]
-                tier2_jobs = [j for j in final_jobs if j.get('company_tier') == 2]
-                tier3_jobs = [j for j in final_jobs if j.get('company_tier') == 3]
-                
-                print(f"🏢 Tier 1 (Top MNCs): {len(tier1_jobs)} jobs")
-                print(f"🏢 Tier 2 (Mid-tier): {len(tier2_jobs)} jobs")
-                print(f"🏢 Tier 3 (Unknown): {len(tier3_jobs)} jobs")
-                
-                if final_jobs:
-                    avg_company = sum(j.get('company_score', 0) for j in final_jobs) / len(final_jobs)
-                    avg_final_rank = sum(j.get('final_rank_score', 0) for j in final_jobs) / len(final_jobs)
-                    print(f"🏢 Average company score: {avg_company:.3f}")
-                    print(f"🏢 Average final rank: {avg_final_rank:.3f}")
-                
-                print(f"{'='*70}")
-            except Exception as e:
-                print(f"⚠️ Company ranking failed (continuing without scores): {e}")
-                import traceback
-                traceback.print_exc()
-                for job in final_jobs:
-                    job['company_score'] = 0.4
-                    job['company_tier'] = 3
-                    job['final_rank_score'] = job.get('hybrid_score', 0) * 0.5 + 0.2
-        else:
-            print(f"⚠️ Company ranking skipped: COMPANY_RANKER_ENABLED={COMPANY_RANKER_ENABLED}")
-            for job in final_jobs:
-                job['company_score'] = 0.4
-                job['company_tier'] = 3
-                job['final_rank_score'] = job.get('hybrid_score', 0) * 0.5 + 0.2
-        
-        # ============================================
-        # FILTER FOR TELEGRAM (Tier 1 & 2 ONLY)
-        # ============================================
-        telegram_jobs = []
-        suppressed_jobs = []
-        
-        if COMPANY_RANKER_ENABLED and final_jobs:
-            for job in final_jobs:
-                if should_send_telegram_alert(job):
-                    telegram_jobs.append(job)
-                else:
-                    suppressed_jobs.append(job)
-            
-            print(f"\n📱 Telegram filter:")
-            print(f"   ✅ Sending alerts for: {len(telegram_jobs)} jobs (Tier 1 & 2)")
-            print(f"   🔇 Suppressing alerts for: {len(suppressed_jobs)} jobs (Tier 3)")
-        else:
-            telegram_jobs = final_jobs
+        for job in jobs:
+            # FILTER FOR TELEGRAM (Tier 1 & 2 ONLY)
+            if self.filter_alerts and not should_send_telegram_alert(job, self.profile):
+                continue
+            self.alert_count += 1
+            self.alert_sources[job.get('source', 'Unknown')] += 1
+            if len(self.alert_jobs) < ALERT_DIGEST_SIZE:
+                self.alert_jobs.append(job)
+    
+    def finish(self):
+        """Send the digest of Tier 1 & 2 jobs to this profile's chat"""
+        suppressed = self.logged - self.alert_count
         
-        # Save ALL jobs to CSV (including Tier 3)
-        if final_jobs:
-            save_to_csv(final_jobs)
-            
-            for job in final_jobs:
-                mark_as_sent(job.get('link', ''), history)
-            save_history(history)
+        if self.filter_alerts and self.logged:
+            print(f"\n📱 Telegram filter{self.label}:")
+            print(f"   ✅ Sending alerts for: {self.alert_count} jobs (Tier 1 & 2)")
+            print(f"   🔇 Suppressing alerts for: {suppressed} jobs (Tier 3)")
         
         # Send ONLY Tier 1 & 2 to Telegram
-        if telegram_jobs:
-            message = format_telegram_message(telegram_jobs)
-            send_telegram(message)
+        if self.alert_count:
+            message = format_telegram_message(self.alert_jobs, self.alert_count)
+            send_telegram(message, self.chat_id)
             
             print(f"\n{'='*70}")
-            print(f"✅ SUCCESS: Sent {len(telegram_jobs)} high-quality jobs to Telegram")
-            print(f"📊 Logged {len(final_jobs)} total jobs to CSV (including Tier 3)")
-            
-            sources = {}
-            for job in telegram_jobs:
-                source = job.get('source', 'Unknown')
-                sources[source] = sources.get(source, 0) + 1
+            print(f"✅ SUCCESS{self.label}: Sent {self.alert_count} high-quality jobs to Telegram")
+            print(f"📊 Logged {self.logged} total jobs to CSV (including Tier 3)")
             
             print(f"\n📊 Telegram alerts by source:")
-            for source, count in sorted(sources.items(), key=lambda x: x[1], reverse=True):
+            for source, count in self.alert_sources.most_common():
                 print(f"   • {source}: {count} jobs")
             
             print(f"{'='*70}\n")
         else:
-            if final_jobs:
+            if self.logged:
                 message = (
                     "ℹ️ <b>Job Agent Update</b>\n\n"
-                    f"Found {len(final_jobs)} new jobs, but none from Tier 1 or Tier 2 companies.\n\n"
+                    f"Found {self.logged} new jobs, but none from Tier 1 or Tier 2 companies.\n\n"
                     "🔇 Alerts suppressed for unknown/low-reputation companies.\n"
                     "📊 All jobs logged to CSV for your review.\n\n"
                     f"🕐 {datetime.now().strftime('%d %b %Y, %I:%M %p')}"
@@ -924,12 +1179,61 @@ def main():
             else:
                 message = format_telegram_message([])
             
-            send_telegram(message)
+            send_telegram(message, self.chat_id)
             
             print(f"\n{'='*70}")
-            print(f"ℹ️  No Tier 1/2 jobs found (suppressed {len(suppressed_jobs)} Tier 3 alerts)")
+            print(f"ℹ️  No Tier 1/2 jobs found{self.label} (suppressed {suppressed} Tier 3 alerts)")
             print(f"{'='*70}\n")
+
+def main():
+    """Main execution"""
+    metrics.reset()
+    stats = None
+    
+    try:
+        # One scrape, scored for every profile; results fan out per profile
+        profiles = load_scoring_profiles()
+        targets = list(profiles) if profiles else [None]
+        labels = [f" [{p.name}]" if p and len(targets) > 1 else "" for p in targets]
+        sinks = [ProfileSink(profile, label) for profile, label in zip(targets, labels)]
+        
+        history = load_history()
+        print(f"📚 Memory loaded: {len(history['sent_links'])} jobs in history")
+        
+        # Sources without a high-water mark yet start from the last saved run
+        last_updated = history.get("last_updated")
+        get_high_water_marks(datetime.fromisoformat(last_updated).timestamp() if last_updated else None)
+        
+        near_dup_index = NearDuplicateIndex.load()
+        stats = PipelineStats(len(targets))
         
+        # Each page flows through filter, dedupe and scoring into every
+        # profile's CSV as soon as it is fetched
+        for jobs in run_pipeline(stream_jobs(history=history), history, near_dup_index, profiles, stats):
+            for index, sink in enumerate(sinks):
+                sink.consume(profile_jobs(jobs, index))
+            for job in jobs:
+                mark_as_sent(job.get('job_key') or job.get('link', ''), history)
+        
+        stats.report(labels)
+        
+        if stats.counts['deduped']:
+            save_history(history)
+        
+        # Listing pages and recent fingerprints only persist once jobs are saved
+        save_listed(history)
+        save_high_water_marks(name for name, *_ in JOB_SOURCES)
+        save_page_cache()
+        near_dup_index.save()
+        save_score_cache()
+        
+        # Each profile's Tier 1 & 2 jobs go to its own chat
+        for sink in sinks:
+            sink.finish()
+        
+        names = [p.name if p else "default" for p in targets]
+        write_run_metrics(status="ok", pipeline=stats.summary(names))
+    
     except Exception as e:
         print(f"\n{'='*70}")
         print(f"❌ ERROR: {e}")
@@ -942,7 +1246,13 @@ def main():
         )
         send_telegram(error_msg)
         
+        write_run_metrics(status="error", error=str(e)[:200],
+                          pipeline=stats.summary([]) if stats else None)
+        
         raise
 
 if __name__ == "__main__":
-    main()
+    # Opt-in profiling: PROFILE_RUN=cprofile|sample|functions or --profile[=modes]
+    from profiling import profile_run, profiling_modes
+    with profile_run(profiling_modes()):
+        main()
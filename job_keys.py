@@ -0,0 +1,119 @@
+"""
+Job Key Module
+Canonical, source-aware job identifiers for deduplication.
+Collapses re-posted adverts and tracking-laden URLs to one stable key.
+"""
+
+import re
+from urllib.parse import parse_qs, unquote, urlsplit
+
+
+# ============================================
+# PATTERNS
+# ============================================
+
+# LinkedIn: /jobs/view/<slug>-<numeric id>, re-posts keep the slug
+LINKEDIN_VIEW = re.compile(r'/jobs/view/(?:(?P<slug>[^/]+?)-)?(?P<id>\d+)/?$')
+
+# Internshala: /internship/detail/<slug><timestamp>
+INTERNSHALA_DETAIL = re.compile(r'/(?:internship|job)/details?/(?P<slug>[^/]+?)-?(?P<ts>\d{6,})/?$')
+
+# Naukri: /job-listings-<slug>-<numeric id>
+NAUKRI_LISTING = re.compile(r'/job-listings-(?P<slug>[^/]+?)-(?P<id>\d{6,})/?$')
+
+# Instahyre: /job-<numeric id>-<slug>/
+INSTAHYRE_JOB = re.compile(r'/job-(?P<id>\d+)(?:-[a-z0-9-]*)?/?$')
+
+NON_ALNUM = re.compile(r'[^a-z0-9]+')
+
+
+# ============================================
+# CANONICALIZATION
+# ============================================
+
+def normalize_url(link: str) -> str:
+    """
+    Scheme-less URL without query, fragment or trailing slash.
+    
+    Args:
+        link: Raw job URL
+    
+    Returns:
+        Normalized URL string (lowercase host and path)
+    """
+    parts = urlsplit(link.strip())
+    host = parts.netloc.lower()
+    if host.startswith("www."):
+        host = host[4:]
+    return f"{host}{parts.path.lower().rstrip('/')}"
+
+
+def _slug(*values: str) -> str:
+    """Join free-text fields into one lowercase dash-separated slug"""
+    text = " ".join(v for v in values if v)
+    return NON_ALNUM.sub("-", text.lower()).strip("-")
+
+
+def canonical_job_key(link: str, job: dict = None) -> str:
+    """
+    Reduce a job link to a stable, compact key.
+    
+    - Indeed:      indeed:<jk>
+    - LinkedIn:    linkedin:<title-at-company slug>  (re-posts share it)
+    - Internshala: internshala:<slug> (trailing timestamp stripped)
+    - Naukri:      naukri:<slug> (trailing posting id stripped)
+    - Instahyre:   instahyre:<id>
+    - Otherwise:   job:<company-title-location> when the job dict has them,
+                   else the normalized URL
+    
+    Args:
+        link: Raw job URL
+        job: Optional job dict for the company/title/location fallback
+    
+    Returns:
+        Canonical job key (empty string for empty links). Passing an
+        existing key returns it unchanged.
+    """
+    if not link:
+        return ""
+    
+    # Already canonical (keys and normalized URLs carry no scheme)
+    if "://" not in link:
+        return link
+    
+    parts = urlsplit(link.strip())
+    host = parts.netloc.lower()
+    path = unquote(parts.path).lower()
+    
+    if "indeed." in host:
+        jk = parse_qs(parts.query).get("jk")
+        if jk:
+            return f"indeed:{jk[0]}"
+    
+    elif "linkedin." in host:
+        match = LINKEDIN_VIEW.search(path)
+        if match:
+            return f"linkedin:{_slug(match.group('slug')) or match.group('id')}"
+        job_id = parse_qs(parts.query).get("currentJobId")
+        if job_id:
+            return f"linkedin:{job_id[0]}"
+    
+    elif "internshala." in host:
+        match = INTERNSHALA_DETAIL.search(path)
+        if match:
+            return f"internshala:{_slug(match.group('slug'))}"
+    
+    elif "naukri." in host:
+        match = NAUKRI_LISTING.search(path)
+        if match:
+            return f"naukri:{_slug(match.group('slug'))}"
+    
+    elif "instahyre." in host:
+        match = INSTAHYRE_JOB.search(path)
+        if match:
+            return f"instahyre:{match.group('id')}"
+    
+    if job and job.get("title") and job.get("company"):
+        return "job:" + _slug(job.get("company", ""), job.get("title", ""), job.get("location", ""))
+    
+    return normalize_url(link)
@@ -0,0 +1,200 @@
+"""
+Keyword Matcher Module
+Precompiled keyword matchers, built once at import.
+KeywordMatcher tests texts against several substring categories;
+SkillExtractor finds whole-word skills and their synonyms in one pass.
+"""
+
+import re
+from typing import Dict, Iterable, List, Set, Tuple
+
+
+def _compile_keywords(keywords: Iterable[str]) -> Tuple[str, ...]:
+    """
+    Lowercase, dedupe and prune a keyword list.
+    
+    A keyword containing another keyword of the same category can never
+    decide a match on its own ("internship" always implies "intern"), so
+    it is dropped. Shortest keywords are tried first.
+    """
+    unique = sorted({kw.lower() for kw in keywords if kw}, key=lambda kw: (len(kw), kw))
+    kept = []
+    for keyword in unique:
+        if not any(shorter in keyword for shorter in kept):
+            kept.append(keyword)
+    return tuple(kept)
+
+
+class KeywordMatcher:
+    """
+    Substring matcher for several keyword categories.
+    
+    Each category is compiled to a pruned keyword tuple and tested with
+    C-level str.__contains__, which beats one big regex alternation on
+    CPython (sre retries every alternative at every position).
+    """
+    
+    def __init__(self, categories: Dict[str, Iterable[str]]):
+        """
+        Args:
+            categories: Category name -> keywords (matched as lowercase substrings)
+        """
+        self._keywords = {
+            category: _compile_keywords(keywords)
+            for category, keywords in categories.items()
+        }
+        self.categories = tuple(self._keywords)
+    
+    def matches(self, category: str, text: str) -> bool:
+        """
+        True if any keyword of one category occurs in the text.
+        
+        Args:
+            category: Category name
+            text: Already lowercased text
+        """
+        return any(map(text.__contains__, self._keywords[category]))
+
+
+class SkillExtractor:
+    """
+    Whole-word skill finder with synonym groups.
+    
+    Every surface form of every skill is compiled into one word-bounded
+    alternation (longest form first, spaces match any whitespace), so a
+    single finditer sees every occurring form. Forms that can overlap
+    are matched through a lookahead at every position instead (slower),
+    so none is consumed by its neighbour. Each form is also credited
+    with the forms found as whole words inside it, so a longer match never
+    hides a shorter skill.
+    """
+    
+    def __init__(self, skills: Dict[str, Iterable[str]]):
+        """
+        Args:
+            skills: Canonical skill -> synonyms. The canonical name itself
+                    (lowercased) is always one of its forms.
+        """
+        self.skills = tuple(skills)
+        self._order = {skill: i for i, skill in enumerate(self.skills)}
+        
+        self._owners = {}
+        self._canonical = {}
+        for skill, synonyms in skills.items():
+            for form in (skill, *synonyms):
+                form = " ".join(form.lower().split())
+                self._owners.setdefault(form, set()).add(skill)
+                self._canonical.setdefault(form, skill)
+        
+        self.forms = tuple(sorted(self._owners, key=len, reverse=True))
+        self._overlaps = self._has_overlaps(self.forms)
+        self._pattern = self._compile_pattern(self.forms, self._overlaps)
+        
+        self._forms_in = {}
+        for form in self.forms:
+            self._forms_in[form] = frozenset(
+                other for other in self.forms
+                if other == form or re.search(r'\b' + re.escape(other) + r'\b', form)
+            )
+    
+    @staticmethod
+    def _compile_pattern(forms: Tuple[str, ...], overlaps: bool) -> "re.Pattern":
+        """One word-bounded alternation over every form"""
+        alternation = "|".join(r'\s+'.join(map(re.escape, f.split())) for f in forms)
+        if overlaps:
+            # A lookahead tries every position, so overlapping forms all match
+            return re.compile(r'\b(?=(' + alternation + r')\b)')
+        return re.compile(r'\b(' + alternation + r')\b')
+    
+    @staticmethod
+    def _has_overlaps(forms: Tuple[str, ...]) -> bool:
+        """True if some form can start inside another and run past its end ("sql server" / "server side")"""
+        for form in forms:
+            starts = {m.start() for m in re.finditer(r'\b', form)} - {0, len(form)}
+            for i in starts:
+                tail = form[i:].lstrip()
+                if tail and any(other.startswith(tail) and len(other) > len(tail) for other in forms):
+                    return True
+        return False
+    
+    @classmethod
+    def combine(cls, extractors: Iterable["SkillExtractor"]) -> "SkillExtractor":
+        """
+        One extractor over the forms of several, for scanning a text once.
+        
+        Its "skills" are the forms themselves; pass the result of its
+        find_forms() to each original extractor's skills_for_forms().
+        """
+        forms = {}
+        for extractor in extractors:
+            forms.update((form, []) for form in extractor.forms)
+        return cls(forms)
+    
+    def to_data(self) -> dict:
+        """Plain JSON-serializable form of the extractor (see from_data)"""
+        return {
+            "skills": list(self.skills),
+            "owners": {
+                form: sorted(owners, key=self._order.__getitem__)
+                for form, owners in self._owners.items()
+            },
+            "canonical": dict(self._canonical),
+            "forms_in": {form: sorted(inside) for form, inside in self._forms_in.items()},
+            "overlaps": self._overlaps
+        }
+    
+    @classmethod
+    def from_data(cls, data: dict) -> "SkillExtractor":
+        """Rebuild an extractor from to_data() output (only the regex is compiled)"""
+        extractor = cls.__new__(cls)
+        extractor.skills = tuple(data["skills"])
+        extractor._order = {skill: i for i, skill in enumerate(extractor.skills)}
+        extractor._owners = {form: set(owners) for form, owners in data["owners"].items()}
+        extractor._canonical = dict(data["canonical"])
+        extractor.forms = tuple(sorted(extractor._owners, key=len, reverse=True))
+        extractor._overlaps = data["overlaps"]
+        extractor._pattern = cls._compile_pattern(extractor.forms, extractor._overlaps)
+        extractor._forms_in = {form: frozenset(inside) for form, inside in data["forms_in"].items()}
+        return extractor
+    
+    def find_forms(self, text: str) -> Set[str]:
+        """
+        Normalized forms occurring as whole words in the text.
+        
+        Args:
+            text: Any text (lowercased here)
+        """
+        found = set()
+        if text:
+            for match in self._pattern.finditer(text.lower()):
+                found |= self._forms_in[" ".join(match.group(1).split())]
+        return found
+    
+    def skills_for_forms(self, forms: Iterable[str]) -> List[str]:
+        """
+        Canonical skills for forms found in a text (forms of other extractors are ignored).
+        
+        Returns:
+            Canonical skill names in declaration order, each at most once
+        """
+        found = set()
+        for form in forms:
+            found |= self._owners.get(form, set())
+        return sorted(found, key=self._order.__getitem__)
+    
+    def extract(self, text: str) -> List[str]:
+        """
+        Skills mentioned in the text.
+        
+        Args:
+            text: Any text (lowercased here)
+        
+        Returns:
+            Canonical skill names in declaration order, each at most once
+        """
+        return self.skills_for_forms(self.find_forms(text))
+    
+    def canonical(self, skill: str) -> str:
+        """Canonical name for a skill or synonym (the lowercased input if unknown)"""
+        form = " ".join(skill.lower().split())
+        return self._canonical.get(form, form)
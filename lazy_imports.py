@@ -0,0 +1,30 @@
+"""
+Lazy Imports Module
+Heavy dependencies (NumPy, BeautifulSoup, requests) are imported where they
+are first used instead of at startup, so `import job_agent` only pays for
+what the run needs before its first request. check_import_time.py keeps
+them out of the startup path.
+"""
+
+import importlib
+
+_modules = {}
+
+
+def optional_module(name: str):
+    """
+    Import a module on first call (SAFE / NON-BREAKING).
+    
+    Args:
+        name: Module name, e.g. "numpy"
+    
+    Returns:
+        The module, or None if it is not installed (callers keep their
+        pure-Python fallbacks)
+    """
+    if name not in _modules:
+        try:
+            _modules[name] = importlib.import_module(name)
+        except ImportError:
+            _modules[name] = None
+    return _modules[name]
@@ -0,0 +1,191 @@
+"""
+Load Test
+Push seeded synthetic jobs (synthetic_jobs.py) through the streaming
+pipeline at growing volumes and report, per volume:
+- wall time and jobs/sec end to end
+- peak RSS of the process
+- time spent in each stage (generate, filter, dedupe, each scorer, sinks)
+Each volume runs in its own process, so its peak RSS is its own.
+Nothing is saved: history, near-duplicate index and sinks stay in memory.
+
+Usage:
+    python load_test.py                     # 10k and 100k jobs
+    python load_test.py 10000 1000000       # chosen volumes
+    python load_test.py 50000 --seed 7 --batch-size 1000
+"""
+
+import os
+
+# Measure the work itself, not cache hits
+os.environ.setdefault("SCORE_CACHE", "0")
+
+import contextlib
+import io
+import json
+import subprocess
+import sys
+import time
+
+from metrics import metrics
+
+# Peak RSS (SAFE / NON-BREAKING: not available on Windows)
+try:
+    import resource
+    RESOURCE_AVAILABLE = True
+except ImportError:
+    RESOURCE_AVAILABLE = False
+
+
+# ============================================
+# CONFIGURATION
+# ============================================
+
+DEFAULT_SIZES = [10_000, 100_000]
+DEFAULT_SEED = 42
+DEFAULT_BATCH_SIZE = 500    # about one fetched page
+
+# Spans reported per volume (see metrics.py)
+STAGES = ['generate', 'filter', 'dedupe', 'score.ai', 'score.hybrid', 'score.company', 'sinks']
+
+
+# ============================================
+# ONE VOLUME
+# ============================================
+
+def peak_rss_mb():
+    """Peak resident memory of this process in MB (None if unknown)"""
+    if not RESOURCE_AVAILABLE:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Kilobytes on Linux, bytes on macOS
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def _timed(batches, stage):
+    """Pass batches through, timing the production of each as span stage"""
+    batches = iter(batches)
+    while True:
+        start = time.perf_counter()
+        jobs = next(batches, None)
+        metrics.add_time(stage, time.perf_counter() - start)
+        if jobs is None:
+            return
+        yield jobs
+
+
+def run_load(n_jobs, seed=DEFAULT_SEED, batch_size=DEFAULT_BATCH_SIZE):
+    """
+    Run n_jobs synthetic jobs through the pipeline in this process.
+    
+    Args:
+        n_jobs: Jobs to generate
+        seed: Generator seed
+        batch_size: Jobs per batch (one "page")
+    
+    Returns:
+        Result dict: jobs, seconds, jobs_per_sec, peak_rss_mb, counts,
+        stage_seconds
+    """
+    import job_agent
+    from company_ranker import should_send_telegram_alert
+    from near_dedup import NearDuplicateIndex
+    from synthetic_jobs import SyntheticJobGenerator
+    
+    with contextlib.redirect_stdout(io.StringIO()):
+        profiles = job_agent.load_scoring_profiles()
+    targets = list(profiles) if profiles else [None]
+    history = job_agent._empty_history()
+    stats = job_agent.PipelineStats(len(targets))
+    generator = SyntheticJobGenerator(seed)
+    metrics.reset()
+    
+    started = time.perf_counter()
+    
+    with contextlib.redirect_stdout(io.StringIO()):
+        job_stream = _timed(generator.batches(n_jobs, batch_size), 'generate')
+        pipeline = job_agent.run_pipeline(job_stream, history, NearDuplicateIndex(), profiles, stats)
+        
+        # In-memory stand-in for the CSV and Telegram sinks
+        alerts = 0
+        for jobs in pipeline:
+            start = time.perf_counter()
+            for index, profile in enumerate(targets):
+                for job in job_agent.profile_jobs(jobs, index):
+                    if profile is None or should_send_telegram_alert(job, profile):
+                        alerts += 1
+            for job in jobs:
+                job_agent.mark_as_sent(job.get('job_key') or job.get('link', ''), history)
+            metrics.add_time('sinks', time.perf_counter() - start)
+    
+    seconds = time.perf_counter() - started
+    
+    return {
+        "jobs": n_jobs,
+        "seconds": round(seconds, 3),
+        "jobs_per_sec": round(n_jobs / seconds, 1) if seconds else None,
+        "peak_rss_mb": round(peak_rss_mb(), 1) if RESOURCE_AVAILABLE else None,
+        "counts": {**stats.counts, "alerts": alerts},
+        "stage_seconds": {stage: round(metrics.seconds(stage), 3) for stage in STAGES}
+    }
+
+
+# ============================================
+# REPORT
+# ============================================
+
+def run_in_child(n_jobs, seed, batch_size):
+    """run_load in a fresh interpreter, so peak RSS covers this volume only"""
+    command = [sys.executable, os.path.abspath(__file__), "--single", str(n_jobs),
+               "--seed", str(seed), "--batch-size", str(batch_size)]
+    output = subprocess.run(command, capture_output=True, text=True, check=True).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def print_result(result):
+    counts = result["counts"]
+    rss = f"{result['peak_rss_mb']:.0f} MB" if result["peak_rss_mb"] is not None else "n/a"
+    
+    print(f"\n📦 {result['jobs']:,} jobs")
+    print(f"   ⏱️ {result['seconds']:.1f}s, {result['jobs_per_sec']:,.0f} jobs/sec")
+    print(f"   💾 Peak RSS: {rss}")
+    print(f"   ✅ Filtered: {counts.get('filtered', 0):,}, deduped: {counts.get('deduped', 0):,}, "
+          f"alerts: {counts.get('alerts', 0):,}")
+    
+    total = sum(result["stage_seconds"].values()) or 1
+    for stage, seconds in result["stage_seconds"].items():
+        print(f"   • {stage:<13} {seconds:>8.2f}s {seconds / total:>6.0%}")
+
+
+def _option(args, name, default):
+    if name in args:
+        position = args.index(name)
+        value = int(args[position + 1])
+        del args[position:position + 2]
+        return value
+    return default
+
+
+def main(argv=None):
+    args = list(sys.argv[1:] if argv is None else argv)
+    seed = _option(args, "--seed", DEFAULT_SEED)
+    batch_size = _option(args, "--batch-size", DEFAULT_BATCH_SIZE)
+    single = _option(args, "--single", None)
+    
+    if single is not None:
+        print(json.dumps(run_load(single, seed, batch_size)))
+        return
+    
+    sizes = [int(arg.replace("_", "")) for arg in args] or DEFAULT_SIZES
+    
+    print("="*70)
+    print(f"LOAD TEST (seed {seed}, {batch_size} jobs per batch)")
+    print("="*70)
+    
+    for n_jobs in sizes:
+        print_result(run_in_child(n_jobs, seed, batch_size))
+    
+    print(f"\n{'='*70}")
+
+
+if __name__ == "__main__":
+    main()
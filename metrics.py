@@ -0,0 +1,219 @@
+"""
+Metrics Module
+Lightweight run instrumentation: timed spans and counters, collected
+in-process and written once per run as one JSON line (METRICS_FILE),
+plus an optional Prometheus textfile (METRICS_PROM_FILE) for the
+node_exporter textfile collector.
+
+Usage:
+    from metrics import metrics
+    with metrics.span("fetch.LinkedIn"):
+        ...
+    metrics.incr("telegram.sent")
+
+Span names are dotted: "fetch.<source>", "parse.<source>", "filter",
+"dedupe", "score.ai", "score.hybrid", "score.company", "csv_write",
+"telegram_send". Spans on worker threads add up, so concurrent fetch
+time can exceed the run's wall time.
+"""
+
+import functools
+import json
+import linecache
+import os
+import re
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Callable, Dict, Optional
+
+
+# ============================================
+# CONFIGURATION
+# ============================================
+
+# One JSON line per run, appended (empty = off)
+METRICS_FILE = os.getenv("METRICS_FILE", "run_metrics.jsonl")
+
+# Prometheus textfile, rewritten each run (empty = off)
+METRICS_PROM_FILE = os.getenv("METRICS_PROM_FILE", "")
+
+PROM_PREFIX = "job_agent"
+
+
+# ============================================
+# SPANS & COUNTERS
+# ============================================
+
+class RunMetrics:
+    """
+    Span timings and counters for one run. Thread-safe, so fetch
+    workers can record into the same instance.
+    """
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+    
+    def reset(self) -> None:
+        """Start a new run"""
+        with self._lock:
+            self.span_seconds = Counter()
+            self.span_calls = Counter()
+            self.counters = Counter()
+            self.started = time.time()
+    
+    @contextmanager
+    def span(self, name: str):
+        """Time the block under name (also when it raises)"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add_time(name, time.perf_counter() - start)
+    
+    def timed(self, name: str) -> Callable:
+        """Decorator: time every call of a function under name"""
+        def decorate(fn):
+            return functools.wraps(fn)(_span_wrapper(self, name, fn))
+        return decorate
+    
+    def add_time(self, name: str, seconds: float) -> None:
+        """Record one call of span name that took seconds"""
+        with self._lock:
+            self.span_seconds[name] += seconds
+            self.span_calls[name] += 1
+    
+    def incr(self, name: str, n: int = 1) -> None:
+        """Add n to counter name"""
+        with self._lock:
+            self.counters[name] += n
+    
+    def seconds(self, name: str) -> float:
+        """Total seconds in span name so far"""
+        return self.span_seconds[name]
+    
+    def record(self, **fields) -> dict:
+        """
+        This run as one structured record.
+        
+        Args:
+            **fields: Extra top-level fields (status, pipeline counts, ...)
+        
+        Returns:
+            {"run_started", "duration_seconds", "spans": {name: {"calls", "seconds"}},
+             "counters": {name: n}, **fields}
+        """
+        with self._lock:
+            spans = {
+                name: {"calls": self.span_calls[name], "seconds": round(seconds, 4)}
+                for name, seconds in sorted(self.span_seconds.items())
+            }
+            counters = dict(sorted(self.counters.items()))
+        
+        return {
+            "run_started": datetime.fromtimestamp(self.started).isoformat(timespec="seconds"),
+            "duration_seconds": round(time.time() - self.started, 3),
+            "spans": spans,
+            "counters": counters,
+            **fields
+        }
+
+
+def _span_wrapper(run_metrics: RunMetrics, name: str, fn: Callable) -> Callable:
+    """
+    A wrapper timing fn under span name, generated from source per span.
+    
+    Each span gets its own function (timed_<name>) and code object, so
+    profilers keep the wrappers of different functions apart. The source
+    is registered with linecache, so tracebacks show it.
+    """
+    ident = "timed_" + re.sub(r'\W', '_', name)
+    filename = f"<{ident}>"
+    source = (
+        f"def {ident}(*args, **kwargs):\n"
+        f"    with span(name):\n"
+        f"        return fn(*args, **kwargs)\n"
+    )
+    namespace = {"span": run_metrics.span, "name": name, "fn": fn}
+    exec(compile(source, filename, "exec"), namespace)
+    linecache.cache[filename] = (len(source), None, source.splitlines(True), filename)
+    return namespace[ident]
+
+
+metrics = RunMetrics()
+
+
+# ============================================
+# OUTPUT
+# ============================================
+
+def write_jsonl(record: dict, path: Optional[str] = None) -> None:
+    """Append one run record as a JSON line"""
+    path = METRICS_FILE if path is None else path
+    if not path:
+        return
+    with open(path, 'a', encoding='utf-8') as f:
+        f.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+
+def _prom_escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def prometheus_text(record: dict) -> str:
+    """A run record in the Prometheus text exposition format (last run's values as gauges)"""
+    lines = []
+    
+    def gauge(name: str, help_text: str, samples: Dict[str, float], label: Optional[str] = None):
+        lines.append(f"# HELP {PROM_PREFIX}_{name} {help_text}")
+        lines.append(f"# TYPE {PROM_PREFIX}_{name} gauge")
+        for key, value in samples.items():
+            labels = f'{{{label}="{_prom_escape(key)}"}}' if label else ""
+            lines.append(f"{PROM_PREFIX}_{name}{labels} {value}")
+    
+    started = datetime.fromisoformat(record["run_started"]).timestamp()
+    gauge("last_run_timestamp_seconds", "Start of the last run (Unix time)", {"": started})
+    gauge("last_run_duration_seconds", "Wall time of the last run", {"": record["duration_seconds"]})
+    
+    spans = record.get("spans", {})
+    gauge("span_seconds", "Seconds spent in each span during the last run",
+          {name: span["seconds"] for name, span in spans.items()}, "span")
+    gauge("span_calls", "Calls of each span during the last run",
+          {name: span["calls"] for name, span in spans.items()}, "span")
+    gauge("events", "Counters of the last run", record.get("counters", {}), "name")
+    
+    return "\n".join(lines) + "\n"
+
+
+def write_prometheus(record: dict, path: Optional[str] = None) -> None:
+    """Rewrite the Prometheus textfile atomically (a scrape never sees half a file)"""
+    path = METRICS_PROM_FILE if path is None else path
+    if not path:
+        return
+    tmp_path = path + ".tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        f.write(prometheus_text(record))
+    os.replace(tmp_path, path)
+
+
+def write_run_metrics(**fields) -> Optional[dict]:
+    """
+    Write this run's record to every configured output.
+    
+    Args:
+        **fields: Extra top-level fields for the record
+    
+    Returns:
+        The record, or None if it could not be written
+    """
+    try:
+        record = metrics.record(**fields)
+        write_jsonl(record)
+        write_prometheus(record)
+        return record
+    except Exception as e:
+        print(f"⚠️ Could not write run metrics: {e}")
+        return None
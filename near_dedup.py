@@ -0,0 +1,300 @@
+"""
+Near-Duplicate Detection Module
+MinHash-LSH over title + company + location shingles.
+Finds re-worded copies of the same advert in sub-quadratic time.
+Jobs are compared within a group: the same company or, for portals that
+leave the company out, the same source and location, where a higher
+Jaccard similarity is required (the title alone says too little).
+"""
+
+import hashlib
+import json
+import os
+import random
+import re
+from typing import FrozenSet, Iterable, List, Optional, Tuple
+
+from lazy_imports import optional_module
+
+
+# ============================================
+# CONFIGURATION
+# ============================================
+
+# Two jobs are the same advert when nearly all features of the shorter one
+# appear in the other (re-posts mostly add or drop words) ...
+NEAR_DUP_THRESHOLD = 0.9
+# ... and they still share a fair part of their combined features
+NEAR_DUP_MIN_JACCARD = 0.5
+# Jobs without a company are grouped by source + location instead; only a
+# close rewording of the same title counts there
+NEAR_DUP_FALLBACK_MIN_JACCARD = 0.8
+
+# MinHash signature: NUM_PERM values split into BANDS buckets of NUM_PERM/BANDS rows.
+# 16 bands x 4 rows makes ~99% of pairs at 0.7 Jaccard candidates but only
+# ~12% of pairs at 0.3; candidates are then verified on the exact sets.
+NUM_PERM = 64
+BANDS = 16
+
+# Recently kept jobs remembered across runs
+NEAR_DUP_INDEX_FILE = os.path.join(".cache", "near_dup_index.json")
+NEAR_DUP_HISTORY_SIZE = 2000
+
+# a * x + b stays below 2**64 for 32-bit features, so NumPy uint64 never overflows
+_MERSENNE_PRIME = (1 << 31) - 1
+_rng = random.Random(1771)
+_PERMUTATIONS = [
+    (_rng.randrange(1, _MERSENNE_PRIME), _rng.randrange(0, _MERSENNE_PRIME))
+    for _ in range(NUM_PERM)
+]
+
+_perm_arrays = None  # NumPy copies of _PERMUTATIONS, built on first use
+
+TOKEN_PATTERN = re.compile(r'[a-z0-9]+')
+
+
+# ============================================
+# SHINGLING
+# ============================================
+
+def _hash32(feature: str) -> int:
+    """Stable 32-bit feature hash (Python's hash() is salted per process)"""
+    return int.from_bytes(hashlib.blake2b(feature.encode('utf-8'), digest_size=4).digest(), 'big')
+
+
+def job_features(job: dict) -> FrozenSet[int]:
+    """
+    Shingle a job into hashed features.
+    
+    Title word unigrams and bigrams, plus the whole normalized company
+    and location as one feature each.
+    
+    Args:
+        job: Job dict with 'title' and optionally 'company', 'location'
+    
+    Returns:
+        Frozen set of 32-bit feature hashes
+    """
+    tokens = TOKEN_PATTERN.findall(job.get('title', '').lower())
+    features = {f"t:{token}" for token in tokens}
+    features.update(f"b:{a} {b}" for a, b in zip(tokens, tokens[1:]))
+    
+    company = " ".join(TOKEN_PATTERN.findall((job.get('company') or '').lower()))
+    if company:
+        features.add(f"c:{company}")
+    
+    location = " ".join(TOKEN_PATTERN.findall((job.get('location') or '').lower()))
+    if location:
+        features.add(f"l:{location}")
+    
+    return frozenset(_hash32(feature) for feature in features)
+
+
+def dedupe_group(job: dict) -> Optional[Tuple[int, bool]]:
+    """
+    Group a job is compared within.
+    
+    Returns:
+        (32-bit hash, True) for the normalized company name; for jobs
+        without one, (hash of source + normalized location, False);
+        None if the job has neither (never compared)
+    """
+    company = " ".join(TOKEN_PATTERN.findall((job.get('company') or '').lower()))
+    if company:
+        return _hash32(f"c:{company}"), True
+    
+    location = " ".join(TOKEN_PATTERN.findall((job.get('location') or '').lower()))
+    source = (job.get('source') or '').lower()
+    if location and source:
+        return _hash32(f"s:{source} l:{location}"), False
+    return None
+
+
+def jaccard(a: FrozenSet[int], b: FrozenSet[int]) -> float:
+    """Exact Jaccard similarity of two feature sets"""
+    if not a or not b:
+        return 0.0
+    shared = len(a & b)
+    return shared / (len(a) + len(b) - shared)
+
+
+def containment(a: FrozenSet[int], b: FrozenSet[int]) -> float:
+    """Share of the smaller feature set found in the other (overlap coefficient)"""
+    if not a or not b:
+        return 0.0
+    return len(a & b) / min(len(a), len(b))
+
+
+def minhash_signature(features: Iterable[int]) -> List[int]:
+    """MinHash signature with NUM_PERM universal-hash permutations"""
+    global _perm_arrays
+    features = list(features)
+    
+    # NumPy is imported on first use; the pure-Python fallback gives identical signatures
+    np = optional_module("numpy")
+    if np is not None:
+        if _perm_arrays is None:
+            _perm_arrays = (
+                np.array([a for a, _ in _PERMUTATIONS], dtype=np.uint64)[:, None],
+                np.array([b for _, b in _PERMUTATIONS], dtype=np.uint64)[:, None]
+            )
+        perm_a, perm_b = _perm_arrays
+        x = np.array(features, dtype=np.uint64)[None, :]
+        return ((perm_a * x + perm_b) % _MERSENNE_PRIME).min(axis=1).tolist()
+    
+    return [
+        min((a * x + b) % _MERSENNE_PRIME for x in features)
+        for a, b in _PERMUTATIONS
+    ]
+
+
+# ============================================
+# LSH INDEX
+# ============================================
+
+class NearDuplicateIndex:
+    """
+    Locality-sensitive index of job feature sets.
+    
+    Each signature is cut into BANDS bands. Jobs sharing any band
+    become candidates. A candidate is a duplicate when it is in the same
+    dedupe_group(), its containment reaches `threshold` and its Jaccard
+    similarity reaches `min_jaccard` (`fallback_min_jaccard` in groups
+    without a company). Jobs without a group are never matched or indexed.
+    """
+    
+    def __init__(self, threshold: float = NEAR_DUP_THRESHOLD,
+                 min_jaccard: float = NEAR_DUP_MIN_JACCARD,
+                 fallback_min_jaccard: float = NEAR_DUP_FALLBACK_MIN_JACCARD, bands: int = BANDS):
+        self.threshold = threshold
+        self.min_jaccard = min_jaccard
+        self.fallback_min_jaccard = fallback_min_jaccard
+        self.bands = bands
+        self.rows = NUM_PERM // bands
+        self._buckets = [{} for _ in range(bands)]
+        self._features = []
+        self._keys = []
+        self._groups = []
+    
+    def __len__(self) -> int:
+        return len(self._features)
+    
+    def _band_keys(self, features: FrozenSet[int]) -> List[tuple]:
+        signature = minhash_signature(features)
+        return [
+            (band, tuple(signature[band * self.rows:(band + 1) * self.rows]))
+            for band in range(self.bands)
+        ]
+    
+    def _find(self, features: FrozenSet[int], group: Tuple[int, bool], band_keys: List[tuple]) -> Optional[str]:
+        min_jaccard = self.min_jaccard if group[1] else self.fallback_min_jaccard
+        checked = set()
+        for band, band_key in band_keys:
+            for item in self._buckets[band].get(band_key, ()):
+                if item in checked:
+                    continue
+                checked.add(item)
+                if self._groups[item] != group:
+                    continue
+                other = self._features[item]
+                if (containment(features, other) >= self.threshold
+                        and jaccard(features, other) >= min_jaccard):
+                    return self._keys[item]
+        return None
+    
+    def _add(self, features: FrozenSet[int], key: str, group: Tuple[int, bool], band_keys: List[tuple]) -> None:
+        item = len(self._features)
+        self._features.append(features)
+        self._keys.append(key or "")
+        self._groups.append(group)
+        for band, band_key in band_keys:
+            self._buckets[band].setdefault(band_key, []).append(item)
+    
+    def find(self, features: FrozenSet[int], group: Optional[Tuple[int, bool]]) -> Optional[str]:
+        """
+        Look for an indexed near-duplicate in the same group.
+        
+        Args:
+            features: Output of job_features()
+            group: Output of dedupe_group() (None never matches)
+        
+        Returns:
+            Key of the matching job ('' if it had none), or None
+        """
+        if not features or group is None:
+            return None
+        return self._find(features, group, self._band_keys(features))
+    
+    def add(self, features: FrozenSet[int], group: Optional[Tuple[int, bool]], key: str = "") -> None:
+        """Index a kept job (jobs without a group are not indexed)"""
+        if features and group is not None:
+            self._add(features, key, group, self._band_keys(features))
+    
+    def add_if_new(self, features: FrozenSet[int], group: Optional[Tuple[int, bool]],
+                   key: str = "") -> Optional[str]:
+        """
+        Index a job unless it near-duplicates one already indexed.
+        
+        Computes the MinHash signature once for both steps. Jobs without
+        a group are neither matched nor indexed.
+        
+        Returns:
+            Key of the matching job if it is a duplicate, else None
+        """
+        if not features or group is None:
+            return None
+        
+        band_keys = self._band_keys(features)
+        match = self._find(features, group, band_keys)
+        if match is None:
+            self._add(features, key, group, band_keys)
+        return match
+    
+    # ---------- persistence ----------
+    
+    @classmethod
+    def load(cls, path: str = NEAR_DUP_INDEX_FILE, **kwargs) -> "NearDuplicateIndex":
+        """
+        Rebuild the index from the recent-jobs file (empty if missing).
+        
+        Entries without a group (written before jobs were compared per
+        group) are dropped.
+        """
+        index = cls(**kwargs)
+        if not os.path.exists(path):
+            return index
+        
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            for entry in data.get("jobs", []):
+                if entry.get("c"):
+                    group = (entry["c"], bool(entry.get("n", True)))
+                    index.add(frozenset(entry["f"]), group, entry.get("k", ""))
+        except Exception as e:
+            print(f"⚠️ Error loading near-duplicate index: {e}")
+        
+        return index
+    
+    def save(self, path: str = NEAR_DUP_INDEX_FILE, max_jobs: int = NEAR_DUP_HISTORY_SIZE) -> None:
+        """Persist the most recent max_jobs entries"""
+        start = max(0, len(self._features) - max_jobs)
+        data = {
+            "jobs": [
+                {"k": key, "c": group[0], "n": int(group[1]), "f": sorted(features)}
+                for key, group, features in zip(
+                    self._keys[start:], self._groups[start:], self._features[start:]
+                )
+            ]
+        }
+        
+        try:
+            directory = os.path.dirname(path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            tmp_path = path + ".tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f)
+            os.replace(tmp_path, path)
+        except Exception as e:
+            print(f"⚠️ Error saving near-duplicate index: {e}")
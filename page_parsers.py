@@ -0,0 +1,632 @@
+"""
+Page Parsers Module
+Turns fetched listing pages into job dicts, one parser per source.
+Pages are parsed with lxml and searched with XPath selectors compiled
+once per source; every field lookup is scoped to a job card's subtree.
+BeautifulSoup (html.parser) remains as the fallback backend.
+"""
+
+import os
+import re
+from typing import Callable, Dict, List, Optional, Tuple, Union
+
+from high_water import posted_before
+from metrics import metrics
+
+# ============================================
+# OPTIONAL LXML BACKEND (SAFE / NON-BREAKING)
+# ============================================
+try:
+    from lxml import etree
+    from lxml import html as lxml_html
+    LXML_AVAILABLE = True
+except Exception as e:
+    LXML_AVAILABLE = False
+    print(f"⚠️ lxml unavailable, pages parsed with html.parser: {e}")
+
+
+# ============================================
+# CONFIGURATION
+# ============================================
+
+# "lxml" (default) or "soup" to parse with BeautifulSoup's html.parser
+PARSER_BACKEND = os.getenv("PAGE_PARSER", "lxml" if LXML_AVAILABLE else "soup")
+
+Markup = Union[str, bytes]
+
+
+# ============================================
+# LXML HELPERS
+# ============================================
+
+# Elements whose strings BeautifulSoup leaves out of get_text()
+_NON_TEXT_TAGS = ("script", "style", "template", "rp", "rt")
+
+
+def _has_class(name: str) -> str:
+    """XPath predicate equal to the CSS class selector .name"""
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+
+def _class_contains(fragment: str) -> str:
+    """XPath predicate: class attribute contains fragment, case-insensitively"""
+    return f"contains(translate(@class, 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), '{fragment}')"
+
+
+def _xpath(expression: str):
+    """Compile an XPath selector once (None without lxml)"""
+    if not LXML_AVAILABLE:
+        return None
+    return etree.XPath(expression, smart_strings=False)
+
+
+_TEXT = _xpath(
+    ".//text()[not(" + " or ".join(f"ancestor::{tag}" for tag in _NON_TEXT_TAGS) + ")]"
+)
+_HAS_NON_TEXT = _xpath("boolean(" + " | ".join(f".//{tag}" for tag in _NON_TEXT_TAGS) + ")")
+
+
+def _first(selector, element):
+    """First match of a compiled selector under element, or None"""
+    matches = selector(element)
+    return matches[0] if matches else None
+
+
+def _text(element, strip: bool = True) -> str:
+    """lxml equivalent of BeautifulSoup's get_text(strip=strip)"""
+    if element is None:
+        return ""
+    # itertext() is faster, but would include script and style contents
+    strings = _TEXT(element) if _HAS_NON_TEXT(element) else element.itertext()
+    if strip:
+        return "".join(s.strip() for s in strings if s.strip())
+    return "".join(strings)
+
+
+def _html_root(markup: Markup):
+    """Parse an HTML page with lxml; None for an empty document"""
+    if isinstance(markup, str):
+        try:
+            return lxml_html.document_fromstring(markup)
+        except ValueError:
+            # str with an XML encoding declaration
+            markup = markup.encode("utf-8")
+        except etree.ParserError:
+            return None
+    try:
+        return lxml_html.document_fromstring(markup)
+    except etree.ParserError:
+        return None
+
+
+# Entities are left unresolved and nothing is fetched from the network
+_XML_PARSER = etree.XMLParser(recover=True, resolve_entities=False, no_network=True) if LXML_AVAILABLE else None
+
+
+def _xml_root(markup: Markup):
+    """Parse an XML feed with lxml; None for an empty document"""
+    if isinstance(markup, str):
+        markup = markup.encode("utf-8")
+    if not markup.strip():
+        return None
+    try:
+        return etree.fromstring(markup, _XML_PARSER)
+    except etree.XMLSyntaxError:
+        return None
+
+
+def _soup(markup: Markup, features: str):
+    """BeautifulSoup tree; bs4 is only imported once the soup backend is used"""
+    from bs4 import BeautifulSoup
+    return BeautifulSoup(markup, features)
+
+
+# ============================================
+# INDEED (RSS)
+# ============================================
+
+# name() keeps namespace prefixes, as BeautifulSoup's tag names do
+_INDEED_ITEMS = _xpath("//*[name()='item']")
+_INDEED_TITLE = _xpath("(.//*[name()='title'])[1]")
+_INDEED_LINK = _xpath("(.//*[name()='link'])[1]")
+_INDEED_DESCRIPTION = _xpath("(.//*[name()='description'])[1]")
+_INDEED_PUB_DATE = _xpath("(.//*[name()='pubDate'])[1]")
+_STRING = _xpath("string(.)")
+
+
+def _indeed_job(title: str, link: str, description: str) -> Optional[dict]:
+    if not (title and link):
+        return None
+    return {
+        "title": title,
+        "link": link,
+        "source": "Indeed",
+        "description": description,
+        "location": "",
+        "stipend": ""
+    }
+
+
+def parse_indeed_lxml(markup: Markup, since: Optional[float] = None) -> List[dict]:
+    """Indeed RSS feed -> jobs (lxml)"""
+    root = _xml_root(markup)
+    if root is None:
+        return []
+    
+    jobs = []
+    for item in _INDEED_ITEMS(root):
+        try:
+            # fromage is day-granular; pubDate trims the rest
+            pub_date = _first(_INDEED_PUB_DATE, item)
+            if pub_date is not None and posted_before(_STRING(pub_date), since):
+                continue
+            
+            title = _first(_INDEED_TITLE, item)
+            link = _first(_INDEED_LINK, item)
+            description = _first(_INDEED_DESCRIPTION, item)
+            
+            job = _indeed_job(
+                _STRING(title).strip() if title is not None else "",
+                _STRING(link).strip() if link is not None else "",
+                _STRING(description) if description is not None else ""
+            )
+            if job:
+                jobs.append(job)
+        except Exception:
+            continue
+    
+    return jobs
+
+
+def parse_indeed_soup(markup: Markup, since: Optional[float] = None) -> List[dict]:
+    """Indeed RSS feed -> jobs (BeautifulSoup)"""
+    soup = _soup(markup, "xml")
+    
+    jobs = []
+    for item in soup.find_all("item"):
+        try:
+            # fromage is day-granular; pubDate trims the rest
+            if item.pubDate and posted_before(item.pubDate.text, since):
+                continue
+            
+            job = _indeed_job(
+                item.title.text.strip() if item.title else "",
+                item.link.text.strip() if item.link else "",
+                item.description.text if item.description else ""
+            )
+            if job:
+                jobs.append(job)
+        except Exception:
+            continue
+    
+    return jobs
+
+
+# ============================================
+# INTERNSHALA
+# ============================================
+
+# Card containers, tried in order until one matches
+_INTERNSHALA_CARDS = [
+    _xpath(f"//*[{_has_class('internship_meta')}]"),
+    _xpath(f"//*[{_has_class('individual_internship')}]"),
+    _xpath(f"//div[{_class_contains('internship')}]"),
+]
+# Title candidates, tried in order (.job-internship-name, .profile h3, h3, a)
+_INTERNSHALA_TITLES = [
+    _xpath(f"(.//*[{_has_class('job-internship-name')}])[1]"),
+    _xpath(f"(.//h3[ancestor::*[{_has_class('profile')}]])[1]"),
+    _xpath("(.//h3)[1]"),
+    _xpath("(.//a)[1]"),
+]
+_INTERNSHALA_LINKS = [
+    _xpath("(.//a[contains(@href, '/internship/detail/')])[1]"),
+    _xpath("(.//a[@href])[1]"),
+]
+_INTERNSHALA_LOCATION = _xpath(f"(.//*[{_has_class('location_link')}])[1]")
+_INTERNSHALA_STIPEND = _xpath(f"(.//*[{_has_class('stipend')}])[1]")
+
+
+def _internshala_job(title: str, href: str, location: str, stipend: str) -> dict:
+    link = "https://internshala.com" + href if href.startswith("/") else href
+    return {
+        "title": title,
+        "link": link,
+        "source": "Internshala",
+        "description": f"{location} {stipend}",
+        "location": location,
+        "stipend": stipend
+    }
+
+
+def parse_internshala_lxml(markup: Markup, since: Optional[float] = None) -> List[dict]:
+    """Internshala category page -> jobs (lxml)"""
+    root = _html_root(markup)
+    if root is None:
+        return []
+    
+    containers = []
+    for selector in _INTERNSHALA_CARDS:
+        containers = selector(root)
+        if containers:
+            break
+    
+    jobs = []
+    for container in containers:
+        try:
+            title_elem = None
+            for selector in _INTERNSHALA_TITLES:
+                title_elem = _first(selector, container)
+                if title_elem is not None:
+                    break
+            
+            if title_elem is None:
+                continue
+            
+            link_elem = _first(_INTERNSHALA_LINKS[0], container)
+            if link_elem is None:
+                link_elem = _first(_INTERNSHALA_LINKS[1], container)
+            
+            if link_elem is None or not link_elem.get("href"):
+                continue
+            
+            jobs.append(_internshala_job(
+                _text(title_elem),
+                link_elem.get("href"),
+                _text(_first(_INTERNSHALA_LOCATION, container)),
+                _text(_first(_INTERNSHALA_STIPEND, container))
+            ))
+        except Exception:
+            continue
+    
+    return jobs
+
+
+def parse_internshala_soup(markup: Markup, since: Optional[float] = None) -> List[dict]:
+    """Internshala category page -> jobs (BeautifulSoup)"""
+    soup = _soup(markup, "html.parser")
+    
+    containers = (
+        soup.select(".internship_meta") or
+        soup.select(".individual_internship") or
+        soup.find_all("div", class_=lambda x: x and "internship" in x.lower())
+    )
+    
+    jobs = []
+    for container in containers:
+        try:
+            title_elem = (
+                container.select_one(".job-internship-name") or
+                container.select_one(".profile h3") or
+                container.select_one("h3") or
+                container.find("a")
+            )
+            
+            if not title_elem:
+                continue
+            
+            link_elem = container.select_one("a[href*='/internship/detail/']") or container.find("a", href=True)
+            
+            if not link_elem or not link_elem.get("href"):
+                continue
+            
+            location_elem = container.select_one(".location_link")
+            stipend_elem = container.select_one(".stipend")
+            
+            jobs.append(_internshala_job(
+                title_elem.get_text(strip=True),
+                link_elem["href"],
+                location_elem.get_text(strip=True) if location_elem else "",
+                stipend_elem.get_text(strip=True) if stipend_elem else ""
+            ))
+        except Exception:
+            continue
+    
+    return jobs
+
+
+# ============================================
+# LINKEDIN
+# ============================================
+
+_LINKEDIN_CARDS = _xpath(f"//div[{_has_class('base-card')}]")
+_LINKEDIN_POSTED = _xpath("(.//time[@datetime])[1]")
+_LINKEDIN_TITLE = _xpath("(.//h3)[1]")
+_LINKEDIN_LINK = _xpath(f"(.//a[{_has_class('base-card__full-link')}])[1]")
+_LINKEDIN_COMPANY = _xpath(f"(.//h4[{_has_class('base-search-card__subtitle')}])[1]")
+_LINKEDIN_SNIPPET = _xpath(f"(.//*[{_has_class('base-search-card__snippet')}])[1]")
+_LINKEDIN_APPLY_METHOD = _xpath(f"(.//*[{_has_class('job-card-container__apply-method')}])[1]")
+_LINKEDIN_LOCATION = _xpath(f"(.//*[{_has_class('job-card-container__metadata-item')}])[1]")
+
+
+def _linkedin_job(title: str, link: str, company: str, snippet: str,
+                  easy_apply: bool, location: str) -> dict:
+    # Enhanced description: combine company + location + snippet
+    description_parts = [p for p in [company, location, snippet] if p]
+    return {
+        "title": title,
+        "link": link,
+        "source": "LinkedIn",
+        "easy_apply": easy_apply,
+        "location": location,
+        "description": " • ".join(description_parts),
+        "stipend": "",
+        "company": company
+    }
+
+
+def parse_linkedin_lxml(markup: Markup, since: Optional[float] = None) -> List[dict]:
+    """LinkedIn search page -> jobs (lxml)"""
+    root = _html_root(markup)
+    if root is None:
+        return []
+    
+    jobs = []
+    for card in _LINKEDIN_CARDS(root):
+        try:
+            posted_elem = _first(_LINKEDIN_POSTED, card)
+            if posted_elem is not None and posted_before(posted_elem.get("datetime", ""), since):
+                continue
+            
+            title_elem = _first(_LINKEDIN_TITLE, card)
+            link_elem = _first(_LINKEDIN_LINK, card)
+            
+            if title_elem is None or link_elem is None:
+                continue
+            
+            link = link_elem.get("href", "").split("?")[0]
+            if not link:
+                continue
+            
+            easy_apply = (
+                _first(_LINKEDIN_APPLY_METHOD, card) is not None or
+                "easyApply" in _text(card, strip=False)
+            )
+            
+            jobs.append(_linkedin_job(
+                _text(title_elem),
+                link,
+                _text(_first(_LINKEDIN_COMPANY, card)),
+                _text(_first(_LINKEDIN_SNIPPET, card)),
+                easy_apply,
+                _text(_first(_LINKEDIN_LOCATION, card))
+            ))
+        except Exception:
+            continue
+    
+    return jobs
+
+
+def parse_linkedin_soup(markup: Markup, since: Optional[float] = None) -> List[dict]:
+    """LinkedIn search page -> jobs (BeautifulSoup)"""
+    soup = _soup(markup, "html.parser")
+    
+    jobs = []
+    for card in soup.select("div.base-card"):
+        try:
+            posted_elem = card.select_one("time[datetime]")
+            if posted_elem and posted_before(posted_elem.get("datetime", ""), since):
+                continue
+            
+            title_elem = card.select_one("h3")
+            link_elem = card.select_one("a.base-card__full-link")
+            
+            if not title_elem or not link_elem:
+                continue
+            
+            link = link_elem.get("href", "").split("?")[0]
+            if not link:
+                continue
+            
+            company_elem = card.select_one("h4.base-search-card__subtitle")
+            snippet_elem = card.select_one(".base-search-card__snippet")
+            location_elem = card.select_one(".job-card-container__metadata-item")
+            easy_apply = bool(
+                card.select_one(".job-card-container__apply-method") or
+                "easyApply" in card.get_text()
+            )
+            
+            jobs.append(_linkedin_job(
+                title_elem.get_text(strip=True),
+                link,
+                company_elem.get_text(strip=True) if company_elem else "",
+                snippet_elem.get_text(strip=True) if snippet_elem else "",
+                easy_apply,
+                location_elem.get_text(strip=True) if location_elem else ""
+            ))
+        except Exception:
+            continue
+    
+    return jobs
+
+
+# ============================================
+# NAUKRI
+# ============================================
+
+_NAUKRI_CARDS = [
+    _xpath(f"//article[{_has_class('jobTuple')}]"),
+    _xpath("//article"),
+]
+_NAUKRI_TITLES = [
+    _xpath(f"(.//a[{_has_class('title')}])[1]"),
+    _xpath("(.//a)[1]"),
+]
+_NAUKRI_LOCATION = _xpath(f"(.//*[{_has_class('location')}])[1]")
+
+
+def _naukri_job(title: str, link: str, location: str) -> Optional[dict]:
+    if not link or not link.startswith("http"):
+        return None
+    return {
+        "title": title,
+        "link": link,
+        "source": "Naukri",
+        "location": location,
+        "description": location,
+        "stipend": ""
+    }
+
+
+def parse_naukri_lxml(markup: Markup, since: Optional[float] = None) -> List[dict]:
+    """Naukri search page -> jobs (lxml)"""
+    root = _html_root(markup)
+    if root is None:
+        return []
+    
+    articles = _NAUKRI_CARDS[0](root) or _NAUKRI_CARDS[1](root)
+    
+    jobs = []
+    for article in articles:
+        try:
+            title_elem = _first(_NAUKRI_TITLES[0], article)
+            if title_elem is None:
+                title_elem = _first(_NAUKRI_TITLES[1], article)
+            
+            if title_elem is None:
+                continue
+            
+            job = _naukri_job(
+                _text(title_elem),
+                title_elem.get("href", ""),
+                _text(_first(_NAUKRI_LOCATION, article))
+            )
+            if job:
+                jobs.append(job)
+        except Exception:
+            continue
+    
+    return jobs
+
+
+def parse_naukri_soup(markup: Markup, since: Optional[float] = None) -> List[dict]:
+    """Naukri search page -> jobs (BeautifulSoup)"""
+    soup = _soup(markup, "html.parser")
+    
+    jobs = []
+    for article in soup.select("article.jobTuple") or soup.find_all("article"):
+        try:
+            title_elem = article.select_one("a.title") or article.select_one("a")
+            
+            if not title_elem:
+                continue
+            
+            location_elem = article.select_one(".location")
+            job = _naukri_job(
+                title_elem.get_text(strip=True),
+                title_elem.get("href", ""),
+                location_elem.get_text(strip=True) if location_elem else ""
+            )
+            if job:
+                jobs.append(job)
+        except Exception:
+            continue
+    
+    return jobs
+
+
+# ============================================
+# INSTAHYRE
+# ============================================
+
+_INSTAHYRE_CARDS = _xpath(f"//div[{_class_contains('opportunity-card')}]")
+_INSTAHYRE_TITLE = _xpath("(.//a[contains(@href, '/job/')])[1]")
+# BeautifulSoup's find(string=...) also searches comments
+_INSTAHYRE_STRINGS = _xpath(".//text() | .//comment()")
+_LOCATION_PATTERN = re.compile("location", re.I)
+
+
+def _instahyre_job(title: str, href: str, location: str) -> dict:
+    return {
+        "title": title,
+        "link": "https://www.instahyre.com" + href,
+        "source": "Instahyre",
+        "location": location,
+        "description": location,
+        "stipend": ""
+    }
+
+
+def parse_instahyre_lxml(markup: Markup, since: Optional[float] = None) -> List[dict]:
+    """Instahyre search page -> jobs (lxml)"""
+    root = _html_root(markup)
+    if root is None:
+        return []
+    
+    jobs = []
+    for card in _INSTAHYRE_CARDS(root):
+        try:
+            title_elem = _first(_INSTAHYRE_TITLE, card)
+            if title_elem is None:
+                continue
+            
+            location = ""
+            for node in _INSTAHYRE_STRINGS(card):
+                string = node if isinstance(node, str) else (node.text or "")
+                if _LOCATION_PATTERN.search(string):
+                    location = string.strip()
+                    break
+            
+            jobs.append(_instahyre_job(_text(title_elem), title_elem.get("href", ""), location))
+        except Exception:
+            continue
+    
+    return jobs
+
+
+def parse_instahyre_soup(markup: Markup, since: Optional[float] = None) -> List[dict]:
+    """Instahyre search page -> jobs (BeautifulSoup)"""
+    soup = _soup(markup, "html.parser")
+    
+    jobs = []
+    for card in soup.find_all("div", class_=lambda x: x and "opportunity-card" in str(x).lower()):
+        try:
+            title_elem = card.find("a", href=lambda x: x and "/job/" in str(x))
+            if not title_elem:
+                continue
+            
+            location_elem = card.find(string=_LOCATION_PATTERN)
+            jobs.append(_instahyre_job(
+                title_elem.get_text(strip=True),
+                title_elem.get("href", ""),
+                location_elem.strip() if location_elem else ""
+            ))
+        except Exception:
+            continue
+    
+    return jobs
+
+
+# ============================================
+# DISPATCH
+# ============================================
+
+# Source name -> (lxml parser, BeautifulSoup parser)
+PAGE_PARSERS: Dict[str, Tuple[Callable, Callable]] = {
+    "Indeed": (parse_indeed_lxml, parse_indeed_soup),
+    "Internshala": (parse_internshala_lxml, parse_internshala_soup),
+    "LinkedIn": (parse_linkedin_lxml, parse_linkedin_soup),
+    "Naukri": (parse_naukri_lxml, parse_naukri_soup),
+    "Instahyre": (parse_instahyre_lxml, parse_instahyre_soup),
+}
+
+
+def parse_page(source: str, markup: Markup, since: Optional[float] = None,
+               backend: Optional[str] = None) -> List[dict]:
+    """
+    Extract the jobs listed on one fetched page.
+    
+    Args:
+        source: Source name (key of PAGE_PARSERS)
+        markup: Page body (HTML, or RSS for Indeed)
+        since: Skip postings dated before this unix time (None = keep all)
+        backend: "lxml" or "soup" (default: PARSER_BACKEND)
+    
+    Returns:
+        List of job dicts, the same for either backend
+    """
+    lxml_parser, soup_parser = PAGE_PARSERS[source]
+    backend = backend or PARSER_BACKEND
+    parser = lxml_parser if backend == "lxml" and LXML_AVAILABLE else soup_parser
+    with metrics.span(f"parse.{source}"):
+        return parser(markup, since)
@@ -0,0 +1,335 @@
+"""
+Profiling Module
+Opt-in profiling of a whole run, off unless asked for:
+- "cprofile": deterministic profile (cProfile) of the main thread
+  (pipeline, filtering, scoring, sinks); writes .prof stats, a
+  top-functions summary and folded stacks
+- "sample": samples every thread's stack every few milliseconds (low
+  overhead, real call stacks, fetch workers included); writes folded stacks
+- "functions": times each call of the scraping and scoring hot spots
+  (TIMED_FUNCTIONS) as metrics spans "func.<name>", so they also land
+  in run_metrics.jsonl
+
+Folded stacks ("frame;frame;frame weight" per line) are flamegraph
+input for flamegraph.pl, inferno or speedscope.
+
+Usage:
+    PROFILE_RUN=sample python job_agent.py
+    python job_agent.py --profile                     # cprofile
+    python job_agent.py --profile=sample,functions
+"""
+
+import importlib
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Callable, Iterable, List, Optional, Set, Tuple
+
+from metrics import metrics
+
+
+# ============================================
+# CONFIGURATION
+# ============================================
+
+PROFILE_MODES = ("cprofile", "sample", "functions")
+
+# Comma-separated modes (empty = off); --profile[=modes] on the command line
+PROFILE_RUN = os.getenv("PROFILE_RUN", "")
+
+PROFILE_DIR = os.getenv("PROFILE_DIR", "profile_runs")
+
+# Seconds between stack samples
+SAMPLE_INTERVAL = float(os.getenv("PROFILE_SAMPLE_INTERVAL", "0.005"))
+
+# cProfile call paths below this share of the run are left out of the folded stacks
+FOLD_MIN_SHARE = 0.0005
+
+# Hot spots timed per call in "functions" mode: (module, attribute path).
+# Scoring is columnar now, so next to score_job, extract_skills_from_text
+# and get_company_tier this lists the batch functions doing that work;
+# _soup, _html_root and _xml_root are the page parse calls of the
+# BeautifulSoup and lxml backends.
+TIMED_FUNCTIONS = [
+    ("ai_matcher", "AIJobMatcher.score_job"),
+    ("ai_matcher", "_score_chunk"),
+    ("hybrid_scorer", "extract_skills_from_text"),
+    ("keyword_matcher", "SkillExtractor.extract"),
+    ("company_ranker", "get_company_tier"),
+    ("company_ranker", "_tier_for_normalized"),
+    ("company_ranker", "normalize_company_names"),
+    ("page_parsers", "_soup"),
+    ("page_parsers", "_html_root"),
+    ("page_parsers", "_xml_root"),
+]
+
+
+# ============================================
+# SWITCHES
+# ============================================
+
+def parse_modes(value: str) -> Set[str]:
+    """Profiling modes named in "a,b" (unknown names are reported and ignored)"""
+    modes = set()
+    for mode in value.replace(" ", "").lower().split(","):
+        if not mode:
+            continue
+        if mode in PROFILE_MODES:
+            modes.add(mode)
+        else:
+            print(f"⚠️ Unknown profiling mode '{mode}' (choose from {', '.join(PROFILE_MODES)})")
+    return modes
+
+
+def profiling_modes(argv: Optional[List[str]] = None) -> Set[str]:
+    """
+    Modes asked for by PROFILE_RUN and --profile[=modes].
+    
+    Args:
+        argv: Command-line arguments (default: sys.argv[1:])
+    
+    Returns:
+        Set of modes; empty when profiling is off
+    """
+    modes = parse_modes(PROFILE_RUN)
+    for arg in sys.argv[1:] if argv is None else argv:
+        if arg == "--profile":
+            modes.add("cprofile")
+        elif arg.startswith("--profile="):
+            modes |= parse_modes(arg.split("=", 1)[1])
+    return modes
+
+
+# ============================================
+# FOLDED STACKS
+# ============================================
+
+def _frame_label(filename: str, name: str) -> str:
+    """One stack frame as module:function (';' would split the frame)"""
+    module = os.path.splitext(os.path.basename(filename))[0]
+    # "~" = built-ins, "<...>" = generated code (e.g. metrics' span wrappers)
+    label = f"{module}:{name}" if module and not filename.startswith(("~", "<")) else name
+    return label.replace(";", ":")
+
+
+def write_folded(stacks: Counter, path: str) -> None:
+    """Write folded stacks, heaviest first"""
+    with open(path, 'w', encoding='utf-8') as f:
+        for stack, weight in stacks.most_common():
+            if weight > 0:
+                f.write(f"{stack} {weight}\n")
+
+
+def cprofile_folded(stats) -> Counter:
+    """
+    Folded stacks from cProfile stats, weighted in microseconds.
+    
+    cProfile records caller -> callee edges, not whole stacks, so each
+    path's time is estimated by splitting a function's time among its
+    callers in proportion to the time each caller spent in it.
+    
+    Args:
+        stats: pstats.Stats of the run
+    
+    Returns:
+        Counter of "frame;frame;..." -> microseconds of own time
+    """
+    entries = stats.stats
+    callees = {}
+    for func, (_, _, _, _, callers) in entries.items():
+        for caller, edge in callers.items():
+            callees.setdefault(caller, []).append((func, edge[3]))
+    
+    roots = [func for func, entry in entries.items() if not entry[4]]
+    total = sum(entries[func][3] for func in roots) or 1.0
+    cutoff = total * FOLD_MIN_SHARE
+    stacks = Counter()
+    
+    def walk(func, path, labels, seconds):
+        _, _, own, cumulative, _ = entries[func]
+        share = min(seconds / cumulative, 1.0) if cumulative else 0.0
+        stacks[";".join(labels)] += int(own * share * 1e6)
+        for callee, edge_seconds in callees.get(func, ()):
+            attributed = edge_seconds * share
+            if callee in path or attributed < cutoff:
+                continue
+            walk(callee, path | {callee}, labels + [_frame_label(callee[0], callee[2])], attributed)
+    
+    for root in roots:
+        if entries[root][3] >= cutoff:
+            walk(root, {root}, [_frame_label(root[0], root[2])], entries[root][3])
+    return stacks
+
+
+class SamplingProfiler:
+    """
+    Samples every thread's Python stack at a fixed interval from a
+    background thread. Each thread's stacks are rooted at its name, so
+    fetch workers and the main pipeline show up side by side.
+    """
+    
+    def __init__(self, interval: float = SAMPLE_INTERVAL):
+        self.interval = interval
+        self.samples = Counter()
+        self._stop = threading.Event()
+        self._thread = None
+    
+    def _sample(self) -> None:
+        own = threading.get_ident()
+        names = {thread.ident: thread.name for thread in threading.enumerate()}
+        for thread_id, frame in sys._current_frames().items():
+            if thread_id == own:
+                continue
+            labels = []
+            while frame is not None:
+                code = frame.f_code
+                labels.append(_frame_label(code.co_filename, code.co_name))
+                frame = frame.f_back
+            labels.append(names.get(thread_id, "thread").replace(";", ":").replace(" ", "_"))
+            self.samples[";".join(reversed(labels))] += 1
+    
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            self._sample()
+    
+    def start(self) -> "SamplingProfiler":
+        self._thread = threading.Thread(target=self._run, name="sampler", daemon=True)
+        self._thread.start()
+        return self
+    
+    def stop(self) -> Counter:
+        """Stop sampling; returns the folded stacks (weight = samples)"""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+        return self.samples
+
+
+# ============================================
+# PER-FUNCTION TIMING
+# ============================================
+
+def instrument_functions(targets: Iterable[Tuple[str, str]] = TIMED_FUNCTIONS) -> Callable[[], None]:
+    """
+    Time every call of the target functions as metrics spans "func.<name>".
+    
+    Imports the target modules, so profile_run only calls it in
+    "functions" mode; other runs keep the deferred imports of startup.
+    
+    Args:
+        targets: (module, attribute path) pairs, e.g. ("company_ranker", "get_company_tier")
+    
+    Returns:
+        Function that restores the originals
+    """
+    patched = []
+    for module_name, path in targets:
+        try:
+            owner = importlib.import_module(module_name)
+            *parents, attr = path.split(".")
+            for parent in parents:
+                owner = getattr(owner, parent)
+            original = owner.__dict__[attr]
+        except (ImportError, AttributeError, KeyError) as e:
+            print(f"⚠️ Cannot time {module_name}.{path}: {e}")
+            continue
+        
+        setattr(owner, attr, metrics.timed(f"func.{path}")(original))
+        patched.append((owner, attr, original))
+    
+    def restore():
+        for owner, attr, original in reversed(patched):
+            setattr(owner, attr, original)
+    
+    return restore
+
+
+def print_function_times() -> None:
+    """Per-call timings gathered in "functions" mode, slowest total first"""
+    rows = sorted(
+        ((name, metrics.span_calls[name], seconds) for name, seconds in metrics.span_seconds.items()
+         if name.startswith("func.")),
+        key=lambda row: row[2], reverse=True
+    )
+    if not rows:
+        return
+    print(f"\n⏱️ Function timings:")
+    for name, calls, seconds in rows:
+        print(f"   {name[5:]:<40} {calls:>8} calls {seconds:>8.3f}s {seconds / calls * 1e6:>9.1f} µs/call")
+
+
+# ============================================
+# WHOLE-RUN PROFILING
+# ============================================
+
+@contextmanager
+def profile_run(modes: Set[str], out_dir: str = PROFILE_DIR, label: str = "run"):
+    """
+    Profile the enclosed block in the given modes and write the results
+    to out_dir as <timestamp>-<label>.* (also when the block raises).
+    
+    Args:
+        modes: Subset of PROFILE_MODES (empty = no profiling)
+        out_dir: Output directory
+        label: File name part naming what was profiled
+    """
+    if not modes:
+        yield
+        return
+    
+    prefix = os.path.join(out_dir, f"{datetime.now().strftime('%Y%m%d-%H%M%S')}-{label}")
+    restore = instrument_functions() if "functions" in modes else None
+    sampler = SamplingProfiler().start() if "sample" in modes else None
+    profiler = None
+    if "cprofile" in modes:
+        import cProfile
+        profiler = cProfile.Profile()
+        profiler.enable()
+    
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        if profiler is not None:
+            profiler.disable()
+        samples = sampler.stop() if sampler is not None else None
+        if restore is not None:
+            restore()
+        _write_profiles(prefix, profiler, samples, restore is not None, time.perf_counter() - started)
+
+
+def _write_profiles(prefix: str, profiler, samples: Optional[Counter], timed: bool, seconds: float) -> None:
+    """Save whatever profile_run collected"""
+    try:
+        os.makedirs(os.path.dirname(prefix) or ".", exist_ok=True)
+        written = []
+        
+        if profiler is not None:
+            import io
+            import pstats
+            profiler.dump_stats(f"{prefix}.prof")
+            summary = io.StringIO()
+            stats = pstats.Stats(profiler, stream=summary)
+            stats.sort_stats("cumulative").print_stats(40)
+            with open(f"{prefix}.txt", 'w', encoding='utf-8') as f:
+                f.write(summary.getvalue())
+            write_folded(cprofile_folded(stats), f"{prefix}.cprofile.folded")
+            written += [f"{prefix}.prof", f"{prefix}.txt", f"{prefix}.cprofile.folded"]
+        
+        if samples is not None:
+            write_folded(samples, f"{prefix}.sample.folded")
+            written.append(f"{prefix}.sample.folded")
+        
+        if timed:
+            print_function_times()
+        
+        if written:
+            print(f"\n🔬 Profiled {seconds:.1f}s run:")
+        for path in written:
+            print(f"   📄 {path}")
+    except Exception as e:
+        print(f"⚠️ Could not write profiles: {e}")
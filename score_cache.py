@@ -0,0 +1,161 @@
+"""
+Score Cache Module
+Persistent memo of pure scoring results.
+Keyed by a content hash of the job fields a scorer reads plus a version
+hash of its keyword lists and weights, so any config change invalidates.
+"""
+
+import hashlib
+import json
+import os
+from collections import OrderedDict
+from typing import Any, Optional
+
+
+# ============================================
+# CONFIGURATION
+# ============================================
+
+# Set SCORE_CACHE=0 to always recompute
+SCORE_CACHE_ENABLED = os.getenv("SCORE_CACHE", "1") != "0"
+SCORE_CACHE_FILE = os.getenv("SCORE_CACHE_FILE", os.path.join(".cache", "score_cache.json"))
+SCORE_CACHE_MAX_ENTRIES = 20000   # least recently used scores are evicted beyond this
+
+
+# ============================================
+# HASHING
+# ============================================
+
+def _jsonable(value):
+    """json.dumps fallback: sets become sorted lists"""
+    if isinstance(value, (set, frozenset)):
+        return sorted(value)
+    raise TypeError(f"Cannot hash {type(value).__name__} into a config version")
+
+
+def config_version(*parts) -> str:
+    """
+    Short stable hash of scoring configuration.
+    
+    Args:
+        *parts: Keyword lists, weights and other JSON-able settings
+    
+    Returns:
+        16-character hex digest
+    """
+    payload = json.dumps(parts, sort_keys=True, default=_jsonable, ensure_ascii=False)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()[:16]
+
+
+def content_hash(*values) -> str:
+    """
+    Hash of the job fields a scorer reads.
+    
+    Args:
+        *values: Field values in a fixed order (None counts as empty)
+    
+    Returns:
+        32-character hex digest
+    """
+    payload = "\x1f".join("" if v is None else str(v) for v in values)
+    return hashlib.blake2b(payload.encode('utf-8'), digest_size=16).hexdigest()
+
+
+# ============================================
+# LRU CACHE
+# ============================================
+
+class ScoreCache:
+    """
+    On-disk LRU of scoring results.
+    
+    Keys are "<namespace>:<config version>:<content hash>". A config
+    change yields new keys, so stale scores are never served and simply
+    age out of the LRU.
+    """
+    
+    def __init__(self, path: str = SCORE_CACHE_FILE, max_entries: int = SCORE_CACHE_MAX_ENTRIES):
+        self.path = path
+        self.max_entries = max_entries
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self._load()
+    
+    def _load(self) -> None:
+        """Read cached scores from disk, oldest first"""
+        if not os.path.exists(self.path):
+            return
+        
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except Exception as e:
+            print(f"⚠️ Error loading score cache: {e}")
+            return
+        
+        for key, value in data.get("entries", []):
+            self.entries[key] = value
+    
+    def get(self, namespace: str, version: str, key: str) -> Optional[Any]:
+        """
+        Cached value, or None on a miss.
+        
+        Args:
+            namespace: Scorer name ("ai", "keyword", "company")
+            version: config_version() of the scorer
+            key: content_hash() of the job fields
+        """
+        full_key = f"{namespace}:{version}:{key}"
+        value = self.entries.get(full_key)
+        if value is None:
+            self.misses += 1
+            return None
+        
+        self.entries.move_to_end(full_key)
+        self.hits += 1
+        return value
+    
+    def put(self, namespace: str, version: str, key: str, value: Any) -> None:
+        """Store a JSON-able result, evicting the least recently used beyond max_entries"""
+        full_key = f"{namespace}:{version}:{key}"
+        self.entries[full_key] = value
+        self.entries.move_to_end(full_key)
+        
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+    
+    def save(self) -> None:
+        """Write the cache atomically"""
+        data = {"entries": list(self.entries.items())}
+        
+        try:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            tmp_path = self.path + ".tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False)
+            os.replace(tmp_path, self.path)
+            print(f"💾 Score cache saved: {len(self.entries)} scores ({self.hits} reused this run)")
+        except Exception as e:
+            print(f"⚠️ Error saving score cache: {e}")
+
+
+_score_cache = None
+
+
+def get_score_cache() -> Optional[ScoreCache]:
+    """Get or create the score cache singleton (None when disabled)"""
+    global _score_cache
+    if not SCORE_CACHE_ENABLED:
+        return None
+    if _score_cache is None:
+        _score_cache = ScoreCache()
+    return _score_cache
+
+
+def save_score_cache() -> None:
+    """Persist the score cache if it was used this run"""
+    if _score_cache is not None:
+        _score_cache.save()
@@ -0,0 +1,318 @@
+"""
+Scoring Profile Module
+One candidate's skills, weights and company preferences in profile.json,
+compiled once into matchers and company indexes.
+The compiled indexes are cached as plain JSON under .cache, one file per
+profile name, stamped with the profile and code hashes.
+"""
+
+import copy
+import hashlib
+import importlib.util
+import json
+import os
+import re
+from typing import List, Optional
+
+from score_cache import config_version
+
+
+# ============================================
+# CONFIGURATION
+# ============================================
+
+# Active profile; JOB_PROFILE may point at another candidate's file
+PROFILE_FILE = os.getenv("JOB_PROFILE", "profile.json")
+
+# Profiles scored together by job_agent.main, comma-separated
+# (e.g. JOB_PROFILES=profile.json,profiles/ml_engineer.json)
+PROFILE_FILES = [path.strip() for path in os.getenv("JOB_PROFILES", PROFILE_FILE).split(",") if path.strip()]
+PROFILE_CACHE_DIR = os.path.join(".cache", "profiles")
+
+# The complete default profile; other profile files only need the values
+# they change. Company tier lists and aliases default to those in company_ranker.py.
+DEFAULT_PROFILE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "profile.json")
+
+# Bump when compiled artifacts change shape, so old snapshots are rebuilt
+PROFILE_FORMAT_VERSION = 2
+
+# Modules whose code builds a compiled profile; editing any of them
+# also rebuilds the cached snapshots
+COMPILED_MODULES = ("company_ranker", "keyword_matcher", "scoring_profile")
+
+
+# ============================================
+# LOADING
+# ============================================
+
+def _merge(base: dict, override: dict) -> dict:
+    """Deep-merge override onto a copy of base (lists are replaced)"""
+    merged = copy.deepcopy(base)
+    for key, value in override.items():
+        if isinstance(value, dict) and isinstance(merged.get(key), dict):
+            merged[key] = _merge(merged[key], value)
+        else:
+            merged[key] = copy.deepcopy(value)
+    return merged
+
+
+def load_profile_config(path: Optional[str] = PROFILE_FILE) -> dict:
+    """
+    Read a profile file on top of the default profile (DEFAULT_PROFILE_FILE).
+    
+    Args:
+        path: JSON profile file (None or missing = default profile)
+    
+    Returns:
+        Complete profile dict, company lists filled in
+    
+    Raises:
+        OSError, ValueError: If the default profile cannot be read
+    """
+    with open(DEFAULT_PROFILE_FILE, 'r', encoding='utf-8') as f:
+        config = json.load(f)
+    
+    if path and os.path.exists(path) and not os.path.samefile(path, DEFAULT_PROFILE_FILE):
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                config = _merge(config, json.load(f))
+        except Exception as e:
+            print(f"⚠️ Error loading profile {path}: {e}")
+    
+    import company_ranker
+    companies = config["companies"]
+    companies.setdefault("tier_1", sorted(company_ranker.TIER_1_COMPANIES))
+    companies.setdefault("tier_2", sorted(company_ranker.TIER_2_COMPANIES))
+    companies.setdefault("aliases", dict(company_ranker.COMPANY_ALIASES))
+    
+    return config
+
+
+# ============================================
+# COMPILED PROFILE
+# ============================================
+
+class CompiledProfile:
+    """
+    Everything the scorers need for one profile, built once.
+    
+    Attributes:
+        name: Profile name (used for per-profile outputs)
+        config: The complete profile dict
+        version: Hash of config; with the code hash, the on-disk cache key
+        ai_matcher: Configured AIJobMatcher (built on first use)
+        skill_extractor: SkillExtractor over the required skills + synonyms
+        user_skills: The candidate's skills, canonicalized
+        company_index / fuzzy_index: Company lookups over the tier lists
+        keyword_version / company_version: Score cache versions
+        chat_id_env / csv_file: Where this profile's alerts and rows go
+    """
+    
+    def __init__(self, config: dict, compiled: Optional[dict] = None):
+        """
+        Args:
+            config: Complete profile dict (load_profile_config())
+            compiled: Indexes from to_data() of a profile with the same
+                      config, so they are not rebuilt
+        """
+        from company_ranker import CompanyIndex, FuzzyCompanyIndex, MATCH_SETTINGS
+        from keyword_matcher import SkillExtractor
+        
+        self.config = config
+        self.name = config.get("name", "default")
+        self.version = config_version(PROFILE_FORMAT_VERSION, config)
+        
+        self._ai_matcher = None
+        
+        hybrid = config["hybrid"]
+        self.required_skills = list(hybrid["required_skills"])
+        if compiled:
+            self.skill_extractor = SkillExtractor.from_data(compiled["skill_extractor"])
+        else:
+            self.skill_extractor = SkillExtractor({
+                skill: hybrid["skill_synonyms"].get(skill, []) for skill in self.required_skills
+            })
+        self.user_skills = [self.skill_extractor.canonical(s) for s in hybrid["user_skills"]]
+        self.ai_weight = hybrid["ai_weight"]
+        self.keyword_weight = hybrid["keyword_weight"]
+        self.default_keyword_score = hybrid["default_keyword_score"]
+        self.keyword_version = config_version(PROFILE_FORMAT_VERSION, hybrid)
+        
+        companies = config["companies"]
+        self.tier_scores = {int(tier): score for tier, score in companies["tier_scores"].items()}
+        self.hybrid_rank_weight = companies["hybrid_weight"]
+        self.company_rank_weight = companies["company_weight"]
+        self.alert_min_company_score = companies["alert_min_company_score"]
+        if compiled:
+            self.company_index = CompanyIndex.from_data(compiled["company_index"])
+            self.fuzzy_index = FuzzyCompanyIndex.from_data(compiled["fuzzy_index"])
+        else:
+            self.company_index = CompanyIndex(
+                {1: companies["tier_1"], 2: companies["tier_2"]}, companies["aliases"]
+            )
+            self.fuzzy_index = FuzzyCompanyIndex(self.company_index.exact)
+        self.company_version = config_version(
+            PROFILE_FORMAT_VERSION, companies["tier_1"], companies["tier_2"],
+            companies["aliases"], MATCH_SETTINGS
+        )
+        
+        delivery = config["delivery"]
+        self.chat_id_env = delivery["chat_id_env"]
+        self.csv_file = delivery["csv_file"]
+    
+    @property
+    def ai_matcher(self):
+        """The AIJobMatcher, constructed when scoring first needs it"""
+        if self._ai_matcher is None:
+            from ai_matcher import AIJobMatcher
+            self._ai_matcher = AIJobMatcher(self.config["ai_matcher"])
+        return self._ai_matcher
+    
+    def to_data(self) -> dict:
+        """The compiled indexes as plain JSON-serializable data"""
+        return {
+            "skill_extractor": self.skill_extractor.to_data(),
+            "company_index": self.company_index.to_data(),
+            "fuzzy_index": self.fuzzy_index.to_data()
+        }
+
+
+def _code_version() -> str:
+    """Hash of the COMPILED_MODULES sources (read, not imported)"""
+    digest = hashlib.blake2b(digest_size=8)
+    for name in COMPILED_MODULES:
+        spec = importlib.util.find_spec(name)
+        if spec and spec.origin and os.path.exists(spec.origin):
+            with open(spec.origin, 'rb') as f:
+                digest.update(f.read())
+    return digest.hexdigest()
+
+
+def _snapshot_path(name: str) -> str:
+    """Compiled-profile snapshot for a profile name (one file per name)"""
+    safe = re.sub(r'[^A-Za-z0-9_.-]', '_', name) or "default"
+    return os.path.join(PROFILE_CACHE_DIR, f"{safe}.json")
+
+
+def _load_snapshot(path: str, version: str, code_version: str) -> Optional[dict]:
+    """Compiled indexes from a snapshot, or None if missing or stale"""
+    if not os.path.exists(path):
+        return None
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            snapshot = json.load(f)
+        if snapshot.get("version") == version and snapshot.get("code") == code_version:
+            return snapshot["compiled"]
+    except Exception as e:
+        print(f"⚠️ Rebuilding compiled profile: {e}")
+    return None
+
+
+def _save_snapshot(path: str, version: str, code_version: str, profile: CompiledProfile) -> None:
+    """Write a snapshot atomically and remove leftover pickles of the old format"""
+    os.makedirs(PROFILE_CACHE_DIR, exist_ok=True)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump({"version": version, "code": code_version, "compiled": profile.to_data()}, f)
+    os.replace(tmp_path, path)
+    
+    for name in os.listdir(PROFILE_CACHE_DIR):
+        if name.endswith(".pkl"):
+            os.remove(os.path.join(PROFILE_CACHE_DIR, name))
+
+
+def load_profile(path: Optional[str] = PROFILE_FILE) -> CompiledProfile:
+    """
+    Compiled profile for a file, from its on-disk snapshot when the
+    profile and the compiling code are unchanged.
+    
+    Args:
+        path: JSON profile file (None = default profile)
+    
+    Returns:
+        CompiledProfile
+    """
+    config = load_profile_config(path)
+    version = config_version(PROFILE_FORMAT_VERSION, config)
+    code_version = _code_version()
+    snapshot_path = _snapshot_path(config.get("name", "default"))
+    
+    compiled = _load_snapshot(snapshot_path, version, code_version)
+    if compiled is not None:
+        try:
+            return CompiledProfile(config, compiled)
+        except Exception as e:
+            print(f"⚠️ Rebuilding compiled profile: {e}")
+    
+    profile = CompiledProfile(config)
+    
+    try:
+        _save_snapshot(snapshot_path, version, code_version, profile)
+    except Exception as e:
+        print(f"⚠️ Error caching compiled profile: {e}")
+    
+    return profile
+
+
+class ProfileSet:
+    """
+    Several compiled profiles (e.g. one per candidate) scored in one pass.
+    
+    Attributes:
+        profiles: CompiledProfiles in order; score matrices have one column each
+        skill_scanner: SkillExtractor over every profile's skill forms, so
+                       a job's text is scanned for skills once
+    """
+    
+    def __init__(self, profiles: List[CompiledProfile]):
+        from keyword_matcher import SkillExtractor
+        
+        names = [profile.name for profile in profiles]
+        if len(set(names)) != len(names):
+            raise ValueError(f"Profile names must be unique: {names}")
+        
+        csv_files = [profile.csv_file for profile in profiles]
+        if len(set(csv_files)) != len(csv_files):
+            print(f"⚠️ Several profiles write to the same CSV: {csv_files}")
+        
+        self.profiles = list(profiles)
+        self.skill_scanner = SkillExtractor.combine(p.skill_extractor for p in self.profiles)
+    
+    def __iter__(self):
+        return iter(self.profiles)
+    
+    def __len__(self) -> int:
+        return len(self.profiles)
+    
+    def __getitem__(self, index: int) -> CompiledProfile:
+        return self.profiles[index]
+
+
+def load_profiles(paths: Optional[List[str]] = None) -> ProfileSet:
+    """
+    Compile several profiles for scoring in one pass.
+    
+    Args:
+        paths: JSON profile files (default: PROFILE_FILES)
+    
+    Returns:
+        ProfileSet in the given order
+    """
+    return ProfileSet([load_profile(path) for path in (paths or PROFILE_FILES)])
+
+
+_active_profile = None
+
+
+def get_profile() -> CompiledProfile:
+    """Get or load the active profile (PROFILE_FILE) singleton"""
+    global _active_profile
+    if _active_profile is None:
+        _active_profile = load_profile(PROFILE_FILE)
+    return _active_profile
+
+
+def set_profile(profile: CompiledProfile) -> None:
+    """Make a profile the default for scorers called without one"""
+    global _active_profile
+    _active_profile = profile
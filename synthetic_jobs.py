@@ -0,0 +1,276 @@
+"""
+Synthetic Jobs Module
+Seeded generator of realistic job postings for load testing.
+Titles follow the portals' styles, companies come from the tier lists
+(plus aliases and typos) and a large pool of off-list names, locations
+from PREFERRED_LOCATIONS, and descriptions mention the profile's skills.
+The same seed always yields the same jobs.
+"""
+
+import random
+from typing import Iterator, List, Optional
+
+from company_ranker import COMPANY_ALIASES, TIER_1_COMPANIES, TIER_2_COMPANIES
+from scoring_profile import PROFILE_FILE, load_profile_config
+
+
+# ============================================
+# CONFIGURATION
+# ============================================
+
+# Share of postings per portal
+SOURCE_WEIGHTS = {
+    "LinkedIn": 0.30,
+    "Indeed": 0.25,
+    "Internshala": 0.20,
+    "Naukri": 0.20,
+    "Instahyre": 0.05,
+}
+
+# Company mix: the rest are off-list names
+TIER_1_SHARE = 0.15
+TIER_2_SHARE = 0.15
+ALIAS_SHARE = 0.10      # of listed companies, written as an alias
+TYPO_SHARE = 0.05       # of listed companies, written with one typo
+OFF_LIST_COMPANIES = 20000
+
+# Postings the filters drop, and re-posts of a recent posting
+OFF_ROLE_SHARE = 0.12
+SENIOR_SHARE = 0.08
+REPOST_SHARE = 0.05
+REPOST_WINDOW = 1000    # re-posts copy one of the last N postings
+
+OFF_LIST_LOCATION_SHARE = 0.10
+
+ROLES = [
+    "Data Analyst", "Business Analyst", "Data Analytics", "BI Analyst",
+    "Business Intelligence Analyst", "Analytics", "Junior Analyst",
+    "Associate Analyst", "Analyst Trainee", "Data Intern", "Analytics Intern",
+    "Analyst Intern", "Product Analyst", "Marketing Analyst", "MIS Analyst",
+]
+DOMAINS = [
+    "", "", "", "Sales", "Supply Chain", "Risk", "HR", "Growth", "Customer",
+    "Pricing", "Credit", "E-commerce", "Healthcare", "Fintech", "Marketing",
+]
+LEVELS = [
+    "Intern", "Internship", "Trainee", "Fresher", "Entry Level", "Graduate",
+    "", "", "",
+]
+FOCUSES = [
+    "", "", "", "", "(SQL)", "(Power BI)", "- Excel", "(Python)", "- Tableau",
+    "- Remote", "| Work From Home", "(6 Months)", "- 2026 Batch", "(Paid)",
+    "- Immediate Joiner", "(Hybrid)",
+]
+OFF_ROLES = [
+    "Software Engineer Intern", "Sales Executive", "Graphic Designer",
+    "Content Writer Intern", "Customer Support Associate", "Java Developer",
+    "HR Recruiter", "Digital Marketing Intern", "Mechanical Engineer Trainee",
+]
+SENIOR_PREFIXES = ["Senior", "Sr.", "Lead", "Principal", "Head of"]
+
+OFF_LIST_LOCATIONS = ["Dubai", "Singapore", "London", "Kathmandu", "Dhaka", "Remote - US"]
+STIPENDS = [
+    "₹ 5,000 /month", "₹ 10,000 /month", "₹ 15,000 /month", "₹ 25,000 /month",
+    "3-5 LPA", "Performance based", "Unpaid", "", "",
+]
+
+# Off-list company names: syllables + a word + a legal suffix
+NAME_SYLLABLES = [
+    "ak", "bri", "cor", "dat", "el", "fin", "gra", "hex", "in", "jup",
+    "kin", "lum", "mer", "nov", "or", "pix", "qua", "ra", "syn", "tek",
+    "ul", "vex", "wav", "xen", "yo", "zen", "ab", "cle", "dro", "ver",
+]
+NAME_WORDS = ["Labs", "Analytics", "Data", "Digital", "Ventures", "Systems", "Works", "Insights", ""]
+LEGAL_SUFFIXES = ["Pvt Ltd", "Private Limited", "Technologies", "Solutions", "LLP", "India", "Inc", ""]
+
+SENTENCES = [
+    "You will work with {s1} and {s2} to build weekly reports.",
+    "Hands-on experience with {s1} is a plus.",
+    "Clean and analyse large datasets using {s1}, {s2} and {s3}.",
+    "Build dashboards in {s1} for the {domain} team.",
+    "Strong communication and problem-solving skills required.",
+    "Familiarity with {s1} or {s2} preferred.",
+    "Support senior analysts with ad-hoc analysis and {s1} queries.",
+    "Present insights to stakeholders every sprint.",
+    "Automate recurring reports with {s1}.",
+    "Knowledge of {s1}, {s2} and basic {s3} is required.",
+    "Great learning opportunity with mentorship from the {domain} analytics lead.",
+    "Candidates from any graduate background can apply.",
+]
+EXTRA_SKILLS = ["java", "aws", "spark", "communication", "google sheets", "looker", "sas", "vba"]
+
+
+# ============================================
+# GENERATOR
+# ============================================
+
+class SyntheticJobGenerator:
+    """
+    Deterministic stream of job dicts shaped like the scrapers' output.
+    
+    Links follow each portal's real URL shape with unique IDs, so job keys,
+    near-duplicate features and company lookups behave as on live data.
+    """
+    
+    def __init__(self, seed: int = 0, profile_path: Optional[str] = PROFILE_FILE):
+        """
+        Args:
+            seed: Random seed; the same seed yields the same jobs
+            profile_path: Profile whose skills (and synonyms) descriptions mention
+        """
+        from job_agent import PREFERRED_LOCATIONS
+        
+        self.seed = seed
+        self.rng = random.Random(seed)
+        self.count = 0
+        self.recent = []
+        
+        hybrid = load_profile_config(profile_path)["hybrid"]
+        self.skills = list(hybrid["required_skills"])
+        for forms in hybrid["skill_synonyms"].values():
+            self.skills += forms
+        self.skills += EXTRA_SKILLS
+        
+        self.tier_1 = sorted(TIER_1_COMPANIES)
+        self.tier_2 = sorted(TIER_2_COMPANIES)
+        self.aliases = {}
+        for alias, canonical in sorted(COMPANY_ALIASES.items()):
+            self.aliases.setdefault(canonical, []).append(alias)
+        self.locations = [loc.title() if len(loc) > 3 else loc.upper() for loc in PREFERRED_LOCATIONS]
+        self.sources = list(SOURCE_WEIGHTS)
+        self.source_weights = [SOURCE_WEIGHTS[s] for s in self.sources]
+    
+    # ---------- fields ----------
+    
+    def _title(self) -> str:
+        rng = self.rng
+        roll = rng.random()
+        if roll < OFF_ROLE_SHARE:
+            return rng.choice(OFF_ROLES)
+        
+        parts = [rng.choice(DOMAINS), rng.choice(ROLES), rng.choice(LEVELS), rng.choice(FOCUSES)]
+        if roll < OFF_ROLE_SHARE + SENIOR_SHARE:
+            parts[0] = rng.choice(SENIOR_PREFIXES)
+        return " ".join(part for part in parts if part)
+    
+    def _off_list_company(self) -> str:
+        rng = self.rng
+        index = rng.randrange(OFF_LIST_COMPANIES)
+        # The name depends only on the index, so the pool is fixed
+        a, b, c = index % 30, index // 30 % 30, index // 900 % 30
+        name = (NAME_SYLLABLES[a] + NAME_SYLLABLES[b] + NAME_SYLLABLES[c]).capitalize()
+        word = NAME_WORDS[index % len(NAME_WORDS)]
+        suffix = LEGAL_SUFFIXES[index % len(LEGAL_SUFFIXES)]
+        return " ".join(part for part in (name, word, suffix) if part)
+    
+    def _typo(self, name: str) -> str:
+        """One swapped pair of adjacent letters"""
+        if len(name) < 8:
+            return name
+        i = self.rng.randrange(1, len(name) - 2)
+        return name[:i] + name[i + 1] + name[i] + name[i + 2:]
+    
+    def _company(self) -> str:
+        rng = self.rng
+        roll = rng.random()
+        if roll >= TIER_1_SHARE + TIER_2_SHARE:
+            return self._off_list_company()
+        
+        name = rng.choice(self.tier_1 if roll < TIER_1_SHARE else self.tier_2)
+        roll = rng.random()
+        if roll < ALIAS_SHARE and name in self.aliases:
+            name = rng.choice(self.aliases[name])
+        elif roll < ALIAS_SHARE + TYPO_SHARE:
+            name = self._typo(name)
+        
+        display = name.title() if len(name) > 4 else name.upper()
+        return f"{display} {rng.choice(LEGAL_SUFFIXES)}".strip()
+    
+    def _location(self) -> str:
+        rng = self.rng
+        if rng.random() < OFF_LIST_LOCATION_SHARE:
+            return rng.choice(OFF_LIST_LOCATIONS)
+        return rng.choice(self.locations)
+    
+    def _description(self, title: str, company: str, location: str) -> str:
+        rng = self.rng
+        domain = rng.choice(DOMAINS) or "analytics"
+        sentences = []
+        for sentence in rng.sample(SENTENCES, rng.randint(2, 5)):
+            s1, s2, s3 = rng.sample(self.skills, 3)
+            sentences.append(sentence.format(s1=s1, s2=s2, s3=s3, domain=domain))
+        return f"{company} is hiring a {title} in {location}. " + " ".join(sentences)
+    
+    def _link(self, source: str, title: str, company: str, location: str) -> str:
+        number = self.seed * 100_000_000 + self.count
+        slug = "-".join("".join(ch if ch.isalnum() else " " for ch in title.lower()).split())
+        company_slug = "-".join("".join(ch if ch.isalnum() else " " for ch in company.lower()).split())
+        city = location.split(",")[0].lower().replace(" ", "-")
+        
+        if source == "LinkedIn":
+            return f"https://in.linkedin.com/jobs/view/{slug}-at-{company_slug}-{3_000_000_000 + number}"
+        if source == "Indeed":
+            return f"https://in.indeed.com/viewjob?jk={number:016x}&from=rss"
+        if source == "Internshala":
+            return f"https://internshala.com/internship/detail/{slug}-internship-in-{city}-at-{company_slug}{1_700_000_000 + number}"
+        if source == "Naukri":
+            return f"https://www.naukri.com/job-listings-{slug}-{company_slug}-{city}-0-to-1-years-{100_000_000_000 + number}"
+        return f"https://www.instahyre.com/job-{200_000 + number}-{slug}-at-{company_slug}/"
+    
+    # ---------- jobs ----------
+    
+    def job(self) -> dict:
+        """Next synthetic job"""
+        rng = self.rng
+        source = rng.choices(self.sources, self.source_weights)[0]
+        
+        if self.recent and rng.random() < REPOST_SHARE:
+            # Re-post: same advert under a new link
+            title, company, location, description, stipend = rng.choice(self.recent)
+        else:
+            title = self._title()
+            company = self._company()
+            location = self._location()
+            description = self._description(title, company, location)
+            stipend = rng.choice(STIPENDS)
+            self.recent.append((title, company, location, description, stipend))
+            if len(self.recent) > REPOST_WINDOW:
+                self.recent.pop(0)
+        
+        job = {
+            "title": title,
+            "link": self._link(source, title, company, location),
+            "source": source,
+            "description": description,
+            "location": location,
+            "stipend": stipend,
+            "company": company
+        }
+        if source == "LinkedIn":
+            job["easy_apply"] = rng.random() < 0.3
+        
+        self.count += 1
+        return job
+    
+    def jobs(self, n: int) -> List[dict]:
+        """The next n jobs as one list"""
+        return [self.job() for _ in range(n)]
+    
+    def batches(self, n: int, batch_size: int = 500) -> Iterator[List[dict]]:
+        """
+        The next n jobs as batches, like fetched pages for run_pipeline.
+        
+        Args:
+            n: Total jobs
+            batch_size: Jobs per batch
+        """
+        remaining = n
+        while remaining > 0:
+            size = min(batch_size, remaining)
+            yield self.jobs(size)
+            remaining -= size
+
+
+def generate_jobs(n: int, seed: int = 0) -> List[dict]:
+    """n synthetic jobs from a fresh generator"""
+    return SyntheticJobGenerator(seed).jobs(n)
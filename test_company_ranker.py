@@ -9,7 +9,8 @@ from company_ranker import (
     get_company_info,
     add_company_scores_to_jobs,
     calculate_final_rank,
-    should_send_telegram_alert
+    should_send_telegram_alert,
+    resolve_company
 )
 
 # ============================================
@@ -95,6 +96,46 @@ for job in test_jobs:
     print(f"  Final Rank: {job['final_rank_score']}")
     print(f"  Send Telegram: {'✅ YES' if should_send_telegram_alert(job) else '❌ NO'}")
 
+print("\n" + "="*70)
+print("WORD-BOUNDARY & ALIAS TEST")
+print("="*70)
+
+# Short listed names must not match inside other words, and a shared
+# first word is not enough to open a longer listed name
+lookalikes = ["Money View", "Coca Cola", "Kitchen Co", "Sapient", "Tiger Global", "Tiger"]
+for company in lookalikes:
+    tier, _ = get_company_tier(company)
+    print(f"\n{company}: Tier {tier} {'✅' if tier == 3 else '❌'}")
+
+# Aliases and the longest listed name win
+expected = {
+    "Ernst & Young LLP": "ey",
+    "J.P. Morgan": "jp morgan",
+    "Bajaj Finserv Ltd": "bajaj finserv",
+    "Wow Skin": "wow skin science",
+}
+for company, canonical in expected.items():
+    match = resolve_company(company)
+    print(f"\n{company} -> {match} {'✅' if match and match[0] == canonical else '❌'}")
+
+print("\n" + "="*70)
+print("FUZZY RESOLVER TEST")
+print("="*70)
+
+# Spacing variants and small typos resolve with a confidence
+fuzzy_expected = {
+    "Goldmansachs": "goldman sachs",
+    "Make My Trip": "makemytrip",
+    "Acenture Solutions": "accenture",
+    "Infosis BPM": "infosys",
+    "Twiggy": None,        # one edit on a short name is too risky
+    "Random Company": None,
+}
+for company, canonical in fuzzy_expected.items():
+    match = resolve_company(company)
+    ok = (match[0] if match else None) == canonical
+    print(f"\n{company} -> {match} {'✅' if ok else '❌'}")
+
 print("\n" + "="*70)
 print("TEST COMPLETE")
 print("="*70)
@@ -0,0 +1,69 @@
+"""
+Test Fixture Server
+Verify portal URLs map to the saved pages and replay through the fetchers
+"""
+
+import os
+
+# Replays must not touch the real page cache or high-water marks
+os.environ.setdefault("PAGE_CACHE", "0")
+os.environ.setdefault("INCREMENTAL", "0")
+
+import http_client
+import job_agent
+from fixture_server import FixtureServer, fixture_page, fixture_path
+from page_parsers import parse_page
+
+print("="*70)
+print("URL MAPPING TEST")
+print("="*70)
+
+expected_pages = {
+    "https://in.indeed.com/rss?q=data+analyst+intern&l=India": ("indeed", 1, "xml"),
+    "https://in.indeed.com/rss?q=data+analyst+intern&l=India&fromage=2&start=10": ("indeed", 2, "xml"),
+    "https://internshala.com/internships/data-analyst-internship/page-3/": ("internshala", 3, "html"),
+    "https://www.linkedin.com/jobs/search/?keywords=x&location=India&start=25": ("linkedin", 2, "html"),
+    "https://www.naukri.com/data-analyst-intern-jobs-2?jobAge=1": ("naukri", 2, "html"),
+    "https://www.instahyre.com/search-jobs/?q=data%20analyst&experience=0-1": ("instahyre", 1, "html"),
+    "https://api.telegram.org/botTOKEN/sendMessage": None,
+}
+for url, expected in expected_pages.items():
+    page = fixture_page(url)
+    print(f"\n{url[:60]} -> {page} {'✅' if page == expected else '❌'}")
+
+print("\n" + "="*70)
+print("REPLAY TEST")
+print("="*70)
+
+# First listing page of each source
+first_pages = {
+    "Indeed": "https://in.indeed.com/rss",
+    "Internshala": "https://internshala.com/internships/",
+    "LinkedIn": "https://www.linkedin.com/jobs/search/",
+    "Naukri": "https://www.naukri.com/jobs",
+    "Instahyre": "https://www.instahyre.com/search-jobs/",
+}
+
+with FixtureServer() as server:
+    for name, fetch, queries, max_pages in job_agent.JOB_SOURCES:
+        with open(fixture_path(*fixture_page(first_pages[name])), 'rb') as f:
+            body = f.read()
+        markup = body if name == "Indeed" else body.decode("utf-8")
+        
+        replayed = fetch(queries[0], 0)
+        ok = replayed == parse_page(name, markup) and len(replayed) > 0
+        print(f"\n{name}: {len(replayed)} jobs replayed {'✅' if ok else '❌'}")
+        
+        # Past the saved pages the listing is empty, which ends pagination
+        pages = [page for page, _ in job_agent._paginate(fetch, queries[0], max_pages)]
+        print(f"   Pages fetched: {len(pages)}")
+    
+    print(f"\nRequests served locally: {server.requests_served}")
+    
+    # Anything that is not a portal listing never leaves the machine
+    response = http_client.http_get("https://api.telegram.org/botTOKEN/sendMessage", retries=0)
+    print(f"Other hosts: HTTP {response.status_code} {'✅' if response.status_code == 404 else '❌'}")
+
+print("\n" + "="*70)
+print("TEST COMPLETE")
+print("="*70)
@@ -0,0 +1,125 @@
+"""
+Test History Store
+Verify O(1) membership, FIFO eviction, expiry, the journal and job keys
+"""
+
+import json
+import os
+import tempfile
+import time
+
+from history_store import HistoryJournal, SeenStore
+from job_keys import canonical_job_key
+
+print("="*70)
+print("HISTORY STORE TEST")
+print("="*70)
+
+# Eviction: only the newest max_links survive
+store = SeenStore(max_links=3)
+for link in ["a", "b", "c", "d"]:
+    store.add(link)
+
+print(f"\nAfter adding a, b, c, d with max_links=3:")
+print(f"  Stored: {list(store)}")
+print(f"  'a' evicted: {'✅ YES' if 'a' not in store else '❌ NO'}")
+print(f"  'd' present: {'✅ YES' if 'd' in store else '❌ NO'}")
+
+# Expiry: links older than the TTL are forgotten
+now = time.time()
+store = SeenStore(ttl_days=1)
+store.add("old", now - 2 * 86400)
+store.add("fresh", now)
+
+print(f"\nWith ttl_days=1:")
+print(f"  'old' treated as new: {'✅ YES' if 'old' not in store else '❌ NO'}")
+print(f"  Expired on cleanup: {store.expire()} link(s)")
+print(f"  Remaining: {list(store)}")
+
+# Round trip through the JSON lists
+links, seen_at = SeenStore.from_lists(["x", "y"], [1, 2]).to_lists()
+print(f"\nRound trip: {links} {seen_at}")
+
+# Journal: appends only the delta and survives a torn last line
+print("\n" + "="*70)
+print("JOURNAL TEST")
+print("="*70)
+
+with tempfile.TemporaryDirectory() as tmp:
+    path = os.path.join(tmp, "history.jsonl")
+    journal = HistoryJournal(path)
+    
+    store = SeenStore()
+    store.add("https://example.com/job/1")
+    journal.append(store.pop_new(), "2026-02-13T09:00:00")
+    
+    store.add("https://example.com/job/2")
+    journal.append(store.pop_new(), "2026-02-13T12:00:00")
+    
+    # Simulate a crash mid-write
+    with open(path, 'a', encoding='utf-8') as f:
+        f.write('{"link": "https://exa')
+    
+    reloaded = SeenStore()
+    last_updated = HistoryJournal(path).load(reloaded)
+    
+    print(f"\nReloaded links: {list(reloaded)}")
+    print(f"Last updated: {last_updated}")
+    print(f"Torn line ignored: {'✅ YES' if len(reloaded) == 2 else '❌ NO'}")
+    
+    journal.compact(reloaded, last_updated)
+    with open(path, encoding='utf-8') as f:
+        print(f"Lines after compaction: {len(f.readlines())}")
+
+# Canonical keys: re-posts and tracking parameters collapse to one key
+print("\n" + "="*70)
+print("CANONICAL KEY TEST")
+print("="*70)
+
+key_pairs = [
+    ("https://in.linkedin.com/jobs/view/data-analyst-intern-at-argo-intern-4423212062",
+     "https://in.linkedin.com/jobs/view/data-analyst-intern-at-argo-intern-4424091558?trk=feed"),
+    ("https://internshala.com/internship/detail/data-analytics-internship-in-mumbai-at-acme1780375614",
+     "https://internshala.com/internship/detail/data-analytics-internship-in-mumbai-at-acme1781111111"),
+    ("https://in.indeed.com/viewjob?jk=8a1b2c3d&from=rss",
+     "https://in.indeed.com/rc/clk?jk=8a1b2c3d&vjs=3"),
+]
+
+for first, second in key_pairs:
+    key = canonical_job_key(first)
+    same = key == canonical_job_key(second)
+    print(f"\n{key}")
+    print(f"  Re-post collapses: {'✅ YES' if same else '❌ NO'}")
+
+print("\n" + "="*70)
+print("LEGACY MIGRATION TEST")
+print("="*70)
+
+import job_agent
+
+with tempfile.TemporaryDirectory() as tmp:
+    cwd = os.getcwd()
+    os.chdir(tmp)
+    try:
+        with open(job_agent.LEGACY_HISTORY_FILE, 'w', encoding='utf-8') as f:
+            json.dump({"sent_links": ["https://www.linkedin.com/jobs/view/123"],
+                       "last_updated": "2026-01-01T09:00:00"}, f)
+        
+        # A run that keeps no job never calls save_history()
+        history = job_agent.load_history()
+        migrated = os.path.exists(job_agent.HISTORY_FILE)
+        removed = not os.path.exists(job_agent.LEGACY_HISTORY_FILE)
+        reloaded = job_agent.load_history()
+    finally:
+        os.chdir(cwd)
+    
+    print(f"\n  Journal written on load: {'✅ YES' if migrated else '❌ NO'}")
+    print(f"  Legacy file removed: {'✅ YES' if removed else '❌ NO'}")
+    same = (len(reloaded["sent_links"]) == 1
+            and reloaded["last_updated"] == "2026-01-01T09:00:00"
+            and not job_agent.is_new_job("https://www.linkedin.com/jobs/view/123?ref=x", reloaded))
+    print(f"  History survives the migration: {'✅ YES' if same else '❌ NO'}")
+
+print("\n" + "="*70)
+print("TEST COMPLETE")
+print("="*70)
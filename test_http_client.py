@@ -0,0 +1,85 @@
+"""
+Test HTTP Client
+Verify that GETs are retried on 5xx while a POST is only retried when
+the server turned it away or it was never sent
+"""
+
+import socket
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import requests
+
+import http_client
+
+http_client.BACKOFF_BASE = 0.01
+
+
+class Handler(BaseHTTPRequestHandler):
+    """Answers every request with the status in its path, e.g. /502"""
+    
+    hits = 0
+    
+    def _answer(self):
+        Handler.hits += 1
+        length = int(self.headers.get("Content-Length") or 0)
+        self.rfile.read(length)
+        self.send_response(int(self.path.strip("/")))
+        self.send_header("Content-Length", "0")
+        if self.path == "/429":
+            self.send_header("Retry-After", "0")
+        self.end_headers()
+    
+    do_GET = do_POST = _answer
+    
+    def log_message(self, *args):
+        pass
+
+
+server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+threading.Thread(target=server.serve_forever, daemon=True).start()
+base = f"http://127.0.0.1:{server.server_address[1]}"
+
+
+def attempts(method, status):
+    Handler.hits = 0
+    http_client.http_request(method, f"{base}/{status}", retries=2, polite=False)
+    return Handler.hits
+
+
+print("="*70)
+print("RETRY POLICY TEST")
+print("="*70)
+
+cases = [
+    ("GET", 502, 3),
+    ("GET", 429, 3),
+    ("POST", 502, 1),   # the server may have acted on it
+    ("POST", 504, 1),
+    ("POST", 429, 3),   # turned away, safe to send again
+]
+for method, status, expected in cases:
+    sent = attempts(method, status)
+    print(f"\n{method} -> HTTP {status}: sent {sent}x {'✅' if sent == expected else '❌'}")
+
+# Nothing listens on a just-closed port: the connection fails before sending
+with socket.socket() as probe:
+    probe.bind(("127.0.0.1", 0))
+    closed_port = probe.getsockname()[1]
+
+retried = []
+original = http_client._backoff_delay
+http_client._backoff_delay = lambda attempt: retried.append(attempt) or 0.0
+try:
+    http_client.http_post(f"http://127.0.0.1:{closed_port}/", retries=2, polite=False, timeout=2)
+except requests.ConnectionError:
+    pass
+finally:
+    http_client._backoff_delay = original
+print(f"\nPOST, connection refused: retried {len(retried)}x {'✅' if len(retried) == 2 else '❌'}")
+
+server.shutdown()
+
+print("\n" + "="*70)
+print("TEST COMPLETE")
+print("="*70)
@@ -0,0 +1,54 @@
+"""
+Test Import Time
+Verify that heavy modules stay out of `import job_agent` and are loaded
+when first used
+"""
+
+import sys
+
+from check_import_time import DEFERRED_MODULES, check, measure, parse_importtime
+
+print("="*70)
+print("IMPORTTIME PARSER TEST")
+print("="*70)
+
+sample = """import time: self [us] | cumulative | imported package
+import time:       300 |        300 |     certifi
+import time:       900 |       1200 | site
+import time:       500 |        500 |   lxml.etree
+import time:       100 |        600 | job_agent
+"""
+parsed = parse_importtime(sample)
+ok = parsed == {"lxml.etree": (500, 500), "job_agent": (100, 600)}
+print(f"Keeps job_agent and its imports only: {sorted(parsed)} {'✅' if ok else '❌'}")
+print(f"Over budget reported: {'✅' if check(parsed, budget_ms=0.5) else '❌'}")
+print(f"Deferred module reported: {'✅' if check({**parsed, 'numpy': (1, 1)}) else '❌'}")
+
+print("\n" + "="*70)
+print("STARTUP TEST")
+print("="*70)
+
+modules = measure()
+early = [name for name in DEFERRED_MODULES if name in modules]
+print(f"\nimport job_agent: {modules['job_agent'][1] / 1000:.1f} ms")
+print(f"Deferred modules not imported at startup: {early or 'none'} {'✅' if not early else '❌'}")
+
+print("\n" + "="*70)
+print("FIRST USE TEST")
+print("="*70)
+
+import job_agent
+from scoring_profile import CompiledProfile, load_profile_config
+
+job_agent.load_scorers()
+print(f"\nScorers load on demand: {'✅' if 'ai_matcher' in sys.modules else '❌'}")
+
+profile = CompiledProfile(load_profile_config(None))
+deferred = profile._ai_matcher is None
+print(f"AIJobMatcher not built with the profile: {'✅' if deferred else '❌'}")
+built = profile.ai_matcher is not None and profile.ai_matcher is profile.ai_matcher
+print(f"AIJobMatcher built once on first use: {'✅' if built else '❌'}")
+
+print("\n" + "="*70)
+print("TEST COMPLETE")
+print("="*70)
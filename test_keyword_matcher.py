@@ -0,0 +1,59 @@
+"""
+Test Keyword Matcher
+Verify category hits and single-pass skill extraction with synonyms
+"""
+
+from keyword_matcher import KeywordMatcher, SkillExtractor
+
+print("="*70)
+print("KEYWORD MATCHER TEST")
+print("="*70)
+
+matcher = KeywordMatcher({
+    "entry": ["intern", "internship", "fresher"],
+    "location": ["pune", "remote"],
+    "unpaid": ["unpaid"],
+})
+
+text = "Data Analytics Internship - Remote (Paid)".lower()
+hits = {category for category in matcher.categories if matcher.matches(category, text)}
+print(f"\nText: {text}")
+print(f"  Categories: {sorted(hits)}")
+print(f"  Entry + location, not unpaid: {'✅ YES' if hits == {'entry', 'location'} else '❌ NO'}")
+
+print("\n" + "="*70)
+print("SKILL EXTRACTOR TEST")
+print("="*70)
+
+extractor = SkillExtractor({
+    "sql": [],
+    "power bi": ["powerbi"],
+    "machine learning": ["ml"],
+    "mysql": [],
+})
+
+test_texts = [
+    ("Build PowerBI dashboards with SQL", ["sql", "power bi"]),
+    ("Power  BI and ML for reporting", ["power bi", "machine learning"]),
+    ("MySQL administration (HTML a plus)", ["mysql"]),
+]
+
+for text, expected in test_texts:
+    skills = extractor.extract(text)
+    print(f"\n{text}")
+    print(f"  Skills: {skills}")
+    print(f"  As expected: {'✅ YES' if skills == expected else '❌ NO'}")
+
+print(f"\nCanonical 'PowerBI': {extractor.canonical('PowerBI')}")
+
+# One scan over the forms of several extractors gives each one's own skills
+other = SkillExtractor({"bi": [], "ml": ["machine learning"], "sql server": []})
+combined = SkillExtractor.combine([extractor, other])
+for text, _ in test_texts:
+    forms = combined.find_forms(text)
+    same = (extractor.skills_for_forms(forms), other.skills_for_forms(forms)) == (extractor.extract(text), other.extract(text))
+    print(f"Combined scan of '{text}': {'✅ YES' if same else '❌ NO'}")
+
+print("\n" + "="*70)
+print("TEST COMPLETE")
+print("="*70)
@@ -0,0 +1,88 @@
+"""
+Test Metrics
+Verify spans, counters and the JSON-lines / Prometheus run records
+"""
+
+import os
+
+# Replays must not touch the real page cache or high-water marks
+os.environ.setdefault("PAGE_CACHE", "0")
+os.environ.setdefault("INCREMENTAL", "0")
+
+import json
+import tempfile
+import threading
+import time
+
+import job_agent
+from fixture_server import FixtureServer
+from metrics import metrics, prometheus_text, write_jsonl, write_prometheus
+
+print("="*70)
+print("SPAN & COUNTER TEST")
+print("="*70)
+
+metrics.reset()
+with metrics.span("sleep"):
+    time.sleep(0.05)
+try:
+    with metrics.span("fails"):
+        raise ValueError("boom")
+except ValueError:
+    pass
+
+def worker():
+    for _ in range(1000):
+        metrics.incr("ticks")
+
+threads = [threading.Thread(target=worker) for _ in range(4)]
+for thread in threads:
+    thread.start()
+for thread in threads:
+    thread.join()
+
+print(f"\nSpan timed: {metrics.seconds('sleep'):.3f}s {'✅' if metrics.seconds('sleep') >= 0.05 else '❌'}")
+print(f"Span recorded on error: {'✅' if metrics.span_calls['fails'] == 1 else '❌'}")
+print(f"Counter across threads: {metrics.counters['ticks']} {'✅' if metrics.counters['ticks'] == 4000 else '❌'}")
+
+print("\n" + "="*70)
+print("REPLAY TEST")
+print("="*70)
+
+metrics.reset()
+with FixtureServer():
+    for name, fetch, queries, _ in job_agent.JOB_SOURCES:
+        fetch(queries[0], 0)
+
+record = metrics.record(status="ok")
+for name, *_ in job_agent.JOB_SOURCES:
+    spans = record["spans"]
+    ok = spans[f"fetch.{name}"]["calls"] == 1 and spans[f"parse.{name}"]["calls"] == 1
+    print(f"\n{name}: fetch {spans[f'fetch.{name}']['seconds'] * 1000:.1f} ms, "
+          f"parse {spans[f'parse.{name}']['seconds'] * 1000:.1f} ms {'✅' if ok else '❌'}")
+print(f"\nHTTP requests counted: {record['counters'].get('http.requests')} "
+      f"{'✅' if record['counters'].get('http.requests') == len(job_agent.JOB_SOURCES) else '❌'}")
+
+print("\n" + "="*70)
+print("OUTPUT TEST")
+print("="*70)
+
+with tempfile.TemporaryDirectory() as tmp:
+    jsonl_path = os.path.join(tmp, "run_metrics.jsonl")
+    write_jsonl(record, jsonl_path)
+    write_jsonl(record, jsonl_path)
+    with open(jsonl_path, 'r', encoding='utf-8') as f:
+        lines = [json.loads(line) for line in f]
+    print(f"\nOne JSON line per run: {len(lines)} {'✅' if lines == [record, record] else '❌'}")
+    
+    prom_path = os.path.join(tmp, "job_agent.prom")
+    write_prometheus(record, prom_path)
+    with open(prom_path, 'r', encoding='utf-8') as f:
+        text = f.read()
+    ok = text == prometheus_text(record) and 'job_agent_span_seconds{span="parse.LinkedIn"}' in text
+    print(f"Prometheus textfile: {len(text.splitlines())} lines {'✅' if ok else '❌'}")
+    print(f"No temp file left: {'✅' if not os.path.exists(prom_path + '.tmp') else '❌'}")
+
+print("\n" + "="*70)
+print("TEST COMPLETE")
+print("="*70)
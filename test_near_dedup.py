@@ -0,0 +1,94 @@
+"""
+Test Near-Duplicate Detection
+Verify re-worded adverts collapse while different roles survive
+"""
+
+import os
+import tempfile
+
+from job_agent import dedupe_jobs
+from near_dedup import NearDuplicateIndex, dedupe_group, containment, jaccard, job_features
+
+print("="*70)
+print("NEAR-DUPLICATE TEST")
+print("="*70)
+
+test_pairs = [
+    # Same advert, re-worded - should be duplicates
+    ({"title": "Data Analyst Intern (Excel, SQL, Power BI)", "company": "Argo", "location": "Pune"},
+     {"title": "Data Analyst Intern - Excel SQL Power BI - Remove Fresher Tag", "company": "Argo", "location": "Pune"}),
+    ({"title": "Business Analyst Intern - 6 Months", "company": "TravClan"},
+     {"title": "Business Analyst Intern - 6 Months (PPO)", "company": "TravClan"}),
+    
+    # Different roles or companies - should be kept
+    ({"title": "Data Analyst Intern (Excel, SQL, Power BI)", "company": "Argo", "location": "Pune"},
+     {"title": "Business Analyst Intern (Excel, SQL, Power BI)", "company": "Argo", "location": "Pune"}),
+    ({"title": "Data Analyst Intern", "company": "Argo", "location": "Pune"},
+     {"title": "Data Analyst Intern", "company": "Globex", "location": "Mumbai"}),
+]
+
+for first, second in test_pairs:
+    index = NearDuplicateIndex()
+    index.add(job_features(first), dedupe_group(first), "first")
+    match = index.find(job_features(second), dedupe_group(second))
+    
+    a, b = job_features(first), job_features(second)
+    print(f"\n{first['title']} @ {first['company']}")
+    print(f"{second['title']} @ {second['company']}")
+    print(f"  Jaccard: {jaccard(a, b):.2f}  Containment: {containment(a, b):.2f}")
+    print(f"  Duplicate: {'✅ YES' if match is not None else '❌ NO'}")
+
+print("\n" + "="*70)
+print("COMPANY-LESS TEST")
+print("="*70)
+
+# Portals that leave the company out are compared by source + location,
+# and only a close rewording counts
+repost = {"title": "Data Analyst Intern - Excel, SQL, Power BI", "source": "Indeed", "location": "Pune"}
+companyless_cases = [
+    ("Reworded repost", {"title": "Data Analyst Intern (Excel SQL Power BI) Urgent", "source": "Indeed", "location": "Pune"}, True),
+    ("Same title, another city", {"title": "Data Analyst Intern - Excel, SQL, Power BI", "source": "Indeed", "location": "Mumbai"}, False),
+    ("Same title, another portal", {"title": "Data Analyst Intern - Excel, SQL, Power BI", "source": "Naukri", "location": "Pune"}, False),
+    ("Looser rewording", {"title": "Data Analyst Intern - SQL", "source": "Indeed", "location": "Pune"}, False),
+]
+for label, other, expected in companyless_cases:
+    index = NearDuplicateIndex()
+    index.add(job_features(repost), dedupe_group(repost), "first")
+    match = index.find(job_features(other), dedupe_group(other)) is not None
+    a, b = job_features(repost), job_features(other)
+    print(f"\n{label}: {other['title']} ({other['source']}, {other['location']})")
+    print(f"  Jaccard: {jaccard(a, b):.2f}  Duplicate: {match} {'✅' if match == expected else '❌'}")
+
+print(f"\nNo company, source or location: not compared {'✅' if dedupe_group({'title': 'Data Analyst'}) is None else '❌'}")
+
+print("\n" + "="*70)
+print("CROSS-RUN TEST")
+print("="*70)
+
+with tempfile.TemporaryDirectory() as tmp:
+    path = os.path.join(tmp, "near_dup_index.json")
+    
+    # Run 1: a company-less portal job and a LinkedIn job
+    index = NearDuplicateIndex()
+    dedupe_jobs([
+        {"title": "Data Analyst Intern - Excel, SQL, Power BI", "source": "Indeed", "location": "Pune", "job_key": "indeed:a"},
+        {"title": "Business Analyst Intern - 6 Months", "company": "TravClan", "job_key": "linkedin:b"},
+    ], index)
+    index.save(path)
+    
+    # Run 2: a generic title at another company, and re-posts of both jobs
+    index = NearDuplicateIndex.load(path)
+    kept = dedupe_jobs([
+        {"title": "Data Analyst Intern", "company": "Google", "source": "LinkedIn", "location": "Pune", "job_key": "linkedin:c"},
+        {"title": "Data Analyst Intern (Excel SQL Power BI) Urgent", "source": "Indeed", "location": "Pune", "job_key": "indeed:d"},
+        {"title": "Business Analyst Intern - 6 Months (PPO)", "company": "TravClan", "job_key": "linkedin:e"},
+    ], index)
+    keys = [job["job_key"] for job in kept]
+    
+    print(f"\nSame title at another company kept: {'✅' if 'linkedin:c' in keys else '❌'}")
+    print(f"Company-less re-post dropped: {'✅' if 'indeed:d' not in keys else '❌'}")
+    print(f"Re-post from the same company dropped: {'✅' if 'linkedin:e' not in keys else '❌'}")
+
+print("\n" + "="*70)
+print("TEST COMPLETE")
+print("="*70)
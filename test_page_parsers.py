@@ -0,0 +1,48 @@
+"""
+Test Page Parsers
+Verify the lxml parsers extract the same jobs as the BeautifulSoup ones
+"""
+
+from high_water import parse_posting_time
+from page_parsers import parse_page
+from bench_parsers import FIXTURE_PAGES, load_fixture
+
+print("="*70)
+print("FIXTURE PARITY TEST")
+print("="*70)
+
+since = parse_posting_time("2026-10-14")
+for source in FIXTURE_PAGES:
+    markup = load_fixture(source)
+    for cutoff in (None, since):
+        lxml_jobs = parse_page(source, markup, cutoff, backend="lxml")
+        soup_jobs = parse_page(source, markup, cutoff, backend="soup")
+        label = "since 2026-10-14" if cutoff else "full listing"
+        ok = lxml_jobs == soup_jobs and len(lxml_jobs) > 0
+        print(f"\n{source} ({label}): {len(lxml_jobs)} jobs {'✅' if ok else '❌'}")
+
+print("\n" + "="*70)
+print("MARKUP EDGE CASES")
+print("="*70)
+
+# get_text(strip=True) semantics: comments, scripts and entities
+edge_cases = [
+    ("LinkedIn", '<div class="base-card"><h3> Data <!-- x --> <b>Analyst</b><script>var a;</script></h3>'
+                 '<a class="base-card__full-link" href="https://in.linkedin.com/jobs/view/1?trk=x">Apply</a>'
+                 '<span>easy<i>Apply</i></span></div>'),
+    ("Instahyre", '<div class="Opportunity-Card"><!-- location hidden --><a href="/job/1">Analyst&nbsp;Intern</a></div>'),
+    ("Internshala", '<div class="ABC-internship"><a href="/internship/detail/1">Intern</a></div>'),
+    ("Naukri", '<article><a href="/relative">Skipped</a></article><article><a href="https://n.com/1">Kept</a></article>'),
+    ("Indeed", b'<rss><channel><item><title>A &amp; B</title><link>https://x</link>'
+               b'<description><![CDATA[<b>SQL</b>]]></description></item></channel></rss>'),
+    ("LinkedIn", ""),
+    ("Indeed", b"not a feed"),
+]
+for source, markup in edge_cases:
+    lxml_jobs = parse_page(source, markup, backend="lxml")
+    soup_jobs = parse_page(source, markup, backend="soup")
+    print(f"\n{source} {markup[:40]!r}...: {lxml_jobs[:1]} {'✅' if lxml_jobs == soup_jobs else '❌'}")
+
+print("\n" + "="*70)
+print("TEST COMPLETE")
+print("="*70)
@@ -0,0 +1,118 @@
+"""
+Test Profiling
+Verify the profiling switches, folded-stack output and per-function timing
+"""
+
+import cProfile
+import os
+import pstats
+import subprocess
+import sys
+import tempfile
+
+import company_ranker
+from metrics import metrics
+from profiling import (
+    SamplingProfiler, cprofile_folded, instrument_functions, parse_modes,
+    profile_run, profiling_modes
+)
+
+print("="*70)
+print("SWITCH TEST")
+print("="*70)
+
+switches = {
+    (): set(),
+    ("--profile",): {"cprofile"},
+    ("--profile=sample,functions",): {"sample", "functions"},
+    ("--verbose",): set(),
+}
+for argv, expected in switches.items():
+    modes = profiling_modes(list(argv))
+    print(f"\n{' '.join(argv) or '(none)'} -> {sorted(modes)} {'✅' if modes == expected else '❌'}")
+print(f"Unknown modes ignored: {'✅' if parse_modes('sample,flame') == {'sample'} else '❌'}")
+
+
+def leaf(n):
+    return sum(i * i for i in range(n))
+
+
+def busy(rounds):
+    return [leaf(20000) for _ in range(rounds)]
+
+
+print("\n" + "="*70)
+print("FOLDED STACK TEST")
+print("="*70)
+
+profiler = cProfile.Profile()
+profiler.enable()
+busy(20)
+profiler.disable()
+stacks = cprofile_folded(pstats.Stats(profiler))
+heaviest = stacks.most_common(1)[0][0]
+print(f"\ncProfile heaviest path: {heaviest}")
+print(f"Path runs busy -> leaf: {'✅' if 'test_profiling:busy;' in heaviest and 'test_profiling:leaf' in heaviest else '❌'}")
+
+sampler = SamplingProfiler(interval=0.001).start()
+busy(40)
+samples = sampler.stop()
+on_main = sum(count for stack, count in samples.items() if stack.startswith("MainThread;") and "test_profiling:leaf" in stack)
+print(f"Samples in leaf on the main thread: {on_main} {'✅' if on_main > 0 else '❌'}")
+
+# Each span's wrapper is its own function, so cProfile keeps them apart
+timed_a, timed_b = metrics.timed("test.a")(busy), metrics.timed("test.b")(busy)
+profiler = cProfile.Profile()
+profiler.enable()
+timed_a(5)
+timed_b(5)
+profiler.disable()
+stacks = cprofile_folded(pstats.Stats(profiler))
+apart = all(any(f"{wrapper};test_profiling:busy" in stack for stack in stacks)
+            for wrapper in ("timed_test_a", "timed_test_b"))
+print(f"Span wrappers profiled apart: {'✅' if apart else '❌'}")
+
+print("\n" + "="*70)
+print("FUNCTION TIMING TEST")
+print("="*70)
+
+original = company_ranker.get_company_tier
+metrics.reset()
+restore = instrument_functions([("company_ranker", "get_company_tier"), ("company_ranker", "no_such_function")])
+for name in ("TCS", "Infosys Ltd", "Acme Widgets"):
+    company_ranker.get_company_tier(name)
+restore()
+calls = metrics.span_calls["func.get_company_tier"]
+print(f"\nget_company_tier calls timed: {calls} {'✅' if calls == 3 else '❌'}")
+print(f"Original restored: {'✅' if company_ranker.get_company_tier is original else '❌'}")
+
+print("\n" + "="*70)
+print("RUN OUTPUT TEST")
+print("="*70)
+
+with tempfile.TemporaryDirectory() as tmp:
+    with profile_run({"cprofile", "sample"}, out_dir=tmp, label="test"):
+        busy(20)
+    files = sorted(name.split("-test")[1] for name in os.listdir(tmp))
+    print(f"\nFiles: {files} {'✅' if files == ['.cprofile.folded', '.prof', '.sample.folded', '.txt'] else '❌'}")
+    
+    with profile_run(set(), out_dir=os.path.join(tmp, "off")):
+        busy(1)
+    print(f"Nothing written when off: {'✅' if not os.path.exists(os.path.join(tmp, 'off')) else '❌'}")
+
+# Only "functions" mode imports the modules it times
+probe = (
+    "import sys, tempfile\n"
+    "from profiling import profile_run\n"
+    "with profile_run({'cprofile', 'sample'}, out_dir=tempfile.mkdtemp()):\n"
+    "    pass\n"
+    "print(any(m in sys.modules for m in ('ai_matcher', 'hybrid_scorer', 'company_ranker')))\n"
+)
+result = subprocess.run([sys.executable, "-c", probe], capture_output=True, text=True,
+                        cwd=os.path.dirname(os.path.abspath(__file__)))
+imported = result.stdout.strip().splitlines()[-1:] != ["False"]
+print(f"Scorers not imported without functions mode: {'✅' if not imported else '❌'}")
+
+print("\n" + "="*70)
+print("TEST COMPLETE")
+print("="*70)
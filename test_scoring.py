@@ -63,6 +63,46 @@ if AI_ENABLED and HYBRID_ENABLED:
     else:
         print("✅ SUCCESS: AI scoring is working correctly!")
     
+    # Columnar batch path must match per-job scoring exactly
+    batch_scores = matcher.score_many(test_jobs * 3)
+    single_scores = [matcher.score_job(j) for j in test_jobs * 3]
+    print(f"Batch scores match per-job scores: {'✅ YES' if batch_scores == single_scores else '❌ NO'}")
+    
+    # Several profiles scored in one pass must match scoring each on its own
+    from scoring_profile import CompiledProfile, ProfileSet, load_profile_config
+    from ai_matcher import add_ai_scores_for_profiles
+    from hybrid_scorer import add_hybrid_scores_for_profiles
+    
+    ml_config = load_profile_config(None)
+    ml_config["name"] = "ml-engineer"
+    ml_config["ai_matcher"]["high_priority_skills"] = ["machine learning", "python", "sql"]
+    ml_config["hybrid"]["user_skills"] = ["python", "machine learning"]
+    ml_config["delivery"]["csv_file"] = "jobs_ml.csv"
+    profiles = ProfileSet([CompiledProfile(load_profile_config(None)), CompiledProfile(ml_config)])
+    
+    multi_jobs = [{k: v for k, v in job.items() if k in ("title", "description", "location")} for job in test_jobs]
+    multi_jobs = add_hybrid_scores_for_profiles(add_ai_scores_for_profiles(multi_jobs, profiles), profiles)
+    
+    multi_match = True
+    for index, profile in enumerate(profiles):
+        single_jobs = [{k: v for k, v in job.items() if k in ("title", "description", "location")} for job in test_jobs]
+        for job in single_jobs:
+            job['ai_score'] = profile.ai_matcher.score_job(job)
+        single_jobs = add_hybrid_scores_to_jobs(single_jobs, profile)
+        for multi, single in zip(multi_jobs, single_jobs):
+            entry = multi['profile_scores'][index]
+            multi_match &= (entry['ai_score'], entry['hybrid_score']) == (single['ai_score'], single['hybrid_score'])
+    print(f"Multi-profile scores match per-profile scores: {'✅ YES' if multi_match else '❌ NO'}")
+    
+    # A profile rebuilt from its JSON snapshot must find the same skills and companies
+    import json
+    restored = CompiledProfile(ml_config, json.loads(json.dumps(profiles[1].to_data())))
+    text = "Python, PowerBI and ML with postgres at Googel India"
+    same = (restored.skill_extractor.extract(text) == profiles[1].skill_extractor.extract(text)
+            and restored.company_index.lookup("tcs limited") == profiles[1].company_index.lookup("tcs limited")
+            and restored.fuzzy_index.lookup("googel india") == profiles[1].fuzzy_index.lookup("googel india"))
+    print(f"Snapshot restores the compiled profile: {'✅ YES' if same else '❌ NO'}")
+    
     print("="*70)
 else:
     print("\n❌ Cannot test - imports failed")
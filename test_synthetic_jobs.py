@@ -0,0 +1,54 @@
+"""
+Test Synthetic Jobs
+Verify the generator is deterministic and its jobs run through the pipeline
+"""
+
+import os
+
+# Scores must come from the scorers, not a previous run's cache
+os.environ.setdefault("SCORE_CACHE", "0")
+
+from collections import Counter
+
+from job_keys import canonical_job_key
+from load_test import run_load
+from synthetic_jobs import SOURCE_WEIGHTS, SyntheticJobGenerator, generate_jobs
+
+print("="*70)
+print("DETERMINISM TEST")
+print("="*70)
+
+jobs = generate_jobs(2000, seed=3)
+print(f"\nSame seed, same jobs: {'✅' if generate_jobs(2000, seed=3) == jobs else '❌'}")
+print(f"Other seed, other jobs: {'✅' if generate_jobs(2000, seed=4) != jobs else '❌'}")
+
+batched = [job for batch in SyntheticJobGenerator(3).batches(2000, 300) for job in batch]
+print(f"Batches match one list: {'✅' if batched == jobs else '❌'}")
+
+print("\n" + "="*70)
+print("SHAPE TEST")
+print("="*70)
+
+sources = Counter(job["source"] for job in jobs)
+print(f"\nSources: {dict(sources)} {'✅' if set(sources) == set(SOURCE_WEIGHTS) else '❌'}")
+
+keys = {canonical_job_key(job["link"]) for job in jobs}
+print(f"Distinct job keys: {len(keys)}/{len(jobs)} {'✅' if len(keys) > 0.9 * len(jobs) else '❌'}")
+
+fields = all(job["title"] and job["company"] and job["location"] and job["description"] for job in jobs)
+print(f"Every job has title, company, location, description: {'✅' if fields else '❌'}")
+
+print("\n" + "="*70)
+print("LOAD TEST")
+print("="*70)
+
+result = run_load(3000, seed=3)
+counts = result["counts"]
+print(f"\n{result['jobs_per_sec']:,.0f} jobs/sec, collected {counts['collected']}, "
+      f"filtered {counts['filtered']}, deduped {counts['deduped']}")
+print(f"All stages timed: {'✅' if all(result['stage_seconds'].values()) else '❌'}")
+print(f"Filters dropped some jobs: {'✅' if 0 < counts['deduped'] < counts['filtered'] < counts['collected'] else '❌'}")
+
+print("\n" + "="*70)
+print("TEST COMPLETE")
+print("="*70)